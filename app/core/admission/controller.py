@@ -0,0 +1,185 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config.settings import settings
+
+class AdmissionRejected(Exception):
+    """
+    Requisição descartada pelo controle de admissão (fila cheia ou espera
+    acima do limite adaptativo). Respondida como 503 + Retry-After.
+    """
+
+    def __init__(self, message: str, retry_after: int = 1) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+class AdmissionController:
+    """
+    Controle de admissão por worker: até `max_concurrency` requisições em
+    andamento; as demais esperam numa fila FIFO limitada a `max_queue`.
+    O tempo máximo de espera é adaptativo, como o CoDel: com a fila saudável
+    (esvaziou há menos de `interval`), tolera até `interval`; se a fila não
+    esvazia há mais de `interval`, o worker está sobrecarregado e só tolera
+    `target`, descartando rápido o excesso em vez de acumular latência.
+    Também controla a drenagem no shutdown (readiness falha, em andamento
+    terminam). Usado só no event loop do worker, sem locks.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        target_ms: float,
+        interval_ms: float,
+        retry_after: int = 1,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._target = target_ms / 1000
+        self._interval = interval_ms / 1000
+        self._retry_after = retry_after
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_empty = time.monotonic()
+        self._draining = False
+        self._idle: Optional[asyncio.Event] = None
+        self._admitted = self._queued = self._dequeued = self._shed_queue_full = self._shed_timeout = 0
+        self._queue_seconds = self._max_queue_seconds = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return not self._draining
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _queue_timeout(self, now: float) -> float:
+        if now - self._last_empty > self._interval:
+            return self._target
+        return self._interval
+
+    async def acquire(self) -> float:
+        """
+        Reserva uma vaga e devolve o tempo de fila em segundos. Levanta
+        AdmissionRejected se a fila estiver cheia ou a espera estourar.
+        """
+        now = time.monotonic()
+        if self._in_flight < self._max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            self._last_empty = now
+            return 0.0
+        if len(self._waiters) >= self._max_queue:
+            self._shed_queue_full += 1
+            raise AdmissionRejected("Servidor sobrecarregado: fila de requisições cheia", retry_after=self._retry_after)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._queued += 1
+        try:
+            await asyncio.wait_for(future, self._queue_timeout(now))
+        except asyncio.TimeoutError:
+            self._shed_timeout += 1
+            self._remove_waiter(future)
+            raise AdmissionRejected(
+                "Servidor sobrecarregado: tempo de fila excedido", retry_after=self._retry_after
+            ) from None
+        except BaseException:
+            # Cliente desistiu: devolve a vaga se ela já tinha sido repassada
+            self._remove_waiter(future)
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        waited = time.monotonic() - now
+        self._admitted += 1
+        self._dequeued += 1
+        self._queue_seconds += waited
+        self._max_queue_seconds = max(self._max_queue_seconds, waited)
+        return waited
+
+    def enter(self) -> None:
+        """
+        Admissão desligada: só contabiliza a requisição (sem limite nem fila),
+        para que a drenagem saiba o que ainda está em andamento.
+        """
+        self._in_flight += 1
+        self._admitted += 1
+
+    def _remove_waiter(self, future: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+        if not self._waiters:
+            self._last_empty = time.monotonic()
+
+    def release(self) -> None:
+        # Repassa a vaga direto ao próximo da fila (in_flight não muda)
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                if not self._waiters:
+                    self._last_empty = time.monotonic()
+                return
+        self._in_flight -= 1
+        self._last_empty = time.monotonic()
+        if self._in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    def start(self) -> None:
+        # Startup do lifespan: volta a ficar pronto (ex.: app reiniciado no mesmo processo)
+        self._draining = False
+
+    def begin_drain(self) -> None:
+        """
+        Readiness passa a falhar; requisições continuam sendo atendidas.
+        """
+        self._draining = True
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Marca a drenagem e espera as requisições em andamento terminarem, até
+        `timeout`. Retorna False se ainda havia requisições ao estourar.
+        """
+        self.begin_drain()
+        if self._in_flight == 0:
+            return True
+        self._idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._idle = None
+
+    def stats(self) -> Dict[str, Any]:
+        dequeued = self._dequeued
+        return {
+            "ready": self.ready,
+            "in_flight": self._in_flight,
+            "queue_length": len(self._waiters),
+            "max_concurrency": self._max_concurrency,
+            "max_queue": self._max_queue,
+            "admitted_total": self._admitted,
+            "queued_total": self._queued,
+            "shed_total": self._shed_queue_full + self._shed_timeout,
+            "shed_queue_full_total": self._shed_queue_full,
+            "shed_timeout_total": self._shed_timeout,
+            "avg_queue_ms": round(self._queue_seconds / dequeued * 1000, 3) if dequeued else 0.0,
+            "max_queue_ms": round(self._max_queue_seconds * 1000, 3),
+            "overloaded": time.monotonic() - self._last_empty > self._interval and bool(self._waiters),
+        }
+
+admission_controller = AdmissionController(
+    max_concurrency=settings.admission_max_concurrency,
+    max_queue=settings.admission_max_queue,
+    target_ms=settings.admission_target_ms,
+    interval_ms=settings.admission_interval_ms,
+    retry_after=settings.pool_retry_after_seconds,
+)
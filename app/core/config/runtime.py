@@ -0,0 +1,162 @@
+import asyncio
+import os
+import re
+import signal
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.config.logging import get_logger
+from app.core.config.settings import Settings, settings
+
+logger = get_logger(__name__)
+
+# Blocos de cabeçalho pré-codificados (SecurityHeadersMiddleware)
+BASE_SECURITY_HEADERS: Tuple[Tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+)
+HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+
+_ORIGIN = re.compile(r"^https?://[^/\s]+$")
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """
+    Snapshot imutável do que as requisições consultam: conjuntos de chaves,
+    cabeçalhos já codificados e origens CORS. Montado e validado por
+    `compile`; trocado inteiro pelo RuntimeConfigStore.
+    """
+
+    version: int
+    api_keys: FrozenSet[str]
+    security_headers: Tuple[Tuple[bytes, bytes], ...]
+    security_header_names: FrozenSet[bytes]
+    cors_origins: Tuple[str, ...]
+    loaded_at: float
+
+    @property
+    def auth_enabled(self) -> bool:
+        return bool(self.api_keys)
+
+    @classmethod
+    def compile(cls, source: Settings, version: int = 1) -> "RuntimeConfig":
+        for key in source.api_keys:
+            if not key or key != key.strip():
+                raise ValueError("api_keys: chave vazia ou com espaços nas pontas")
+        for origin in source.cors_origins:
+            if origin != "*" and not _ORIGIN.match(origin):
+                raise ValueError(f"cors_origins: origem inválida {origin!r} (esperado esquema://host[:porta])")
+        headers = BASE_SECURITY_HEADERS + ((HSTS_HEADER,) if source.enable_hsts else ())
+        return cls(
+            version=version,
+            api_keys=frozenset(source.api_keys),
+            security_headers=headers,
+            security_header_names=frozenset(name for name, _ in headers),
+            cors_origins=tuple(source.cors_origins),
+            loaded_at=time.time(),
+        )
+
+class RuntimeConfigStore:
+    """
+    Referência única para o RuntimeConfig em vigor. O código de requisição
+    lê `current` uma vez; `reload` relê `runtime_config_file` (variáveis de
+    ambiente continuam com precedência), valida e só então troca o snapshot.
+    Configuração inválida é registrada no log e a anterior continua valendo.
+    Guarda o mtime/tamanho do arquivo lido por último, para que `refresh`
+    detecte mudanças feitas depois disso (inclusive entre o import no master
+    do gunicorn e o startup de cada worker).
+    """
+
+    def __init__(self, source: Settings = settings) -> None:
+        self.path = source.runtime_config_file
+        # Versão do arquivo que originou `source` (lido no import do app)
+        self._seen_stamp = self._stamp()
+        self.current = RuntimeConfig.compile(source)
+        self.reloads_total = 0
+        self.failures_total = 0
+
+    def reload(self) -> bool:
+        previous = self.current
+        self._seen_stamp = self._stamp()
+        try:
+            source = Settings(_env_file=self.path or None)
+            config = RuntimeConfig.compile(source, version=previous.version + 1)
+        except (ValidationError, ValueError, OSError) as exc:
+            # OSError: arquivo sem permissão de leitura, removido no meio da leitura etc.
+            self.failures_total += 1
+            logger.error("Configuração de %s rejeitada; mantendo a versão %d: %s", self.path, previous.version, exc)
+            return False
+        self.current = config
+        self.reloads_total += 1
+        logger.info("Configuração recarregada (versão %d, %d chaves de API)", config.version, len(config.api_keys))
+        return True
+
+    def stats(self) -> dict:
+        config = self.current
+        return {
+            "version": config.version,
+            "loaded_at": config.loaded_at,
+            "path": self.path,
+            "reloads_total": self.reloads_total,
+            "failures_total": self.failures_total,
+            "auth_enabled": config.auth_enabled,
+            "api_keys_count": len(config.api_keys),
+            "hsts_enabled": HSTS_HEADER in config.security_headers,
+            "cors_origins": list(config.cors_origins),
+        }
+
+    def install_signal_handler(self) -> bool:
+        """
+        Recarrega no SIGHUP pelo event loop (fora de um handler de sinal
+        síncrono). Só é possível na thread principal.
+        """
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload)
+        except (NotImplementedError, RuntimeError, ValueError, AttributeError):
+            return False
+        return True
+
+    def remove_signal_handler(self) -> None:
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (NotImplementedError, RuntimeError, ValueError, AttributeError):
+            pass
+
+    def _stamp(self) -> Optional[Tuple[int, int]]:
+        if not self.path:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> bool:
+        """
+        Recarrega só se o arquivo mudou desde a última leitura (a do snapshot
+        em vigor ou a de uma tentativa rejeitada). Retorna True se trocou.
+        """
+        if self._stamp() == self._seen_stamp:
+            return False
+        return self.reload()
+
+    async def watch(self, interval: float) -> None:
+        """
+        Verifica mtime/tamanho do arquivo a cada `interval` segundos e recarrega
+        quando mudam. Cada worker observa o mesmo arquivo, então uma edição
+        chega a todos. Erros inesperados são registrados e a verificação segue;
+        só o cancelamento (shutdown) encerra o loop.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Falha ao verificar %s; nova tentativa em %.1fs", self.path, interval)
+
+runtime_config = RuntimeConfigStore()
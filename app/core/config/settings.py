@@ -1,6 +1,6 @@
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 class Settings(BaseSettings):
     app_name: str = "Docs IDE API"
@@ -10,6 +10,53 @@ class Settings(BaseSettings):
     enable_hsts: bool = False  # true somente atrás de TLS
     api_keys: List[str] = []   # se vazio, autenticação desabilitada
     gzip_min_size: int = 500
+    sqlite_path: str = "app.db"  # adapters gerados com --backend sqlite
+    sqlite_cached_statements: int = 256
+    sqlite_async_pool_size: int = 8  # adapters gerados com --backend aiosqlite
+    sqlite_async_acquire_timeout: float = 2.0
+    sqlite_async_max_waiting: int = 64
+    pool_retry_after_seconds: int = 1
+    cache_maxsize: int = 1024  # CachingPort (cocli --cache)
+    cache_ttl_seconds: float = 30.0
+    cache_invalidation_dir: str = ""  # se vazio, invalidação apenas no próprio worker
+    profiling_enabled: bool = False  # desligado: middleware nem é instalado
+    profiling_sample_rate: float = 0.0  # fração de requisições perfiladas (0.0 a 1.0)
+    profiling_header: str = "X-Profile"  # força profiling (exige X-API-Key válida)
+    profiling_buffer_size: int = 50
+    idempotency_backend: str = "memory"  # "sqlite" compartilha o store entre workers
+    idempotency_sqlite_path: str = "idempotency.db"
+    idempotency_maxsize: int = 10000
+    idempotency_ttl_seconds: float = 86400.0  # por quanto tempo uma resposta é reaproveitada
+    idempotency_lock_timeout: float = 30.0  # reserva pendente abandonada (worker caiu)
+    idempotency_wait_timeout: float = 10.0  # espera de duplicatas concorrentes; depois 409
+    idempotency_poll_interval: float = 0.05
+    jobs_max_workers: int = 2  # processos do pool de jobs CPU-bound, por worker
+    jobs_max_pending: int = 64  # na fila + em execução; acima disso 503
+    jobs_max_records: int = 1000  # jobs assíncronos guardados para consulta de status
+    jobs_timeout_seconds: float = 30.0  # offload síncrono; estourou, 504
+    jobs_mp_context: str = "forkserver"  # evita fork de um worker com threads
+    server_profile: str = "standard"  # standard (uvicorn auto), strict (exige uvloop + httptools), http2 (hypercorn)
+    server_backlog: int = 2048  # conexões pendentes no listen()
+    server_limit_concurrency: int = 0  # conexões + tarefas por worker antes de 503 (0: sem limite)
+    server_keepalive: int = 5  # segundos de conexão ociosa mantida aberta
+    server_h11_max_incomplete_event_size: int = 16384  # bytes de cabeçalho aceitos pelo h11
+    server_h2_max_concurrent_streams: int = 100  # perfil http2: streams por conexão
+    server_graceful_timeout: int = 30  # shutdown: drenagem + fechamento dos resources (GUNICORN_GRACEFUL_TIMEOUT tem precedência)
+    server_drain_delay: float = 0.0  # shutdown: segundos com /ready em 503 antes de parar de aceitar conexões
+    admission_enabled: bool = False  # desligado: sem fila nem descarte (readiness e drenagem continuam)
+    admission_max_concurrency: int = 64  # requisições em andamento por worker; acima disso, fila
+    admission_max_queue: int = 256  # fila cheia: 503 imediato
+    admission_target_ms: float = 50.0  # espera tolerada quando a fila não esvazia há `interval`
+    admission_interval_ms: float = 500.0  # espera tolerada com a fila saudável
+    admission_exempt_paths: List[str] = ["/api/v1/health", "/api/v1/ready"]  # probes nunca são descartadas
+    body_max_bytes: int = 1048576  # corpo máximo por requisição (0: sem limite)
+    body_limit_routes: Dict[str, int] = {"/api/v1/*/bulk": 1073741824}  # glob do path -> bytes, sobrepõe body_max_bytes
+    bulk_chunk_size: int = 500  # itens validados entregues por vez ao use case nas rotas /bulk
+    bulk_max_item_bytes: int = 65536  # tamanho máximo de um item do array JSON/linha NDJSON
+    bulk_max_errors: int = 100  # itens inválidos detalhados na resposta (os demais só contam)
+    runtime_config_file: str = ".env"  # relido no SIGHUP ou ao mudar: api_keys, enable_hsts, cors_origins
+    runtime_config_poll_seconds: float = 2.0  # intervalo do watcher do arquivo (0: só SIGHUP)
+    openapi_file: str = ""  # schema gerado no build (`cocli openapi`); vazio: montado no boot
 
     model_config = {"env_file": ".env"}
 
@@ -2,6 +2,9 @@ from dependency_injector import containers, providers
 
 from app.infrastructure.health.adapters.health_check_adapter import HealthCheckAdapter
 from app.application.health.use_cases.check_health import CheckHealthUseCase
+from app.core.config.settings import settings
+from app.infrastructure.shared.idempotency_store import init_idempotency_store
+from app.infrastructure.shared.job_runner import init_job_runner
 
 
 
@@ -12,4 +15,8 @@ class Container(containers.DeclarativeContainer):
     )
 
     health_check_adapter = providers.Singleton(HealthCheckAdapter)
-    check_health_uc = providers.Singleton(CheckHealthUseCase, port=health_check_adapter)
\ No newline at end of file
+    check_health_uc = providers.Singleton(CheckHealthUseCase, port=health_check_adapter)
+    # Respostas de rotas @idempotent (memória por worker ou SQLite compartilhado)
+    idempotency_store = providers.Resource(init_idempotency_store, backend=settings.idempotency_backend, path=settings.idempotency_sqlite_path, maxsize=settings.idempotency_maxsize, ttl_seconds=settings.idempotency_ttl_seconds, lock_timeout=settings.idempotency_lock_timeout)
+    # Pool de processos para use cases CPU-bound (criado/encerrado no lifespan)
+    job_runner = providers.Resource(init_job_runner, max_workers=settings.jobs_max_workers, max_pending=settings.jobs_max_pending, max_records=settings.jobs_max_records, retry_after=settings.pool_retry_after_seconds, mp_context=settings.jobs_mp_context, default_timeout=settings.jobs_timeout_seconds)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.admission.controller import AdmissionController, AdmissionRejected, admission_controller
+from app.core.config.settings import settings
+from app.core.profiling.timings import request_timings_ctx_var
+
+class AdmissionControlMiddleware:
+    """
+    Passa cada requisição pelo AdmissionController: espera na fila quando o
+    worker está no limite de concorrência e responde 503 + Retry-After quando
+    ela é descartada. Paths em `admission_exempt_paths` (probes) não entram
+    na fila. O tempo de fila vira a fase `queue` quando há profiling.
+    Com `enforce=False` não há limite, fila nem descarte: só a contagem das
+    requisições em andamento usada pela drenagem do lifespan.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController = admission_controller,
+        enforce: bool = True,
+    ) -> None:
+        self.app = app
+        self.controller = controller
+        self.enforce = enforce
+        self.exempt_paths = frozenset(settings.admission_exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        if not self.enforce:
+            self.controller.enter()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.controller.release()
+            return
+        try:
+            waited = await self.controller.acquire()
+        except AdmissionRejected as exc:
+            # Mesmo envelope do HttpErrorResponse (a requisição nem chega ao app)
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"success": False, "error": "ServiceUnavailable", "message": exc.message},
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            timings = request_timings_ctx_var.get()
+            if timings is not None:
+                timings.add("queue", waited)
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
@@ -0,0 +1,98 @@
+from fnmatch import fnmatchcase
+from typing import Dict, List, Tuple
+
+from fastapi import HTTPException
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.settings import settings
+
+class BodyTooLargeError(HTTPException):
+    """
+    Corpo acima do limite da rota. HTTPException para que o FastAPI a
+    repasse (em vez de convertê-la em 400) quando estoura durante a leitura.
+    """
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Corpo da requisição excede {limit} bytes",
+        )
+        self.limit = limit
+
+def payload_too_large(error: BodyTooLargeError) -> JSONResponse:
+    # Mesmo envelope do HttpErrorResponse
+    return JSONResponse(
+        status_code=error.status_code,
+        content={"success": False, "error": "PayloadTooLarge", "message": error.detail},
+    )
+
+class BodyLimitMiddleware:
+    """
+    Limita o tamanho do corpo por rota sem bufferizar: Content-Length acima
+    do limite é recusado antes de ler qualquer byte; corpos chunked são
+    contados conforme chegam e a leitura é interrompida ao estourar.
+    Limites em `body_max_bytes` (padrão) e `body_limit_routes` (padrão glob
+    do path -> bytes, primeiro que casar; 0 desliga o limite da rota).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_limit: int = settings.body_max_bytes,
+        routes: Dict[str, int] = settings.body_limit_routes,
+    ) -> None:
+        self.app = app
+        self.default_limit = default_limit
+        self.routes: List[Tuple[str, int]] = list(routes.items())
+
+    def limit_for(self, path: str) -> int:
+        for pattern, limit in self.routes:
+            if fnmatchcase(path, pattern):
+                return limit
+        return self.default_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limit = self.limit_for(scope["path"])
+        if limit <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > limit:
+                    await payload_too_large(BodyTooLargeError(limit))(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise BodyTooLargeError(limit)
+            return message
+
+        response_started = False
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except BodyTooLargeError as error:
+            # Estourou fora de um handler; com a resposta já iniciada não há
+            # como trocar o status
+            if response_started:
+                raise
+            await payload_too_large(error)(scope, receive, send)
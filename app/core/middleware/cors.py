@@ -0,0 +1,27 @@
+from typing import Optional
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config.runtime import RuntimeConfig, RuntimeConfigStore, runtime_config
+
+class RuntimeCORSMiddleware:
+    """
+    CORSMiddleware com as origens do snapshot. As tabelas do Starlette
+    (origens, cabeçalhos simples e de preflight) são montadas uma vez por
+    versão do RuntimeConfig e reaproveitadas até a próxima troca.
+    """
+
+    def __init__(self, app: ASGIApp, store: RuntimeConfigStore = runtime_config, **options) -> None:
+        self.app = app
+        self.store = store
+        self.options = options
+        self._config: Optional[RuntimeConfig] = None
+        self._cors: Optional[CORSMiddleware] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        config = self.store.current
+        if config is not self._config:
+            self._cors = CORSMiddleware(self.app, allow_origins=config.cors_origins, **self.options)
+            self._config = config
+        await self._cors(scope, receive, send)
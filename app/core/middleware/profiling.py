@@ -0,0 +1,86 @@
+import random
+import time
+from typing import Optional
+from uuid import uuid4
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.runtime import runtime_config
+from app.core.config.settings import settings
+from app.core.profiling.store import ProfileRecord, ProfileStore, profile_store
+from app.core.profiling.timings import RequestTimings, request_timings_ctx_var
+
+class ProfilingMiddleware:
+    """
+    Perfila requisições selecionadas por amostragem (`profiling_sample_rate`,
+    apenas fases/Server-Timing) ou pelo header `profiling_header` acompanhado de
+    uma X-API-Key válida (fases + cProfile do endpoint).
+    Requisições não selecionadas seguem direto para o app. ASGI puro para não
+    pagar o custo do BaseHTTPMiddleware no caminho comum.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore = profile_store) -> None:
+        self.app = app
+        self.store = store
+        self.sample_rate = settings.profiling_sample_rate
+        self.header = settings.profiling_header.lower().encode("latin-1")
+
+    def _selected(self, scope: Scope) -> Optional[bool]:
+        """
+        None: não perfilar; True: perfilar com cProfile; False: só Server-Timing.
+        """
+        forced = False
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                forced = value not in (b"", b"0", b"false")
+            elif name == b"x-api-key":
+                api_key = value.decode("latin-1")
+        api_keys = runtime_config.current.api_keys
+        if forced and api_keys and api_key in api_keys:
+            return True
+        if self.sample_rate and random.random() < self.sample_rate:
+            return False
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profile = self._selected(scope)
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings(profile=profile)
+        token = request_timings_ctx_var.set(timings)
+        state = {"status": 0, "request_id": None, "total": 0.0}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - timings.started
+                route = timings.get("route")
+                if route is not None:
+                    timings.add("mw", max(total - route, 0.0))
+                timings.add("total", total)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.server_timing())
+                state.update(status=message["status"], request_id=headers.get("x-request-id"), total=total)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings_ctx_var.reset(token)
+            self.store.add(ProfileRecord(
+                id=uuid4().hex[:12],
+                method=scope["method"],
+                path=scope["path"],
+                status=state["status"],
+                request_id=state["request_id"],
+                started_at=time.time() - (time.perf_counter() - timings.started),
+                total_ms=round(state["total"] * 1000, 3),
+                phases={k: v for k, v in timings.as_ms().items() if k != "total"},
+                stats=timings.stats,
+            ))
@@ -1,16 +1,29 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from app.core.config.settings import settings
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config.runtime import RuntimeConfigStore, runtime_config
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
-        # Básicos para API
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "no-referrer"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        # HSTS (apenas se habilitado e sob TLS)
-        if settings.enable_hsts:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        return response
+class SecurityHeadersMiddleware:
+    """
+    Acrescenta o bloco de cabeçalhos de segurança já codificado no snapshot
+    (básicos para API + HSTS quando `enable_hsts`, apenas sob TLS). ASGI puro:
+    um acesso ao snapshot por requisição, sem montar MutableHeaders.
+    """
+
+    def __init__(self, app: ASGIApp, store: RuntimeConfigStore = runtime_config) -> None:
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        config = self.store.current
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Valores do snapshot substituem os que a rota tenha definido
+                headers = [h for h in message.get("headers", ()) if h[0] not in config.security_header_names]
+                headers.extend(config.security_headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
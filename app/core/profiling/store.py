@@ -0,0 +1,45 @@
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from app.core.config.settings import settings
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    id: str
+    method: str
+    path: str
+    status: int
+    request_id: Optional[str]
+    started_at: float
+    total_ms: float
+    phases: Dict[str, float] = field(default_factory=dict)
+    stats: Optional[str] = None  # saída do pstats (top funções), se houve cProfile
+
+class ProfileStore:
+    """
+    Ring buffer limitado de perfis: os mais antigos são descartados.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._items: Deque[ProfileRecord] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def add(self, record: ProfileRecord) -> None:
+        with self._lock:
+            self._items.append(record)
+
+    def list(self) -> List[ProfileRecord]:
+        with self._lock:
+            return list(reversed(self._items))
+
+    def get(self, identifier: str) -> Optional[ProfileRecord]:
+        with self._lock:
+            return next((r for r in self._items if r.id == identifier), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+profile_store = ProfileStore(settings.profiling_buffer_size)
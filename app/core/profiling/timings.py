@@ -0,0 +1,52 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+class RequestTimings:
+    """
+    Marcas de tempo por fase de uma requisição perfilada. Só existe quando a
+    requisição foi selecionada; fora disso o ContextVar fica em None.
+    """
+
+    __slots__ = ("started", "phases", "marks", "profile", "stats")
+
+    def __init__(self, profile: bool = False) -> None:
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.marks: Dict[str, float] = {}
+        self.profile = profile  # captura cProfile do endpoint
+        self.stats: Optional[str] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases.append((name, seconds))
+
+    def get(self, name: str) -> Optional[float]:
+        return next((seconds for n, seconds in self.phases if n == name), None)
+
+    def as_ms(self) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        for name, seconds in self.phases:
+            out[name] = round(out.get(name, 0.0) + seconds * 1000, 3)
+        return out
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{name};dur={ms}" for name, ms in self.as_ms().items())
+
+request_timings_ctx_var: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Mede um trecho como fase do Server-Timing. Sem profiling ativo custa um
+    ContextVar.get().
+    """
+    timings = request_timings_ctx_var.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
@@ -1,10 +1,20 @@
 from fastapi import Depends, Header, HTTPException, status
 from typing import Optional
-from app.core.config.settings import settings
+from app.core.config.runtime import runtime_config
 
 async def api_key_auth(x_api_key: Optional[str] = Header(default=None, alias="X-API-Key")) -> None:
+    # Snapshot lido uma vez; chaves em frozenset (recarregáveis sem restart)
+    api_keys = runtime_config.current.api_keys
     # Se não há chaves configuradas, autenticação desabilitada
-    if not settings.api_keys:
+    if not api_keys:
         return
-    if x_api_key is None or x_api_key not in settings.api_keys:
+    if x_api_key is None or x_api_key not in api_keys:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing API key")
+
+async def admin_api_key_auth(x_api_key: Optional[str] = Header(default=None, alias="X-API-Key")) -> None:
+    api_keys = runtime_config.current.api_keys
+    # Rotas administrativas exigem chave: sem chaves configuradas ficam indisponíveis
+    if not api_keys:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin endpoints require API keys")
+    if x_api_key is None or x_api_key not in api_keys:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing API key")
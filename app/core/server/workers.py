@@ -0,0 +1,127 @@
+import importlib.util
+import signal
+import sys
+import threading
+from types import FrameType
+from typing import Any, Dict, Optional
+
+from gunicorn.arbiter import Arbiter
+from uvicorn.server import Server
+from uvicorn.workers import UvicornWorker
+
+from app.core.admission.controller import admission_controller
+from app.core.config.settings import settings
+
+# Perfis de servidor (SERVER_PROFILE) e a worker class do gunicorn de cada um;
+# "http2" roda no hypercorn (hypercorn_conf.py), fora do gunicorn
+WORKER_CLASSES = {
+    "standard": "app.core.server.workers.TunedUvicornWorker",
+    "strict": "app.core.server.workers.StrictUvicornWorker",
+}
+SERVER_PROFILES = (*WORKER_CLASSES, "http2")
+FAST_STACK = ("uvloop", "httptools")
+# Parte do graceful_timeout reservada ao shutdown do lifespan (fechar resources)
+RESOURCE_SHUTDOWN_RESERVE = 5.0
+
+def require_fast_stack() -> None:
+    """
+    Falha alto se uvloop/httptools não estiverem instalados, em vez de o
+    uvicorn cair silenciosamente para asyncio/h11.
+    """
+    missing = [name for name in FAST_STACK if importlib.util.find_spec(name) is None]
+    if missing:
+        raise RuntimeError(
+            f"SERVER_PROFILE=strict exige {', '.join(missing)} (instale uvicorn[standard]) "
+            "ou use SERVER_PROFILE=standard"
+        )
+
+def server_tuning() -> Dict[str, Any]:
+    """
+    Limites do uvicorn vindos do Settings. backlog e keepalive vão pelo
+    gunicorn_conf.py (a UvicornWorker já os repassa).
+    """
+    tuning: Dict[str, Any] = {
+        # Só vale para o parser h11; o httptools tem limites próprios
+        "h11_max_incomplete_event_size": settings.server_h11_max_incomplete_event_size,
+    }
+    if settings.server_limit_concurrency > 0:
+        tuning["limit_concurrency"] = settings.server_limit_concurrency
+    return tuning
+
+def drain_timeout(graceful_timeout: float) -> float:
+    """
+    Quanto o uvicorn espera as conexões em andamento no shutdown: o
+    graceful_timeout do gunicorn menos a janela de readiness e a reserva para
+    fechar os resources, para tudo terminar antes do SIGKILL do master.
+    """
+    return max(graceful_timeout - settings.server_drain_delay - RESOURCE_SHUTDOWN_RESERVE, 1.0)
+
+def lifespan_drain_timeout(graceful_timeout: float) -> float:
+    """
+    Quanto o lifespan ainda espera requisições em andamento: o que sobra do
+    graceful_timeout depois da janela de readiness e da espera do uvicorn,
+    dividido com o fechamento dos resources.
+    """
+    remaining = graceful_timeout - settings.server_drain_delay - drain_timeout(graceful_timeout)
+    return max(remaining / 2, 0.0)
+
+class DrainingServer(Server):
+    """
+    No primeiro SIGTERM/SIGINT, /ready passa a falhar e o servidor continua
+    aceitando por `server_drain_delay` segundos (o balanceador tira o worker
+    de rotação) antes do shutdown normal do uvicorn. Um segundo sinal encerra
+    na hora.
+    """
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        delay = settings.server_drain_delay
+        if delay <= 0 or not admission_controller.ready:
+            super().handle_exit(sig, frame)
+            return
+        admission_controller.begin_drain()
+        # Handler de sinal: só agenda; o main_loop do uvicorn consulta should_exit
+        timer = threading.Timer(delay, super().handle_exit, (sig, frame))
+        timer.daemon = True
+        timer.start()
+
+class TunedUvicornWorker(UvicornWorker):
+    """
+    Perfil "standard": loop e parser escolhidos pelo uvicorn ("auto"), com os
+    limites do Settings e drenagem limitada ao graceful_timeout.
+    """
+
+    LOOP = "auto"
+    HTTP = "auto"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.CONFIG_KWARGS = {"loop": self.LOOP, "http": self.HTTP, **server_tuning()}
+        super().__init__(*args, **kwargs)
+        self.config.timeout_graceful_shutdown = drain_timeout(self.cfg.graceful_timeout)
+
+    def init_signals(self) -> None:
+        super().init_signals()
+        # SIGHUP recarrega o runtime_config (handler instalado no lifespan);
+        # antes disso é ignorado em vez de derrubar o worker
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    async def _serve(self) -> None:
+        # Como UvicornWorker._serve, trocando Server por DrainingServer
+        self.config.app = self.wsgi
+        server = DrainingServer(config=self.config)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+class StrictUvicornWorker(TunedUvicornWorker):
+    """
+    Perfil "strict": exige uvloop + httptools (sem fallback) e aplica os
+    mesmos limites do perfil standard.
+    """
+
+    LOOP = "uvloop"
+    HTTP = "httptools"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        require_fast_stack()
+        super().__init__(*args, **kwargs)
@@ -0,0 +1,14 @@
+class ServiceSaturatedError(Exception):
+    """
+    Recurso compartilhado sem capacidade no momento (pool de conexões, fila
+    de jobs). Respondido como 503 + Retry-After; as implementações ficam na
+    infraestrutura e a apresentação só conhece este tipo.
+    """
+
+    def __init__(self, message: str, retry_after: int = 1) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+class OperationTimeoutError(Exception):
+    """Operação delegada excedeu o tempo limite (respondido como 504)."""
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List
+
+import aiosqlite
+
+from app.core.config.logging import get_logger
+from app.core.shared.errors import ServiceSaturatedError
+
+logger = get_logger(__name__)
+
+# Pools abertos por init_async_sqlite_pool neste processo (métricas em GET /admin/pool)
+_open_pools: Dict[str, "AsyncSqlitePool"] = {}
+
+def open_pools() -> Dict[str, "AsyncSqlitePool"]:
+    return dict(_open_pools)
+
+class PoolSaturatedError(ServiceSaturatedError):
+    """
+    Nenhuma conexão disponível dentro do timeout (ou fila de espera cheia).
+    Convertido em 503 + Retry-After pelo handler de ServiceSaturatedError.
+    """
+
+class AsyncSqlitePool:
+    """
+    Pool assíncrono e limitado de conexões aiosqlite.
+    - no máximo `max_size` conexões abertas;
+    - espera por conexão limitada a `acquire_timeout` segundos;
+    - no máximo `max_waiting` corrotinas na fila; acima disso falha imediatamente.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 8,
+        acquire_timeout: float = 2.0,
+        max_waiting: int = 64,
+        retry_after: int = 1,
+        cached_statements: int = 256,
+    ) -> None:
+        self._path = path
+        self._max_size = max_size
+        self._acquire_timeout = acquire_timeout
+        self._max_waiting = max_waiting
+        self._retry_after = retry_after
+        self._cached_statements = cached_statements
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: List[aiosqlite.Connection] = []
+        self._all: List[aiosqlite.Connection] = []
+        self._closed = False
+        # Métricas
+        self._in_use = 0
+        self._waiting = 0
+        self._max_waiting_seen = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self._path, cached_statements=self._cached_statements)
+        try:
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute("PRAGMA busy_timeout=5000")
+        except BaseException:
+            # PRAGMA falhou (ex.: banco travado): não deixa a conexão e a thread órfãs
+            await conn.close()
+            raise
+        self._all.append(conn)
+        return conn
+
+    def _saturated(self, reason: str) -> PoolSaturatedError:
+        logger.warning("Pool SQLite saturado (%s): %s", reason, self.stats())
+        return PoolSaturatedError(f"Pool de conexões saturado ({reason})", retry_after=self._retry_after)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        if self._closed:
+            raise RuntimeError("AsyncSqlitePool encerrado")
+        if self._slots.locked() and self._waiting >= self._max_waiting:
+            self._rejected += 1
+            raise self._saturated("fila cheia")
+
+        started = time.perf_counter()
+        self._waiting += 1
+        self._max_waiting_seen = max(self._max_waiting_seen, self._waiting)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise self._saturated("timeout") from None
+        finally:
+            self._waiting -= 1
+        self._wait_total += time.perf_counter() - started
+
+        try:
+            conn = self._idle.pop() if self._idle else await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._acquired += 1
+        self._in_use += 1
+        try:
+            yield conn
+        finally:
+            self._in_use -= 1
+            self._idle.append(conn)
+            self._slots.release()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self.acquire() as conn:
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "max_size": self._max_size,
+            "size": len(self._all),
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_waiting_seen,
+            "acquired_total": self._acquired,
+            "timeouts_total": self._timeouts,
+            "rejected_total": self._rejected,
+            "avg_wait_ms": round(self._wait_total / self._acquired * 1000, 3) if self._acquired else 0.0,
+        }
+
+    async def close(self) -> None:
+        self._closed = True
+        connections, self._all, self._idle = self._all, [], []
+        for conn in connections:
+            await conn.close()
+
+async def init_async_sqlite_pool(
+    path: str,
+    max_size: int = 8,
+    acquire_timeout: float = 2.0,
+    max_waiting: int = 64,
+    retry_after: int = 1,
+    cached_statements: int = 256,
+) -> AsyncIterator[AsyncSqlitePool]:
+    """
+    Factory assíncrona para providers.Resource: aguardada no init_resources()
+    do lifespan e encerrada no shutdown_resources().
+    """
+    logger.info("Abrindo pool aiosqlite em %s (max_size=%d)", path, max_size)
+    pool = AsyncSqlitePool(
+        path,
+        max_size=max_size,
+        acquire_timeout=acquire_timeout,
+        max_waiting=max_waiting,
+        retry_after=retry_after,
+        cached_statements=cached_statements,
+    )
+    _open_pools[path] = pool
+    try:
+        yield pool
+    finally:
+        _open_pools.pop(path, None)
+        logger.info("Fechando pool aiosqlite: %s", pool.stats())
+        await pool.close()
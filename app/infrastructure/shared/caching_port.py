@@ -0,0 +1,316 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Hashable, Iterator, Optional, Tuple
+
+from app.core.config.settings import settings
+from app.core.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+# Camadas abertas pelas factories de Resource neste processo (métricas em GET /admin/cache)
+_open_caches: Dict[str, "_CacheLayer"] = {}
+
+def open_caches() -> Dict[str, "_CacheLayer"]:
+    return dict(_open_caches)
+
+class TTLCache:
+    """
+    LRU limitado por tamanho com expiração por TTL. Thread-safe, pois endpoints
+    síncronos rodam no threadpool do anyio. `version` muda a cada invalidação:
+    set() com a versão lida antes de uma escrita é descartado.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < now:
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        with self._lock:
+            if version is not None and version != self.version:
+                # Leitura iniciada antes de uma invalidação: não repovoa
+                return
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self.version += 1
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.version += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+class SharedGeneration:
+    """
+    Contador de geração em arquivo mapeado em memória (MAP_SHARED), visível a
+    todos os workers do mesmo host. Leitura custa um unpack de 8 bytes; escrita
+    incrementa sob flock.
+    """
+
+    _FORMAT = "Q"
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < struct.calcsize(self._FORMAT):
+            os.ftruncate(self._fd, struct.calcsize(self._FORMAT))
+        self._mm = mmap.mmap(self._fd, struct.calcsize(self._FORMAT))
+
+    def current(self) -> int:
+        return struct.unpack_from(self._FORMAT, self._mm, 0)[0]
+
+    def bump(self) -> int:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            value = self.current() + 1
+            struct.pack_into(self._FORMAT, self._mm, 0, value)
+            return value
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+class _CacheLayer:
+    def __init__(
+        self,
+        inner: Any,
+        namespace: str,
+        maxsize: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        invalidation_dir: Optional[str] = None,
+    ) -> None:
+        self._inner = inner
+        self._namespace = namespace
+        self._cache = TTLCache(
+            maxsize if maxsize is not None else settings.cache_maxsize,
+            ttl_seconds if ttl_seconds is not None else settings.cache_ttl_seconds,
+        )
+        invalidation_dir = invalidation_dir if invalidation_dir is not None else settings.cache_invalidation_dir
+        self._generation = SharedGeneration(str(Path(invalidation_dir) / f"{namespace}.gen")) if invalidation_dir else None
+        self._seen_generation = self._generation.current() if self._generation else 0
+
+    def _sync_generation(self) -> None:
+        # Outro worker escreveu: descarta o cache local
+        if self._generation is not None:
+            current = self._generation.current()
+            if current != self._seen_generation:
+                self._cache.clear()
+                self._seen_generation = current
+
+    def _store(self, key: Hashable, value: Any, version: int) -> None:
+        # Comparação e gravação sob o lock do TTLCache, atômicas com as invalidações
+        self._cache.set(key, value, version)
+
+    def _invalidate(self, identifier: Optional[str] = None) -> None:
+        if identifier is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(("all",))
+            self._cache.pop(("one", identifier))
+        if self._generation is not None:
+            generation = self._generation.bump()
+            if generation - 1 != self._seen_generation:
+                # Escritas de outros workers ainda não observadas: o pop acima não basta
+                self._cache.clear()
+            self._seen_generation = generation
+
+    def close(self) -> None:
+        # Libera fd e mmap do contador compartilhado; daqui em diante só invalidação local
+        if self._generation is not None:
+            self._generation.close()
+            self._generation = None
+
+    def stats(self) -> Dict[str, float]:
+        return {"namespace": self._namespace, "shared": self._generation is not None, **self._cache.stats()}
+
+    def __getattr__(self, name: str) -> Any:
+        # Métodos extras do adapter seguem direto para o inner
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+class CachingPort(_CacheLayer):
+    """
+    Decorator read-through para ports síncronos: cacheia get_one/get_all e
+    invalida na escrita (create/update/delete).
+
+        book_adapter = providers.Resource(init_caching_port, inner=providers.Singleton(InMemoryBookAdapter), namespace="book")
+
+    Entidades em cache são compartilhadas entre requisições; não as mute.
+    """
+
+    def get_all(self):
+        self._sync_generation()
+        value = self._cache.get(("all",))
+        if value is _MISSING:
+            version = self._cache.version
+            value = self._inner.get_all()
+            self._store(("all",), value, version)
+        return list(value)
+
+    def get_one(self, identifier: str):
+        self._sync_generation()
+        value = self._cache.get(("one", identifier))
+        if value is _MISSING:
+            version = self._cache.version
+            value = self._inner.get_one(identifier)
+            self._store(("one", identifier), value, version)
+        return value
+
+    def create(self, entity):
+        created = self._inner.create(entity)
+        self._invalidate(created.id)
+        return created
+
+    def update(self, identifier: str, entity):
+        updated = self._inner.update(identifier, entity)
+        self._invalidate(identifier)
+        return updated
+
+    def delete(self, identifier: str) -> None:
+        self._inner.delete(identifier)
+        self._invalidate(identifier)
+
+    def create_many(self, entities):
+        created = self._inner.create_many(entities)
+        self._invalidate()
+        return created
+
+    def delete_many(self, identifiers) -> None:
+        self._inner.delete_many(identifiers)
+        self._invalidate()
+
+class AsyncCachingPort(_CacheLayer):
+    """
+    Mesmo decorator para ports assíncronos (backend aiosqlite). Hits não
+    adquirem conexão do pool.
+    """
+
+    async def get_all(self):
+        self._sync_generation()
+        value = self._cache.get(("all",))
+        if value is _MISSING:
+            version = self._cache.version
+            value = await self._inner.get_all()
+            self._store(("all",), value, version)
+        return list(value)
+
+    async def get_one(self, identifier: str):
+        self._sync_generation()
+        value = self._cache.get(("one", identifier))
+        if value is _MISSING:
+            version = self._cache.version
+            value = await self._inner.get_one(identifier)
+            self._store(("one", identifier), value, version)
+        return value
+
+    async def create(self, entity):
+        created = await self._inner.create(entity)
+        self._invalidate(created.id)
+        return created
+
+    async def update(self, identifier: str, entity):
+        updated = await self._inner.update(identifier, entity)
+        self._invalidate(identifier)
+        return updated
+
+    async def delete(self, identifier: str) -> None:
+        await self._inner.delete(identifier)
+        self._invalidate(identifier)
+
+    async def create_many(self, entities):
+        created = await self._inner.create_many(entities)
+        self._invalidate()
+        return created
+
+    async def delete_many(self, identifiers) -> None:
+        await self._inner.delete_many(identifiers)
+        self._invalidate()
+
+def init_caching_port(
+    inner: Any,
+    namespace: str,
+    maxsize: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    invalidation_dir: Optional[str] = None,
+) -> Iterator[CachingPort]:
+    """
+    Factory para providers.Resource: o shutdown_resources() do lifespan fecha
+    o contador compartilhado (fd + mmap) de CACHE_INVALIDATION_DIR.
+    """
+    port = CachingPort(inner, namespace, maxsize=maxsize, ttl_seconds=ttl_seconds, invalidation_dir=invalidation_dir)
+    _open_caches[namespace] = port
+    try:
+        yield port
+    finally:
+        _open_caches.pop(namespace, None)
+        port.close()
+
+async def init_async_caching_port(
+    inner: Any,
+    namespace: str,
+    maxsize: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    invalidation_dir: Optional[str] = None,
+) -> AsyncIterator[AsyncCachingPort]:
+    """
+    Mesma factory para o AsyncCachingPort (backend aiosqlite), assíncrona
+    como o pool do qual o adapter depende.
+    """
+    port = AsyncCachingPort(inner, namespace, maxsize=maxsize, ttl_seconds=ttl_seconds, invalidation_dir=invalidation_dir)
+    _open_caches[namespace] = port
+    try:
+        yield port
+    finally:
+        _open_caches.pop(namespace, None)
+        port.close()
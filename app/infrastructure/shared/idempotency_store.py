@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Tuple
+
+from app.core.config.logging import get_logger
+from app.infrastructure.shared.sqlite_pool import SqliteConnectionPool
+
+logger = get_logger(__name__)
+
+# Resultados de reserve()
+ACQUIRED = "acquired"    # primeira requisição com a chave: executa o use case
+PENDING = "pending"      # outra requisição com a mesma chave está em andamento
+COMPLETED = "completed"  # resposta já armazenada: responder sem reexecutar
+MISMATCH = "mismatch"    # mesma chave com outra requisição (método/path/corpo)
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    content: Any  # corpo já serializado pela rota (response_model aplicado)
+
+class InMemoryIdempotencyStore:
+    """
+    Store por worker: LRU limitado com TTL. Reservas pendentes expiram após
+    `lock_timeout` para que um processamento abortado não trave a chave.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float, lock_timeout: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._lock_timeout = lock_timeout
+        # chave -> (expira_em, fingerprint, resposta ou None enquanto pendente)
+        self._data: "OrderedDict[str, Tuple[float, str, Optional[StoredResponse]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= now:
+                self._data[key] = (now + self._lock_timeout, fingerprint, None)
+                self._data.move_to_end(key)
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+                return ACQUIRED, None
+            _, stored_fingerprint, response = item
+            if stored_fingerprint != fingerprint:
+                return MISMATCH, None
+            return (COMPLETED, response) if response is not None else (PENDING, None)
+
+    def complete(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] == fingerprint:
+                self._data[key] = (time.monotonic() + self._ttl, fingerprint, response)
+
+    def release(self, key: str, fingerprint: str) -> None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] == fingerprint and item[2] is None:
+                del self._data[key]
+
+    def close(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+class SqliteIdempotencyStore:
+    """
+    Store compartilhado entre os workers do host num arquivo SQLite (WAL).
+    A reserva é um único upsert condicional, então só um worker adquire a
+    chave; expirados são reaproveitados e a poda roda a cada `prune_every`
+    reservas para manter o arquivo limitado a `maxsize` entradas.
+    """
+
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS "idempotency" ('
+        '"key" TEXT PRIMARY KEY, "fingerprint" TEXT NOT NULL, "status_code" INTEGER, '
+        '"content" TEXT, "expires_at" REAL NOT NULL, "created_at" REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS "ix_idempotency_expires_at" ON "idempotency" ("expires_at")',
+    )
+    _RESERVE = (
+        'INSERT INTO "idempotency" ("key", "fingerprint", "status_code", "content", "expires_at", "created_at") '
+        'VALUES (?, ?, NULL, NULL, ?, ?) ON CONFLICT("key") DO UPDATE SET '
+        '"fingerprint" = excluded."fingerprint", "status_code" = NULL, "content" = NULL, '
+        '"expires_at" = excluded."expires_at", "created_at" = excluded."created_at" '
+        'WHERE "idempotency"."expires_at" <= ?'
+    )
+    _SELECT = 'SELECT "fingerprint", "status_code", "content" FROM "idempotency" WHERE "key" = ?'
+    _COMPLETE = (
+        'UPDATE "idempotency" SET "status_code" = ?, "content" = ?, "expires_at" = ? '
+        'WHERE "key" = ? AND "fingerprint" = ?'
+    )
+    _RELEASE = 'DELETE FROM "idempotency" WHERE "key" = ? AND "fingerprint" = ? AND "status_code" IS NULL'
+    _PRUNE_EXPIRED = 'DELETE FROM "idempotency" WHERE "expires_at" <= ?'
+    _PRUNE_OLDEST = (
+        'DELETE FROM "idempotency" WHERE "key" IN '
+        '(SELECT "key" FROM "idempotency" ORDER BY "created_at" DESC LIMIT -1 OFFSET ?)'
+    )
+
+    def __init__(
+        self,
+        pool: SqliteConnectionPool,
+        maxsize: int,
+        ttl_seconds: float,
+        lock_timeout: float,
+        prune_every: int = 256,
+    ) -> None:
+        self._pool = pool
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._lock_timeout = lock_timeout
+        self._prune_every = prune_every
+        self._reserves = 0
+        with self._pool.transaction() as conn:
+            for stmt in self._SCHEMA:
+                conn.execute(stmt)
+
+    def reserve(self, key: str, fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        # Relógio de parede: o arquivo é compartilhado entre processos
+        now = time.time()
+        with self._pool.transaction() as conn:
+            cur = conn.execute(self._RESERVE, (key, fingerprint, now + self._lock_timeout, now, now))
+            acquired = cur.rowcount == 1
+            row = None if acquired else conn.execute(self._SELECT, (key,)).fetchone()
+        self._reserves += 1
+        if self._reserves % self._prune_every == 0:
+            self.prune()
+        if acquired or row is None:
+            return ACQUIRED if acquired else PENDING, None
+        stored_fingerprint, status_code, content = row
+        if stored_fingerprint != fingerprint:
+            return MISMATCH, None
+        if status_code is None:
+            return PENDING, None
+        return COMPLETED, StoredResponse(status_code=status_code, content=json.loads(content))
+
+    def complete(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        content = json.dumps(response.content, separators=(",", ":"))
+        with self._pool.transaction() as conn:
+            conn.execute(self._COMPLETE, (response.status_code, content, time.time() + self._ttl, key, fingerprint))
+
+    def release(self, key: str, fingerprint: str) -> None:
+        with self._pool.transaction() as conn:
+            conn.execute(self._RELEASE, (key, fingerprint))
+
+    def prune(self) -> None:
+        with self._pool.transaction() as conn:
+            conn.execute(self._PRUNE_EXPIRED, (time.time(),))
+            conn.execute(self._PRUNE_OLDEST, (self._maxsize,))
+
+    def close(self) -> None:
+        self._pool.close()
+
+def init_idempotency_store(
+    backend: str,
+    path: str,
+    maxsize: int,
+    ttl_seconds: float,
+    lock_timeout: float,
+) -> Iterator[Any]:
+    """
+    Factory para providers.Resource: "memory" (por worker) ou "sqlite"
+    (compartilhado entre workers via arquivo).
+    """
+    if backend == "sqlite":
+        logger.info("Store de idempotência SQLite em %s", path)
+        store = SqliteIdempotencyStore(SqliteConnectionPool(path), maxsize, ttl_seconds, lock_timeout)
+    elif backend == "memory":
+        store = InMemoryIdempotencyStore(maxsize, ttl_seconds, lock_timeout)
+    else:
+        raise ValueError(f"Backend de idempotência inválido: {backend}")
+    try:
+        yield store
+    finally:
+        store.close()
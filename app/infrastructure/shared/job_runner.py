@@ -0,0 +1,272 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from uuid import uuid4
+
+from app.core.config.logging import get_logger
+from app.core.shared.errors import OperationTimeoutError, ServiceSaturatedError
+
+logger = get_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+class JobQueueFullError(ServiceSaturatedError):
+    """
+    Fila do pool de processos cheia. Respondida como 503 + Retry-After pelo
+    handler de ServiceSaturatedError.
+    """
+
+class JobTimeoutError(OperationTimeoutError):
+    pass
+
+@dataclass
+class JobRecord:
+    id: str
+    name: str
+    status: str
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def queue_ms(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return round((self.started_at - self.submitted_at) * 1000, 3)
+
+    @property
+    def run_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at) * 1000, 3)
+
+def _timed_call(fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]) -> Tuple[float, float, Any]:
+    # Roda no processo filho: o início real mede o tempo de fila
+    started = time.time()
+    result = fn(*args, **kwargs)
+    return started, time.time(), result
+
+class JobRunner:
+    """
+    Executa trabalho CPU-bound num ProcessPoolExecutor, fora do GIL do worker.
+    - `run()`: offload transparente, aguarda o resultado (com timeout);
+    - `submit()`: modo assíncrono, devolve um JobRecord consultável por id.
+    Funções e argumentos precisam ser serializáveis (funções de módulo).
+    Jobs na fila + em execução são limitados a `max_pending` (503 acima disso).
+    Registros ficam na memória do worker que os criou: o id leva o prefixo
+    `owner` para que outro worker reconheça a consulta como mal roteada.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        max_records: int = 1000,
+        retry_after: int = 1,
+        mp_context: str = "forkserver",
+        default_timeout: Optional[float] = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._max_records = max_records
+        self._retry_after = retry_after
+        self._default_timeout = default_timeout
+        self._mp_context = multiprocessing.get_context(mp_context)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._owner = uuid4().hex[:8]
+        self._records: "OrderedDict[str, JobRecord]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._pending = 0
+        self._submitted = self._succeeded = self._failed = self._cancelled = self._rejected = 0
+        self._queue_seconds = self._run_seconds = 0.0
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Processos filhos só sobem no primeiro submit
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers, mp_context=self._mp_context)
+        return self._executor
+
+    def _new_id(self) -> str:
+        return f"{self._owner}-{uuid4().hex}"
+
+    def owns(self, job_id: str) -> bool:
+        """
+        Indica se o id foi gerado por este runner (mesmo que o registro já
+        tenha sido descartado).
+        """
+        return job_id.startswith(f"{self._owner}-")
+
+    def _submit(self, record: JobRecord, fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]) -> Future:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise JobQueueFullError("Fila de jobs cheia", retry_after=self._retry_after)
+            self._pending += 1
+            self._submitted += 1
+            future = None
+            try:
+                try:
+                    future = self._ensure_executor().submit(_timed_call, fn, args, kwargs)
+                except BrokenProcessPool:
+                    # Um filho morreu (ex.: OOM): recria o pool e tenta de novo
+                    logger.warning("Pool de processos quebrado; recriando")
+                    broken, self._executor = self._executor, None
+                    # Libera a thread de gerenciamento e filhos sobreviventes do pool antigo
+                    broken.shutdown(wait=False, cancel_futures=True)
+                    future = self._ensure_executor().submit(_timed_call, fn, args, kwargs)
+            finally:
+                if future is None:
+                    # Nem a segunda tentativa entrou na fila: _finish nunca será chamado
+                    self._pending -= 1
+        future.add_done_callback(lambda f: self._finish(record, f))
+        return future
+
+    def _finish(self, record: JobRecord, future: Future) -> None:
+        # Chamado pela thread de gerenciamento do executor
+        with self._lock:
+            self._pending -= 1
+            self._futures.pop(record.id, None)
+            if future.cancelled():
+                record.status = CANCELLED
+                record.finished_at = time.time()
+                self._cancelled += 1
+                return
+            error = future.exception()
+            if error is not None:
+                record.status = FAILED
+                record.error = f"{type(error).__name__}: {error}"
+                record.finished_at = time.time()
+                self._failed += 1
+                return
+            record.started_at, record.finished_at, record.result = future.result()
+            record.status = SUCCEEDED
+            self._succeeded += 1
+            self._queue_seconds += record.started_at - record.submitted_at
+            self._run_seconds += record.finished_at - record.started_at
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Executa `fn` no pool e devolve o resultado. Estourando `timeout` (padrão
+        `default_timeout`), o job é cancelado se ainda estiver na fila; em
+        execução, termina no processo filho.
+        """
+        timeout = self._default_timeout if timeout is None else timeout
+        record = JobRecord(id=self._new_id(), name=getattr(fn, "__name__", "job"), status=QUEUED, submitted_at=time.time())
+        future = self._submit(record, fn, args, kwargs)
+        try:
+            _, _, result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise JobTimeoutError(f"Job '{record.name}' excedeu {timeout}s") from None
+        return result
+
+    def run_sync(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Versão bloqueante para use cases síncronos (rodam no threadpool): a
+        thread espera, mas o cálculo não disputa o GIL do worker.
+        """
+        timeout = self._default_timeout if timeout is None else timeout
+        record = JobRecord(id=self._new_id(), name=getattr(fn, "__name__", "job"), status=QUEUED, submitted_at=time.time())
+        future = self._submit(record, fn, args, kwargs)
+        try:
+            _, _, result = future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise JobTimeoutError(f"Job '{record.name}' excedeu {timeout}s") from None
+        return result
+
+    def submit(self, fn: Callable[..., Any], *args: Any, name: Optional[str] = None, **kwargs: Any) -> JobRecord:
+        """
+        Modo assíncrono: enfileira e devolve o JobRecord (consultável em get()).
+        """
+        record = JobRecord(id=self._new_id(), name=name or getattr(fn, "__name__", "job"), status=QUEUED, submitted_at=time.time())
+        with self._lock:
+            self._records[record.id] = record
+            # Mantém só os mais recentes; jobs ainda ativos não são descartados
+            for job_id in list(self._records)[: max(len(self._records) - self._max_records, 0)]:
+                if self._records[job_id].status not in (QUEUED, RUNNING):
+                    del self._records[job_id]
+        try:
+            future = self._submit(record, fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._records.pop(record.id, None)
+            raise
+        with self._lock:
+            if not future.done():
+                self._futures[record.id] = future
+                if future.running():
+                    record.status = RUNNING
+        return record
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        with self._lock:
+            record = self._records.get(job_id)
+            future = self._futures.get(job_id)
+            if record is not None and record.status == QUEUED and future is not None and future.running():
+                # "running" no executor = já despachado para um processo filho
+                record.status = RUNNING
+            return record
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancela um job ainda na fila. Jobs já em execução num processo filho
+        não são interrompidos (retorna False).
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+        return future.cancel() if future is not None else False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self._succeeded
+            return {
+                "max_workers": self._max_workers,
+                "max_pending": self._max_pending,
+                "pending": self._pending,
+                "submitted_total": self._submitted,
+                "succeeded_total": self._succeeded,
+                "failed_total": self._failed,
+                "cancelled_total": self._cancelled,
+                "rejected_total": self._rejected,
+                "avg_queue_ms": round(self._queue_seconds / completed * 1000, 3) if completed else 0.0,
+                "avg_run_ms": round(self._run_seconds / completed * 1000, 3) if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+def init_job_runner(
+    max_workers: int,
+    max_pending: int,
+    max_records: int = 1000,
+    retry_after: int = 1,
+    mp_context: str = "forkserver",
+    default_timeout: Optional[float] = None,
+) -> Iterator[JobRunner]:
+    """
+    Factory para providers.Resource: o pool é encerrado no shutdown_resources()
+    (jobs na fila são cancelados, os em execução terminam).
+    """
+    runner = JobRunner(max_workers, max_pending, max_records, retry_after, mp_context, default_timeout)
+    try:
+        yield runner
+    finally:
+        logger.info("Encerrando pool de jobs: %s", runner.stats())
+        runner.shutdown()
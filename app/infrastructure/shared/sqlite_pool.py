@@ -0,0 +1,89 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from app.core.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+class SqliteConnectionPool:
+    """
+    Pool de conexões SQLite: uma conexão por thread e por processo (worker).
+    Conexões são abertas em WAL e reutilizam o cache de statements do sqlite3,
+    então SQL constante é preparado uma única vez por conexão.
+    """
+
+    def __init__(self, path: str, cached_statements: int = 256, busy_timeout_ms: int = 5000) -> None:
+        self._path = path
+        self._cached_statements = cached_statements
+        self._busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._pid = os.getpid()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            cached_statements=self._cached_statements,
+            check_same_thread=False,  # close() roda na thread que encerra o container
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        # Após fork (gunicorn), conexões herdadas do processo pai não podem ser usadas
+        if self._pid != os.getpid():
+            with self._lock:
+                self._local = threading.local()
+                self._connections = []
+                self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connection()
+        with conn:  # commit no sucesso, rollback em exceção
+            yield conn
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                logger.debug("Conexão SQLite já encerrada")
+
+def init_sqlite_pool(path: str, cached_statements: int = 256) -> Iterator[SqliteConnectionPool]:
+    """
+    Factory para providers.Resource: abre o pool no init_resources()
+    e fecha todas as conexões no shutdown_resources().
+    """
+    logger.info("Abrindo pool SQLite em %s", path)
+    pool = SqliteConnectionPool(path, cached_statements=cached_statements)
+    try:
+        yield pool
+    finally:
+        logger.info("Fechando pool SQLite (%d conexões)", pool.size)
+        pool.close()
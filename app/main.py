@@ -1,17 +1,28 @@
+import asyncio
+import inspect
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config.settings import settings
+from app.core.config.runtime import runtime_config
 from app.core.config.logging import configure_logging, get_logger
 from app.core.di.container import Container
 from app.core.security.api_key import api_key_auth
 from app.core.middleware.correlation import CorrelationIdMiddleware
 from app.core.middleware.security_headers import SecurityHeadersMiddleware
+from app.core.middleware.cors import RuntimeCORSMiddleware
+from app.core.middleware.profiling import ProfilingMiddleware
+from app.core.middleware.body_limit import BodyLimitMiddleware, BodyTooLargeError
+from app.core.middleware.admission import AdmissionControlMiddleware
+from app.core.admission.controller import admission_controller
+from app.core.server.workers import lifespan_drain_timeout
+from app.core.shared.errors import OperationTimeoutError, ServiceSaturatedError
 from app.presentation.v1.api import api_router as v1_api_router
-from app.presentation.shared.errors import AppError, app_error_handler
+from app.presentation.shared.errors import AppError, app_error_handler, body_too_large_handler, job_timeout_handler, pool_saturated_handler
+from app.presentation.shared.negotiation import negotiated_openapi
+from app.presentation.shared.openapi import install_docs
 
 logger = get_logger(__name__)
 
@@ -20,36 +31,87 @@ async def lifespan(app: FastAPI):
     configure_logging()
     logger.info("Inicializando DI Container (Singletons)")
     container = Container()
-    container.init_resources()
+    # Resources assíncronos (ex.: pool aiosqlite) tornam init/shutdown aguardáveis
+    initialized = container.init_resources()
+    if inspect.isawaitable(initialized):
+        await initialized
     container.wire(packages=["app.presentation.v1.endpoints"])
     app.state.container = container
+    admission_controller.start()
+    # O snapshot foi compilado no import (master, com preload): edições feitas
+    # desde então valem já para este worker
+    runtime_config.refresh()
+    # SIGHUP no worker ou edição de runtime_config_file trocam o snapshot sem restart
+    runtime_config.install_signal_handler()
+    watcher = None
+    if settings.runtime_config_poll_seconds > 0:
+        watcher = asyncio.create_task(runtime_config.watch(settings.runtime_config_poll_seconds))
     try:
         yield
     finally:
+        if watcher is not None:
+            watcher.cancel()
+        runtime_config.remove_signal_handler()
+        # /ready passa a falhar e as requisições em andamento terminam antes de fechar os
+        # resources; o uvicorn já esperou a maior parte do graceful_timeout, resta a reserva
+        drain_budget = lifespan_drain_timeout(settings.server_graceful_timeout)
+        if not await admission_controller.drain(drain_budget):
+            logger.warning("Drenagem excedeu %.1fs com %d requisições em andamento",
+                           drain_budget, admission_controller.in_flight)
         logger.info("Encerrando DI Container")
+        shutdown = container.shutdown_resources()
+        if inspect.isawaitable(shutdown):
+            await shutdown
         container.unwire()
 
+def add_middlewares(app: FastAPI) -> None:
+    # Reutilizado pelos benchmarks para medir a pilha de middlewares isolada
+    # Mais interno: o estouro chega ao handler sem passar pelos task groups do
+    # BaseHTTPMiddleware, e o 413 ainda recebe CORS e cabeçalhos de segurança
+    app.add_middleware(BodyLimitMiddleware)
+    # Depois do TrustedHost e por dentro de CORS/cabeçalhos de segurança: o 503
+    # de descarte sai com os mesmos cabeçalhos das demais respostas. Com a
+    # admissão desligada, só conta as requisições em andamento (drenagem)
+    app.add_middleware(AdmissionControlMiddleware, enforce=settings.admission_enabled)
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
+    # Origens vêm do snapshot recarregável (runtime_config)
+    app.add_middleware(
+        RuntimeCORSMiddleware,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_min_size)
+    app.add_middleware(CorrelationIdMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    # Mais externo, para medir a pilha inteira; desligado não é instalado
+    if settings.profiling_enabled:
+        app.add_middleware(ProfilingMiddleware)
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.api_version,
     lifespan=lifespan,
+    # Documentação servida por install_docs (payloads pré-computados)
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 # Middlewares
-app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_min_size)
-app.add_middleware(CorrelationIdMiddleware)
-app.add_middleware(SecurityHeadersMiddleware)
+add_middlewares(app)
 
 # Handlers de erro
 app.add_exception_handler(AppError, app_error_handler)
+app.add_exception_handler(ServiceSaturatedError, pool_saturated_handler)  # PoolSaturatedError, JobQueueFullError
+app.add_exception_handler(OperationTimeoutError, job_timeout_handler)  # JobTimeoutError
+app.add_exception_handler(BodyTooLargeError, body_too_large_handler)
 
 # Roteamento
 app.include_router(v1_api_router)
+
+# OpenAPI documenta também application/msgpack nas rotas que negociam formato
+app.openapi = lambda: negotiated_openapi(app)
+
+# Schema e docs serializados/comprimidos no import (master do gunicorn com preload)
+install_docs(app, openapi_file=settings.openapi_file)
@@ -0,0 +1,231 @@
+import codecs
+import json
+from typing import Any, AsyncIterator, List, Type, TypeVar
+
+import msgpack
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+from starlette import status
+
+from app.core.config.settings import settings
+from app.presentation.shared.errors import AppError
+from app.presentation.shared.negotiation import MsgpackRequest
+
+M = TypeVar("M", bound=BaseModel)
+
+NDJSON_MEDIA_TYPES = frozenset({"application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines"})
+JSON_MEDIA_TYPES = frozenset({"", "application/json"})
+
+# OpenAPI das rotas /bulk: o corpo é lido em streaming, fora da validação do FastAPI
+def bulk_openapi_extra(model: Type[BaseModel]) -> dict:
+    item = {"$ref": f"#/components/schemas/{model.__name__}"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": item}},
+                "application/x-ndjson": {"schema": item},
+            },
+        }
+    }
+
+class BulkItemError(BaseModel):
+    index: int
+    message: str
+
+class BulkResult(BaseModel):
+    received: int = 0
+    created: int = 0
+    rejected: int = 0
+    errors: List[BulkItemError] = []
+
+    def reject(self, index: int, message: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < settings.bulk_max_errors:
+            self.errors.append(BulkItemError(index=index, message=message))
+
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+class JsonArrayParser:
+    """
+    Parser incremental de um array JSON de nível superior: `feed` recebe
+    texto conforme chega e devolve os itens já completos, guardando só o
+    item em andamento. Erros de sintaxe viram ValueError.
+    """
+
+    _START, _FIRST, _VALUE, _SEP, _END = range(5)
+
+    def __init__(self, max_item_chars: int) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = self._START
+        self._max_item_chars = max_item_chars
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        buf = self._buffer + text if self._buffer else text
+        size = len(buf)
+        pos = 0
+        items: List[Any] = []
+        while True:
+            while pos < size and buf[pos] in " \t\n\r":
+                pos += 1
+            if pos >= size:
+                break
+            char = buf[pos]
+            if self._state == self._START:
+                if char != "[":
+                    raise ValueError("o corpo deve ser um array JSON")
+                pos += 1
+                self._state = self._FIRST
+            elif self._state == self._SEP:
+                if char not in ",]":
+                    raise ValueError(f"esperado ',' ou ']' após o item {len(items)}")
+                pos += 1
+                self._state = self._VALUE if char == "," else self._END
+            elif self._state == self._END:
+                raise ValueError("conteúdo após o fim do array")
+            elif char == "]" and self._state == self._FIRST:
+                pos += 1
+                self._state = self._END
+            else:
+                try:
+                    value, end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as exc:
+                    if final:
+                        raise ValueError(exc.msg) from None
+                    break  # item incompleto: espera o próximo pedaço
+                if not final and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    # Número no fim do pedaço pode continuar no próximo, inclusive
+                    # depois de '.', 'e' ou 'e+' ("12." + "5", "1e" + "3")
+                    tail = end
+                    while tail < size and buf[tail] in _NUMBER_CHARS:
+                        tail += 1
+                    if tail >= size:
+                        break
+                elif end >= size and not final:
+                    break
+                items.append(value)
+                pos = end
+                self._state = self._SEP
+        self._buffer = buf[pos:]
+        if len(self._buffer) > self._max_item_chars:
+            raise ValueError(f"item excede {self._max_item_chars} bytes")
+        if final and self._state != self._END:
+            raise ValueError("array JSON incompleto")
+        return items
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Any]:
+    buffer = b""
+    line_no = 0
+
+    def decode(line: bytes) -> Any:
+        try:
+            return json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"linha {line_no}: JSON inválido") from exc
+
+    async for chunk in chunks:
+        buffer = buffer + chunk if buffer else chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) >= 0:
+            line_no += 1
+            if end - start > max_item_bytes:
+                raise ValueError(f"linha {line_no} excede {max_item_bytes} bytes")
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                yield decode(line)
+        buffer = buffer[start:]
+        if len(buffer) > max_item_bytes:
+            raise ValueError(f"linha {line_no + 1} excede {max_item_bytes} bytes")
+    if buffer.strip():
+        line_no += 1
+        yield decode(buffer)
+
+async def _iter_json_array(chunks: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Any]:
+    # UTF-8 incremental: um caractere pode chegar dividido entre pedaços
+    text = codecs.getincrementaldecoder("utf-8")()
+    parser = JsonArrayParser(max_item_bytes)
+    async for chunk in chunks:
+        for item in parser.feed(text.decode(chunk)):
+            yield item
+    for item in parser.feed(text.decode(b"", final=True), final=True):
+        yield item
+
+async def _iter_msgpack_array(chunks: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Any]:
+    # Cabeçalho do array e depois um item por vez; OutOfData espera o próximo pedaço
+    unpacker = msgpack.Unpacker(raw=False, max_buffer_size=2 * max_item_bytes)
+    remaining = None
+    async for chunk in chunks:
+        for start in range(0, len(chunk), max_item_bytes):
+            try:
+                unpacker.feed(chunk[start:start + max_item_bytes])
+            except msgpack.BufferFull:
+                raise ValueError(f"item excede {max_item_bytes} bytes") from None
+            while remaining != 0:
+                try:
+                    if remaining is None:
+                        remaining = unpacker.read_array_header()
+                        continue
+                    item = unpacker.unpack()
+                except msgpack.OutOfData:
+                    break
+                remaining -= 1
+                yield item
+            if remaining == 0 and unpacker.read_bytes(1):
+                raise ValueError("conteúdo após o fim do array")
+    if remaining != 0:
+        raise ValueError("array MessagePack incompleto")
+
+async def iter_bulk_chunks(
+    request: Request,
+    model: Type[M],
+    result: BulkResult,
+    chunk_size: int = 0,
+    max_item_bytes: int = 0,
+) -> AsyncIterator[List[M]]:
+    """
+    Lê o corpo em streaming (array JSON, NDJSON ou array MessagePack, pelo
+    Content-Type) e entrega os itens válidos em lotes de `chunk_size`: a
+    memória fica limitada a um lote, independente do tamanho do upload.
+    Itens inválidos contam em `result`; corpo malformado interrompe com 400,
+    mantendo o que já foi entregue.
+    """
+    chunk_size = chunk_size or settings.bulk_chunk_size
+    max_item_bytes = max_item_bytes or settings.bulk_max_item_bytes
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if isinstance(request, MsgpackRequest):
+        # AppRoute já trocou o Content-Type por JSON; o corpo continua em MessagePack
+        items = _iter_msgpack_array(request.stream(), max_item_bytes)
+    elif media_type in NDJSON_MEDIA_TYPES:
+        items = _iter_ndjson(request.stream(), max_item_bytes)
+    elif media_type in JSON_MEDIA_TYPES:
+        items = _iter_json_array(request.stream(), max_item_bytes)
+    else:
+        raise AppError(
+            f"Content-Type não suportado: {media_type} (use application/json, application/x-ndjson ou application/msgpack)",
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
+
+    batch: List[M] = []
+    try:
+        async for item in items:
+            index = result.received
+            result.received += 1
+            try:
+                batch.append(model.model_validate(item))
+            except ValidationError as exc:
+                errors = exc.errors(include_url=False)
+                location = ".".join(str(part) for part in errors[0]["loc"])
+                result.reject(index, f"{location}: {errors[0]['msg']}" if location else errors[0]["msg"])
+                continue
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+    except ValueError as exc:
+        raise AppError(
+            f"Corpo inválido após {result.received} itens ({result.created} criados): {exc}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        ) from None
+    if batch:
+        yield batch
@@ -1,7 +1,9 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from starlette import status
+from app.core.middleware.body_limit import BodyTooLargeError, payload_too_large
 from app.presentation.shared.http_response import HttpErrorResponse
+from app.core.shared.errors import OperationTimeoutError, ServiceSaturatedError
 
 class AppError(Exception):
     def __init__(self, message: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> None:
@@ -12,3 +14,20 @@ class AppError(Exception):
 async def app_error_handler(request: Request, exc: AppError):
     payload = HttpErrorResponse(error="AppError", message=exc.message)
     return JSONResponse(status_code=exc.status_code, content=payload.model_dump())
+
+async def pool_saturated_handler(request: Request, exc: ServiceSaturatedError):
+    # Pool/fila sem capacidade: devolve 503 em vez de empilhar requisições
+    payload = HttpErrorResponse(error="ServiceUnavailable", message=exc.message)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=payload.model_dump(),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+async def job_timeout_handler(request: Request, exc: OperationTimeoutError):
+    payload = HttpErrorResponse(error="GatewayTimeout", message=str(exc))
+    return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content=payload.model_dump())
+
+async def body_too_large_handler(request: Request, exc: BodyTooLargeError):
+    # Limite estourado durante a leitura do corpo pelo FastAPI
+    return payload_too_large(exc)
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config.settings import settings
+from app.infrastructure.shared.idempotency_store import ACQUIRED, COMPLETED, MISMATCH, StoredResponse
+from app.presentation.shared.errors import AppError
+from app.presentation.shared.negotiation import NegotiatedResponse
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Reservas em andamento neste worker: duplicatas concorrentes esperam o evento
+# em vez de consultar o store em intervalos
+_inflight: Dict[str, asyncio.Event] = {}
+
+def _scoped_key(api_key: Optional[str], idempotency_key: str) -> str:
+    # Hash para não gravar a API key em claro no store compartilhado
+    return hashlib.sha256(f"{api_key or ''}\0{idempotency_key}".encode("utf-8")).hexdigest()
+
+def _fingerprint(request: Request, kwargs: Dict[str, Any]) -> str:
+    params = {name: value for name, value in kwargs.items() if not isinstance(value, Request)}
+    payload = json.dumps(jsonable_encoder(params), sort_keys=True, separators=(",", ":"), default=str)
+    raw = f"{request.method} {request.url.path}?{request.url.query}\0{payload}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+async def _claim(store: Any, key: str, fingerprint: str) -> Optional[StoredResponse]:
+    """
+    Reserva a chave (None) ou devolve a resposta já armazenada. Duplicatas
+    concorrentes esperam a primeira terminar até `idempotency_wait_timeout`.
+    """
+    deadline = time.monotonic() + settings.idempotency_wait_timeout
+    while True:
+        state, stored = await run_in_threadpool(store.reserve, key, fingerprint)
+        if state == ACQUIRED:
+            _inflight[key] = asyncio.Event()
+            return None
+        if state == COMPLETED:
+            return stored
+        if state == MISMATCH:
+            raise AppError(
+                f"{IDEMPOTENCY_HEADER} já utilizada com outra requisição",
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise AppError(
+                f"Requisição com esta {IDEMPOTENCY_HEADER} ainda em processamento",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        event = _inflight.get(key)
+        if event is None:
+            # Em andamento em outro worker (store SQLite): consulta periódica
+            await asyncio.sleep(min(remaining, settings.idempotency_poll_interval))
+            continue
+        try:
+            await asyncio.wait_for(event.wait(), remaining)
+        except asyncio.TimeoutError:
+            pass
+
+def _finish(key: str) -> None:
+    event = _inflight.pop(key, None)
+    if event is not None:
+        event.set()
+
+async def _render(route: Any, result: Any) -> Any:
+    """
+    Serializa como a própria rota faria (response_model, include/exclude):
+    o que vai para o store é exatamente o corpo enviado ao cliente.
+    """
+    return await serialize_response(
+        field=getattr(route, "response_field", None),
+        response_content=result,
+        include=getattr(route, "response_model_include", None),
+        exclude=getattr(route, "response_model_exclude", None),
+        by_alias=getattr(route, "response_model_by_alias", True),
+        exclude_unset=getattr(route, "response_model_exclude_unset", False),
+        exclude_defaults=getattr(route, "response_model_exclude_defaults", False),
+        exclude_none=getattr(route, "response_model_exclude_none", False),
+    )
+
+def idempotent(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Torna um endpoint de escrita idempotente pelo header Idempotency-Key
+    (escopo: chave + X-API-Key). A primeira requisição executa o endpoint e
+    armazena a resposta serializada; repetições com a mesma chave e o mesmo
+    conteúdo são respondidas do store sem reexecutar o use case (o corpo
+    armazenado já passou pelo response_model da rota). Sem o header,
+    o endpoint roda normalmente. Requer um parâmetro `request: Request` e o
+    provider `idempotency_store` no Container.
+    """
+    is_async = inspect.iscoroutinefunction(endpoint)
+
+    async def call(*args: Any, **kwargs: Any) -> Any:
+        if is_async:
+            return await endpoint(*args, **kwargs)
+        return await run_in_threadpool(endpoint, *args, **kwargs)
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        request = next((v for v in kwargs.values() if isinstance(v, Request)), None)
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER) if request is not None else None
+        if not idempotency_key:
+            return await call(*args, **kwargs)
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            raise AppError(f"{IDEMPOTENCY_HEADER} excede {MAX_KEY_LENGTH} caracteres")
+
+        store = request.app.state.container.idempotency_store()
+        key = _scoped_key(request.headers.get("x-api-key"), idempotency_key)
+        fingerprint = _fingerprint(request, kwargs)
+        route = request.scope.get("route")
+        status_code = getattr(route, "status_code", None) or status.HTTP_200_OK
+
+        stored = await _claim(store, key, fingerprint)
+        if stored is not None:
+            return NegotiatedResponse(stored.content, status_code=stored.status_code, headers={REPLAYED_HEADER: "true"})
+
+        try:
+            result = await call(*args, **kwargs)
+            if isinstance(result, Response):
+                # Response montada à mão não é armazenável: libera a chave
+                await run_in_threadpool(store.release, key, fingerprint)
+                return result
+            stored = StoredResponse(status_code=status_code, content=await _render(route, result))
+            await run_in_threadpool(store.complete, key, fingerprint, stored)
+            # Devolve o corpo já renderizado: a rota não serializa de novo
+            return NegotiatedResponse(stored.content, status_code=stored.status_code)
+        except BaseException:
+            # Falhou: libera a chave para que o retry do cliente execute de novo
+            await run_in_threadpool(store.release, key, fingerprint)
+            raise
+        finally:
+            _finish(key)
+
+    return wrapper
@@ -0,0 +1,141 @@
+import copy
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import msgpack
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Aliases ainda comuns em clientes MessagePack
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+# Media type escolhido para a resposta da requisição corrente (definido pelo AppRoute)
+response_media_type_ctx_var: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+def _media_ranges(header: str) -> Iterable[Tuple[str, float]]:
+    for item in header.split(","):
+        media_type, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        yield media_type.strip().lower(), q
+
+def preferred_media_type(accept: Optional[str]) -> str:
+    """
+    MessagePack só quando o Accept o pede explicitamente com qualidade maior
+    que a de application/json; em qualquer outro caso (inclusive */*), JSON.
+    """
+    if not accept or "msgpack" not in accept:
+        return JSON_MEDIA_TYPE
+    msgpack_q = json_q = 0.0
+    for media_type, q in _media_ranges(accept):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type == JSON_MEDIA_TYPE:
+            json_q = max(json_q, q)
+    return MSGPACK_MEDIA_TYPE if msgpack_q > json_q else JSON_MEDIA_TYPE
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    gzip só quando aceito com qualidade > 0 (explicitamente ou por `*`) e não
+    menor que a de um identity explícito: `gzip;q=0`, `identity, *;q=0` e
+    `gzip;q=0.5, identity` ficam sem compressão.
+    """
+    if not accept_encoding:
+        return False
+    gzip_q = identity_q = wildcard_q = None
+    for coding, q in _media_ranges(accept_encoding):
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = max(gzip_q or 0.0, q)
+        elif coding == "identity":
+            identity_q = q
+        elif coding == "*":
+            wildcard_q = q
+    if gzip_q is None:
+        gzip_q = wildcard_q or 0.0
+    # identity sem q explícito não concorre: só é preferida quando pedida com q maior
+    return gzip_q > 0 and gzip_q >= (identity_q or 0.0)
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.split(";", 1)[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+class NegotiatedResponse(JSONResponse):
+    """
+    Response padrão das rotas AppRoute: JSON, ou MessagePack quando o Accept
+    da requisição preferir. O conteúdo chega já convertido pelo FastAPI
+    (jsonable), então os dois formatos carregam os mesmos dados.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        if media_type is None:
+            media_type = response_media_type_ctx_var.get()
+        super().__init__(content, status_code, headers, media_type, background)
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(content, use_bin_type=True)
+        return super().render(content)
+
+class MsgpackRequest(Request):
+    """
+    Request com corpo MessagePack. O FastAPI só chama `json()` para corpos
+    JSON; por isso o content-type visto por ele é application/json e `json()`
+    devolve o corpo MessagePack decodificado, validado direto no schema.
+    """
+
+    def __init__(self, scope, receive) -> None:
+        headers = [
+            (name, JSON_MEDIA_TYPE.encode("latin-1")) if name == b"content-type" else (name, value)
+            for name, value in scope["headers"]
+        ]
+        super().__init__({**scope, "headers": headers}, receive)
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body(), raw=False)
+        return self._json
+
+def negotiated_openapi(app: FastAPI) -> Dict[str, Any]:
+    """
+    Schema OpenAPI do app com application/msgpack documentado ao lado de
+    application/json em corpos e respostas das rotas que negociam (AppRoute).
+    """
+    if app.openapi_schema is not None:
+        return app.openapi_schema
+    from app.presentation.shared.routing import AppRoute
+
+    schema = FastAPI.openapi(app)
+    paths = schema.get("paths", {})
+    for route in app.routes:
+        if not isinstance(route, AppRoute) or not route.include_in_schema:
+            continue
+        operations = paths.get(route.path_format, {})
+        for method in route.methods:
+            operation = operations.get(method.lower())
+            if not operation:
+                continue
+            # Erros (422, handlers) continuam só em JSON
+            contents = [r.get("content") for code, r in operation.get("responses", {}).items() if code.startswith("2")]
+            contents.append(operation.get("requestBody", {}).get("content"))
+            for content in contents:
+                if content and JSON_MEDIA_TYPE in content:
+                    content.setdefault(MSGPACK_MEDIA_TYPE, copy.deepcopy(content[JSON_MEDIA_TYPE]))
+    app.openapi_schema = schema
+    return schema
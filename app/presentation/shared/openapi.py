@@ -0,0 +1,120 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from starlette import status
+from starlette.responses import Response
+
+from app.core.config.logging import get_logger
+from app.presentation.shared.negotiation import JSON_MEDIA_TYPE, accepts_gzip, negotiated_openapi
+
+logger = get_logger(__name__)
+
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+@dataclass(frozen=True)
+class PrecomputedPayload:
+    """
+    Corpo serializado uma única vez, com a versão gzip e o ETag já prontos:
+    servir é só escolher os bytes (ou responder 304).
+    """
+    body: bytes
+    gzipped: bytes
+    etag: str
+    media_type: str
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str) -> "PrecomputedPayload":
+        # mtime=0: mesmos bytes em todos os workers e builds
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        # Fraco: identity e gzip são representações equivalentes do mesmo conteúdo
+        etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return cls(body=body, gzipped=gzipped, etag=etag, media_type=media_type)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag.removeprefix("W/") in tags
+
+    def response(self, request: Request) -> Response:
+        # no-cache: o cliente sempre revalida, e a revalidação custa um 304
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if accepts_gzip(request.headers.get("accept-encoding")):
+            # Content-Encoding presente: o GZipMiddleware repassa sem recomprimir
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzipped, media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
+
+def serialize_openapi(app: FastAPI) -> bytes:
+    """
+    Schema OpenAPI do app (com msgpack documentado) nos mesmos bytes que o
+    JSONResponse produziria. Usado no boot e pelo `cocli openapi`.
+    """
+    return json.dumps(
+        negotiated_openapi(app),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+def _load_openapi(app: FastAPI, openapi_file: str) -> bytes:
+    path = Path(openapi_file) if openapi_file else None
+    if path is None or not path.is_file():
+        return serialize_openapi(app)
+    body = path.read_bytes()
+    # Valida já no boot (arquivo corrompido falha aqui, não na primeira requisição)
+    app.openapi_schema = json.loads(body)
+    logger.info("Schema OpenAPI carregado de %s", path)
+    return body
+
+def install_docs(
+    app: FastAPI,
+    openapi_url: str = "/openapi.json",
+    docs_url: Optional[str] = "/docs",
+    redoc_url: Optional[str] = "/redoc",
+    openapi_file: str = "",
+) -> Dict[str, PrecomputedPayload]:
+    """
+    Substitui as rotas de documentação do FastAPI (crie o app com
+    openapi_url=None) por payloads montados agora: schema OpenAPI, Swagger UI
+    e ReDoc são serializados e comprimidos uma vez, então a primeira requisição
+    custa o mesmo que as seguintes. Chamado no import do app, roda no master
+    do gunicorn com preload_app. Com `openapi_file` (gerado pelo
+    `cocli openapi` no build) o schema nem é montado no boot. Os caminhos são
+    fixados com `app.root_path`, não com o root_path de cada requisição.
+    Deve ser chamado depois de incluir todos os routers.
+    """
+    root_path = app.root_path.rstrip("/")
+    payloads = {openapi_url: PrecomputedPayload.build(_load_openapi(app, openapi_file), JSON_MEDIA_TYPE)}
+    if docs_url:
+        oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
+        swagger = get_swagger_ui_html(
+            openapi_url=root_path + openapi_url,
+            title=f"{app.title} - Swagger UI",
+            oauth2_redirect_url=root_path + oauth2_redirect_url if oauth2_redirect_url else None,
+            init_oauth=app.swagger_ui_init_oauth,
+            swagger_ui_parameters=app.swagger_ui_parameters,
+        )
+        payloads[docs_url] = PrecomputedPayload.build(swagger.body, HTML_MEDIA_TYPE)
+        if oauth2_redirect_url:
+            redirect = get_swagger_ui_oauth2_redirect_html()
+            payloads[oauth2_redirect_url] = PrecomputedPayload.build(redirect.body, HTML_MEDIA_TYPE)
+    if redoc_url:
+        redoc = get_redoc_html(openapi_url=root_path + openapi_url, title=f"{app.title} - ReDoc")
+        payloads[redoc_url] = PrecomputedPayload.build(redoc.body, HTML_MEDIA_TYPE)
+
+    for path, payload in payloads.items():
+        async def endpoint(request: Request, payload: PrecomputedPayload = payload) -> Response:
+            return payload.response(request)
+
+        app.add_route(path, endpoint, methods=["GET"], include_in_schema=False)
+    return payloads
@@ -0,0 +1,177 @@
+import cProfile
+import functools
+import inspect
+import io
+import pstats
+import threading
+import time
+from typing import Any, Callable
+
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.core.config.settings import settings
+from app.core.profiling.timings import RequestTimings, request_timings_ctx_var
+from app.presentation.shared.negotiation import (
+    MsgpackRequest,
+    NegotiatedResponse,
+    is_msgpack,
+    preferred_media_type,
+    response_media_type_ctx_var,
+)
+
+# Threads com cProfile ativo: um segundo profiler na mesma thread sobrescreveria o primeiro
+_profiling_threads: set = set()
+
+def _format_stats(profiler: cProfile.Profile, limit: int = 40) -> str:
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+def _start_profiler(timings: RequestTimings):
+    ident = threading.get_ident()
+    if not timings.profile or ident in _profiling_threads:
+        return None
+    _profiling_threads.add(ident)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+def _stop_profiler(timings: RequestTimings, profiler) -> None:
+    if profiler is None:
+        return
+    profiler.disable()
+    _profiling_threads.discard(threading.get_ident())
+    timings.stats = _format_stats(profiler)
+
+class _ProfiledCoroutine:
+    """
+    Aguarda a corrotina do endpoint ligando o cProfile só enquanto ela executa
+    e desligando a cada suspensão: o que o event loop roda nos awaits (outras
+    requisições, callbacks) não entra no relatório desta requisição.
+    """
+
+    def __init__(self, coro: Any, profiler: cProfile.Profile) -> None:
+        self._coro = coro
+        self._profiler = profiler
+
+    def __await__(self):
+        coro, profiler = self._coro, self._profiler
+        resume, value = coro.send, None
+        while True:
+            profiler.enable()
+            try:
+                yielded = resume(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                profiler.disable()
+            try:
+                value = yield yielded
+                resume = coro.send
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as exc:  # cancelamento e erros seguem para o endpoint
+                resume, value = coro.throw, exc
+
+def _profiled_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Envolve o endpoint para medir a fase "endpoint" (DI + controller) e, quando
+    pedido, capturar cProfile na própria thread em que ele roda (threadpool
+    para endpoints síncronos; trechos entre awaits para os assíncronos).
+    """
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            timings = request_timings_ctx_var.get()
+            if timings is None:
+                return await endpoint(*args, **kwargs)
+            timings.marks["endpoint_start"] = started = time.perf_counter()
+            try:
+                if not timings.profile:
+                    return await endpoint(*args, **kwargs)
+                # Sem registro em _profiling_threads: os trechos nunca se sobrepõem
+                profiler = cProfile.Profile()
+                try:
+                    return await _ProfiledCoroutine(endpoint(*args, **kwargs), profiler)
+                finally:
+                    timings.stats = _format_stats(profiler)
+            finally:
+                timings.marks["endpoint_end"] = ended = time.perf_counter()
+                timings.add("endpoint", ended - started)
+        async_wrapper.__profiled__ = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        timings = request_timings_ctx_var.get()
+        if timings is None:
+            return endpoint(*args, **kwargs)
+        profiler = _start_profiler(timings)
+        timings.marks["endpoint_start"] = started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            timings.marks["endpoint_end"] = ended = time.perf_counter()
+            timings.add("endpoint", ended - started)
+            _stop_profiler(timings, profiler)
+    sync_wrapper.__profiled__ = True
+    return sync_wrapper
+
+class AppRoute(APIRoute):
+    """
+    APIRoute do projeto:
+    - negocia o formato pelo Accept/Content-Type (JSON ou MessagePack);
+    - com `profiling_enabled`, mede as fases da rota para o Server-Timing:
+      deps (parse/validação), endpoint, di, controller e serialize.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # include_router recria a rota com o endpoint já envolvido
+        if settings.profiling_enabled and not getattr(endpoint, "__profiled__", False):
+            endpoint = _profiled_endpoint(endpoint)
+        # Só substitui o JSONResponse padrão; response_class explícito é respeitado
+        response_class = kwargs.get("response_class", Default(JSONResponse))
+        if isinstance(response_class, DefaultPlaceholder) and response_class.value is JSONResponse:
+            kwargs["response_class"] = Default(NegotiatedResponse)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+
+        async def handler(request):
+            headers = request.headers
+            token = response_media_type_ctx_var.set(preferred_media_type(headers.get("accept")))
+            if is_msgpack(headers.get("content-type")):
+                request = MsgpackRequest(request.scope, request.receive)
+            try:
+                return await route_handler(request)
+            finally:
+                response_media_type_ctx_var.reset(token)
+
+        if not settings.profiling_enabled:
+            return handler
+
+        async def timed_handler(request):
+            timings = request_timings_ctx_var.get()
+            if timings is None:
+                return await handler(request)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                ended = time.perf_counter()
+                timings.add("route", ended - started)
+                endpoint_start = timings.marks.get("endpoint_start")
+                endpoint_end = timings.marks.get("endpoint_end")
+                if endpoint_start is not None and endpoint_end is not None:
+                    timings.add("deps", endpoint_start - started)
+                    timings.add("serialize", ended - endpoint_end)
+                controller = timings.get("controller")
+                endpoint = timings.get("endpoint")
+                if controller is not None and endpoint is not None:
+                    timings.add("di", max(endpoint - controller, 0.0))
+
+        return timed_handler
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 from app.presentation.v1.endpoints.health.endpoints import router as health_router
+from app.presentation.v1.endpoints.admin.endpoints import router as admin_router
+from app.presentation.v1.endpoints.jobs.endpoints import router as jobs_router
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(health_router)
+api_router.include_router(admin_router)
+api_router.include_router(jobs_router)
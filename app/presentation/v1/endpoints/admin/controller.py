@@ -0,0 +1,51 @@
+from dataclasses import asdict
+from typing import Dict, List, Union
+from app.core.config.runtime import RuntimeConfigStore
+from app.core.profiling.store import ProfileRecord, ProfileStore
+from app.infrastructure.shared.async_sqlite_pool import AsyncSqlitePool
+from app.infrastructure.shared.caching_port import AsyncCachingPort, CachingPort
+from app.presentation.shared.errors import AppError
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.v1.schemas.cache_response import CacheStatsResponse
+from app.presentation.v1.schemas.pool_response import PoolStatsResponse
+from app.presentation.v1.schemas.profile_response import ProfileDetailResponse, ProfileSummaryResponse
+from app.presentation.v1.schemas.runtime_config_response import RuntimeConfigResponse
+
+class AdminController:
+    def __init__(self, store: ProfileStore) -> None:
+        self._store = store
+
+    @staticmethod
+    def _summary(record: ProfileRecord) -> ProfileSummaryResponse:
+        data = asdict(record)
+        data.pop("stats")
+        return ProfileSummaryResponse(**data, has_stats=record.stats is not None)
+
+    def list_profiles(self) -> HttpResponse[List[ProfileSummaryResponse]]:
+        data = [self._summary(r) for r in self._store.list()]
+        return HttpResponse[List[ProfileSummaryResponse]](success=True, data=data)
+
+    def get_profile(self, identifier: str) -> HttpResponse[ProfileDetailResponse]:
+        record = self._store.get(identifier)
+        if record is None:
+            raise AppError(f"Perfil '{identifier}' não encontrado", status_code=404)
+        data = ProfileDetailResponse(**asdict(record), has_stats=record.stats is not None)
+        return HttpResponse[ProfileDetailResponse](success=True, data=data)
+
+    def clear_profiles(self) -> HttpResponse[None]:
+        self._store.clear()
+        return HttpResponse[None](success=True, data=None)
+
+    @staticmethod
+    def runtime_config(store: RuntimeConfigStore) -> HttpResponse[RuntimeConfigResponse]:
+        return HttpResponse[RuntimeConfigResponse](success=True, data=RuntimeConfigResponse(**store.stats()))
+
+    @staticmethod
+    def pool_stats(pools: Dict[str, AsyncSqlitePool]) -> HttpResponse[List[PoolStatsResponse]]:
+        data = [PoolStatsResponse(path=path, **pool.stats()) for path, pool in pools.items()]
+        return HttpResponse[List[PoolStatsResponse]](success=True, data=data)
+
+    @staticmethod
+    def cache_stats(caches: Dict[str, Union[CachingPort, AsyncCachingPort]]) -> HttpResponse[List[CacheStatsResponse]]:
+        data = [CacheStatsResponse(**cache.stats()) for cache in caches.values()]
+        return HttpResponse[List[CacheStatsResponse]](success=True, data=data)
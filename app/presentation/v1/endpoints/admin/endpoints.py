@@ -0,0 +1,102 @@
+from typing import List
+from fastapi import APIRouter, Depends, Path
+from dependency_injector.wiring import Provide, inject
+from app.core.admission.controller import admission_controller
+from app.core.config.runtime import runtime_config
+from app.core.di.container import Container
+from app.core.profiling.store import profile_store
+from app.core.security.api_key import admin_api_key_auth
+from app.infrastructure.shared.async_sqlite_pool import open_pools
+from app.infrastructure.shared.caching_port import open_caches
+from app.infrastructure.shared.job_runner import JobRunner
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.routing import AppRoute
+from app.presentation.v1.endpoints.admin.controller import AdminController
+from app.presentation.v1.endpoints.health.controller import HealthController
+from app.presentation.v1.endpoints.jobs.controller import JobsController
+from app.presentation.v1.schemas.admission_response import AdmissionStatsResponse
+from app.presentation.v1.schemas.cache_response import CacheStatsResponse
+from app.presentation.v1.schemas.job_response import JobStatsResponse
+from app.presentation.v1.schemas.pool_response import PoolStatsResponse
+from app.presentation.v1.schemas.profile_response import ProfileDetailResponse, ProfileSummaryResponse
+from app.presentation.v1.schemas.runtime_config_response import RuntimeConfigResponse
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    route_class=AppRoute,
+    dependencies=[Depends(admin_api_key_auth)],
+)
+
+@router.get(
+    "/profiles",
+    response_model=HttpResponse[List[ProfileSummaryResponse]],
+    summary="Perfis de requisições capturados (mais recentes primeiro)",
+    status_code=200,
+)
+def list_profiles():
+    return AdminController(profile_store).list_profiles()
+
+@router.get(
+    "/profiles/{identifier}",
+    response_model=HttpResponse[ProfileDetailResponse],
+    summary="Detalhe de um perfil, com saída do cProfile",
+    status_code=200,
+)
+def get_profile(identifier: str = Path(..., description="ID do perfil")):
+    return AdminController(profile_store).get_profile(identifier)
+
+@router.delete(
+    "/profiles",
+    response_model=HttpResponse[None],
+    summary="Limpa o buffer de perfis",
+    status_code=200,
+)
+def clear_profiles():
+    return AdminController(profile_store).clear_profiles()
+
+@router.get(
+    "/jobs",
+    response_model=HttpResponse[JobStatsResponse],
+    summary="Métricas do pool de jobs (fila, rejeições, tempos médios)",
+    status_code=200,
+)
+@inject
+def job_stats(runner: JobRunner = Depends(Provide[Container.job_runner])):
+    return JobsController(runner).stats()
+
+@router.get(
+    "/pool",
+    response_model=HttpResponse[List[PoolStatsResponse]],
+    summary="Pools aiosqlite deste worker (conexões, fila de espera, timeouts)",
+    status_code=200,
+)
+def pool_stats():
+    return AdminController.pool_stats(open_pools())
+
+@router.get(
+    "/cache",
+    response_model=HttpResponse[List[CacheStatsResponse]],
+    summary="Caches read-through deste worker (hits, misses, invalidações)",
+    status_code=200,
+)
+def cache_stats():
+    return AdminController.cache_stats(open_caches())
+
+@router.get(
+    "/admission",
+    response_model=HttpResponse[AdmissionStatsResponse],
+    summary="Controle de admissão deste worker (em andamento, fila, descartes)",
+    status_code=200,
+)
+def admission_stats():
+    return HealthController.admission_stats(admission_controller)
+
+@router.get(
+    "/config",
+    response_model=HttpResponse[RuntimeConfigResponse],
+    summary="Snapshot de configuração em vigor neste worker (versão, recargas)",
+    status_code=200,
+)
+def runtime_config_stats():
+    return AdminController.runtime_config(runtime_config)
@@ -1,4 +1,7 @@
+from app.core.admission.controller import AdmissionController
+from app.presentation.v1.schemas.admission_response import AdmissionStatsResponse, ReadinessResponse
 from app.presentation.v1.schemas.health_response import HealthResponse
+from app.presentation.shared.errors import AppError
 from app.presentation.shared.http_response import HttpResponse
 from app.application.health.use_cases.check_health import CheckHealthUseCase
 from app.application.health.mappers.health_status_mapper import HealthStatusMapper
@@ -12,3 +15,15 @@ class HealthController:
         dto = HealthStatusMapper.to_dto(entity)
         response = HealthResponse(status=dto.status)
         return HttpResponse[HealthResponse](success=True, data=response)
+
+    @staticmethod
+    def ready(admission: AdmissionController) -> HttpResponse[ReadinessResponse]:
+        if not admission.ready:
+            # Drenando para o shutdown: o balanceador deixa de enviar tráfego
+            raise AppError("Worker em drenagem", status_code=503)
+        data = ReadinessResponse(status="ready", in_flight=admission.in_flight)
+        return HttpResponse[ReadinessResponse](success=True, data=data)
+
+    @staticmethod
+    def admission_stats(admission: AdmissionController) -> HttpResponse[AdmissionStatsResponse]:
+        return HttpResponse[AdmissionStatsResponse](success=True, data=AdmissionStatsResponse(**admission.stats()))
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends
 from dependency_injector.wiring import Provide, inject
+from app.core.admission.controller import admission_controller
 from app.presentation.shared.http_response import HttpResponse
+from app.presentation.v1.schemas.admission_response import ReadinessResponse
 from app.presentation.v1.schemas.health_response import HealthResponse
 from app.presentation.v1.endpoints.health.controller import HealthController
 from app.application.health.use_cases.check_health import CheckHealthUseCase
 from app.core.di.container import Container
 from app.core.security.api_key import api_key_auth
+from app.core.profiling.timings import phase
+from app.presentation.shared.routing import AppRoute
 
-router = APIRouter(tags=["health"])
+router = APIRouter(tags=["health"], route_class=AppRoute)
 
 @router.get(
     "/health",
@@ -20,5 +24,16 @@ def get_health(
     uc: CheckHealthUseCase = Depends(Provide[Container.check_health_uc]),
     _: None = Depends(api_key_auth),
 ):
-    controller = HealthController(uc)
-    return controller.get()
+    with phase("controller"):
+        controller = HealthController(uc)
+        return controller.get()
+
+@router.get(
+    "/ready",
+    response_model=HttpResponse[ReadinessResponse],
+    summary="Readiness: 503 enquanto o worker drena para o shutdown",
+    status_code=200,
+)
+def get_ready():
+    # Sem API key: consultada pelo balanceador/orquestrador
+    return HealthController.ready(admission_controller)
@@ -0,0 +1,69 @@
+import re
+
+from fastapi import Request
+from starlette import status
+from app.infrastructure.shared.job_runner import JobRecord, JobRunner
+from app.presentation.shared.errors import AppError
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.negotiation import NegotiatedResponse
+from app.presentation.v1.schemas.job_response import JobResponse, JobStatsResponse
+
+# <owner>-<uuid>, gerado por JobRunner
+_JOB_ID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{32}$")
+
+class JobsController:
+    def __init__(self, runner: JobRunner) -> None:
+        self._runner = runner
+
+    @staticmethod
+    def to_response(record: JobRecord) -> JobResponse:
+        return JobResponse(
+            id=record.id,
+            name=record.name,
+            status=record.status,
+            submitted_at=record.submitted_at,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            queue_ms=record.queue_ms,
+            run_ms=record.run_ms,
+            result=record.result,
+            error=record.error,
+        )
+
+    @staticmethod
+    def accepted(request: Request, record: JobRecord) -> NegotiatedResponse:
+        """
+        Resposta do modo assíncrono: 202 com Location apontando para o status.
+        """
+        body = HttpResponse[JobResponse](success=True, data=JobsController.to_response(record))
+        return NegotiatedResponse(
+            body.model_dump(mode="json"),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": str(request.url_for("get_job", identifier=record.id))},
+        )
+
+    def _record(self, identifier: str) -> JobRecord:
+        record = self._runner.get(identifier)
+        if record is not None:
+            return record
+        if _JOB_ID.match(identifier) and not self._runner.owns(identifier):
+            # Registros vivem no worker que criou o job: exige roteamento sticky
+            raise AppError(
+                f"Job '{identifier}' pertence a outro worker (ou a um worker reiniciado); "
+                "consulte pelo mesmo worker que o criou",
+                status_code=status.HTTP_421_MISDIRECTED_REQUEST,
+            )
+        raise AppError(f"Job '{identifier}' não encontrado", status_code=status.HTTP_404_NOT_FOUND)
+
+    def get(self, identifier: str) -> HttpResponse[JobResponse]:
+        record = self._record(identifier)
+        return HttpResponse[JobResponse](success=True, data=self.to_response(record))
+
+    def cancel(self, identifier: str) -> HttpResponse[JobResponse]:
+        record = self._record(identifier)
+        if not self._runner.cancel(identifier) and record.status != "cancelled":
+            raise AppError(f"Job '{identifier}' já em execução ou concluído", status_code=status.HTTP_409_CONFLICT)
+        return HttpResponse[JobResponse](success=True, data=self.to_response(record))
+
+    def stats(self) -> HttpResponse[JobStatsResponse]:
+        return HttpResponse[JobStatsResponse](success=True, data=JobStatsResponse(**self._runner.stats()))
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Path
+from dependency_injector.wiring import Provide, inject
+from app.core.di.container import Container
+from app.core.security.api_key import api_key_auth
+from app.infrastructure.shared.job_runner import JobRunner
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.routing import AppRoute
+from app.presentation.v1.endpoints.jobs.controller import JobsController
+from app.presentation.v1.schemas.job_response import JobResponse
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    route_class=AppRoute,
+    dependencies=[Depends(api_key_auth)],
+)
+
+@router.get(
+    "/{identifier}",
+    response_model=HttpResponse[JobResponse],
+    summary="Status, tempos e resultado de um job assíncrono",
+    status_code=200,
+    name="get_job",
+)
+@inject
+def get_job(
+    identifier: str = Path(..., description="ID do job"),
+    runner: JobRunner = Depends(Provide[Container.job_runner]),
+):
+    return JobsController(runner).get(identifier)
+
+@router.delete(
+    "/{identifier}",
+    response_model=HttpResponse[JobResponse],
+    summary="Cancela um job ainda na fila",
+    status_code=200,
+)
+@inject
+def cancel_job(
+    identifier: str = Path(..., description="ID do job"),
+    runner: JobRunner = Depends(Provide[Container.job_runner]),
+):
+    return JobsController(runner).cancel(identifier)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+class ReadinessResponse(BaseModel):
+    status: str = Field(..., description="'ready'; em drenagem a rota responde 503")
+    in_flight: int = Field(..., description="Requisições em andamento neste worker")
+
+class AdmissionStatsResponse(BaseModel):
+    ready: bool
+    in_flight: int
+    queue_length: int = Field(..., description="Requisições esperando vaga agora")
+    max_concurrency: int
+    max_queue: int
+    admitted_total: int
+    queued_total: int = Field(..., description="Admitidas ou descartadas após esperar na fila")
+    shed_total: int = Field(..., description="Descartadas com 503")
+    shed_queue_full_total: int
+    shed_timeout_total: int = Field(..., description="Descartadas por exceder o tempo de fila adaptativo")
+    avg_queue_ms: float = Field(..., description="Espera média das que passaram pela fila")
+    max_queue_ms: float
+    overloaded: bool = Field(..., description="Fila sem esvaziar há mais de admission_interval_ms")
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+class CacheStatsResponse(BaseModel):
+    namespace: str
+    shared: bool = Field(..., description="Invalidação compartilhada entre workers (CACHE_INVALIDATION_DIR)")
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int = Field(..., description="Removidas por LRU")
+    invalidations: int = Field(..., description="Removidas por escrita (local ou de outro worker)")
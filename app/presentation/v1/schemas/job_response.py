@@ -0,0 +1,26 @@
+from typing import Any, Optional
+from pydantic import BaseModel, Field
+
+class JobResponse(BaseModel):
+    id: str = Field(..., description="Identificador do job")
+    name: str
+    status: str = Field(..., description="queued, running, succeeded, failed ou cancelled")
+    submitted_at: float = Field(..., description="Epoch (s) da submissão")
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    queue_ms: Optional[float] = Field(None, description="Tempo na fila até um processo assumir")
+    run_ms: Optional[float] = Field(None, description="Tempo de execução no processo filho")
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+class JobStatsResponse(BaseModel):
+    max_workers: int
+    max_pending: int
+    pending: int = Field(..., description="Jobs na fila + em execução")
+    submitted_total: int
+    succeeded_total: int
+    failed_total: int
+    cancelled_total: int
+    rejected_total: int = Field(..., description="Recusados com 503 (fila cheia)")
+    avg_queue_ms: float
+    avg_run_ms: float
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+class PoolStatsResponse(BaseModel):
+    path: str = Field(..., description="Arquivo SQLite do pool")
+    max_size: int
+    size: int = Field(..., description="Conexões abertas")
+    in_use: int
+    idle: int
+    queue_depth: int = Field(..., description="Corrotinas esperando conexão agora")
+    max_queue_depth: int = Field(..., description="Maior fila observada desde a abertura")
+    acquired_total: int
+    timeouts_total: int = Field(..., description="Esperas que excederam o acquire_timeout (503)")
+    rejected_total: int = Field(..., description="Recusadas com a fila cheia (503)")
+    avg_wait_ms: float = Field(..., description="Espera média por conexão")
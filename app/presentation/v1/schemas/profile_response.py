@@ -0,0 +1,16 @@
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+class ProfileSummaryResponse(BaseModel):
+    id: str = Field(..., description="Identificador do perfil")
+    method: str
+    path: str
+    status: int
+    request_id: Optional[str] = None
+    started_at: float = Field(..., description="Epoch (s) do início da requisição")
+    total_ms: float
+    phases: Dict[str, float] = Field(default_factory=dict, description="Duração por fase (ms)")
+    has_stats: bool = Field(False, description="Há cProfile capturado")
+
+class ProfileDetailResponse(ProfileSummaryResponse):
+    stats: Optional[str] = Field(None, description="Saída do pstats ordenada por tempo cumulativo")
@@ -0,0 +1,13 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+class RuntimeConfigResponse(BaseModel):
+    version: int = Field(..., description="Incrementada a cada recarga aceita neste worker")
+    loaded_at: float = Field(..., description="Epoch da montagem do snapshot em vigor")
+    path: str = Field(..., description="Arquivo relido no SIGHUP ou quando muda")
+    reloads_total: int
+    failures_total: int = Field(..., description="Recargas rejeitadas na validação (snapshot anterior mantido)")
+    auth_enabled: bool
+    api_keys_count: int
+    hsts_enabled: bool
+    cors_origins: List[str]
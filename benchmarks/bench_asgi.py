@@ -0,0 +1,48 @@
+"""
+Micro-benchmarks in-process: requisições via httpx ASGITransport (como os
+testes), sem rede nem servidor.
+
+    python -m benchmarks.bench_asgi --iterations 2000
+"""
+import argparse
+import asyncio
+import json
+from typing import Dict, List
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.di.container import Container
+from benchmarks.harness import BenchResult, measure_async
+
+async def run(iterations: int = 2000) -> List[BenchResult]:
+    from app.main import app
+
+    # Mesma inicialização do conftest: instanciar o Container faz o wiring dos endpoints
+    container = Container()
+    container.init_resources()
+    results = []
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            async def health() -> None:
+                resp = await client.get("/api/v1/health")
+                assert resp.status_code == 200
+
+            async def not_found() -> None:
+                await client.get("/api/v1/__missing__")
+
+            results.append(await measure_async("asgi.health", health, iterations))
+            results.append(await measure_async("asgi.not_found", not_found, iterations))
+    finally:
+        container.shutdown_resources()
+        container.unwire()
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    results: Dict[str, dict] = {r.name: r.to_dict() for r in asyncio.run(run(args.iterations))}
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
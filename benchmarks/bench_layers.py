@@ -0,0 +1,82 @@
+"""
+Custo por camada do endpoint /api/v1/health:
+- middleware: pilha de middlewares do app sobre uma rota trivial vs. app sem middlewares;
+- di: resolução do use case no Container;
+- controller: HealthController.get() (use case + mapper + envelope);
+- serialization: validação/serialização do response_model + JSON, como o FastAPI faz.
+
+    python -m benchmarks.bench_layers --iterations 5000
+"""
+import argparse
+import asyncio
+import json
+from typing import Dict, List
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+from starlette.responses import PlainTextResponse
+
+from app.core.di.container import Container
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.v1.endpoints.health.controller import HealthController
+from app.presentation.v1.schemas.health_response import HealthResponse
+from benchmarks.harness import BenchResult, measure, measure_async
+
+def _ping_app(with_middlewares: bool) -> FastAPI:
+    from app.main import add_middlewares
+
+    app = FastAPI()
+    app.add_route("/ping", lambda request: PlainTextResponse("ok"))
+    if with_middlewares:
+        add_middlewares(app)
+    return app
+
+async def _bench_middleware(iterations: int) -> List[BenchResult]:
+    results = []
+    for name, with_mw in (("layers.bare_app", False), ("layers.middleware_stack", True)):
+        app = _ping_app(with_mw)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            async def ping() -> None:
+                await client.get("/ping")
+
+            results.append(await measure_async(name, ping, iterations))
+    return results
+
+def _bench_in_process(iterations: int) -> List[BenchResult]:
+    container = Container()
+    container.init_resources()
+    try:
+        uc = container.check_health_uc()
+        controller_result = HealthController(uc).get()
+        adapter = TypeAdapter(HttpResponse[HealthResponse])
+
+        def serialize() -> bytes:
+            value = adapter.validate_python(controller_result)
+            content = adapter.dump_python(value, mode="json")
+            return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        return [
+            measure("layers.di_resolve", container.check_health_uc, iterations),
+            measure("layers.controller", lambda: HealthController(uc).get(), iterations),
+            measure("layers.serialization", serialize, iterations),
+            measure("layers.serialization_model_dump_json", controller_result.model_dump_json, iterations),
+        ]
+    finally:
+        container.shutdown_resources()
+        container.unwire()
+
+async def run(iterations: int = 5000) -> List[BenchResult]:
+    results = await _bench_middleware(max(iterations // 5, 200))
+    results.extend(_bench_in_process(iterations))
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    results: Dict[str, dict] = {r.name: r.to_dict() for r in asyncio.run(run(args.iterations))}
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Cenário ponta a ponta: sobe o gunicorn com gunicorn_conf.py em uma porta local
+e dispara carga com um gerador assíncrono (httpx), sem dependências externas.
+
+    python -m benchmarks.bench_load --workers 2 --concurrency 32 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.harness import summarize
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def spawn_server(cmd: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    # stderr num arquivo: um PIPE sem leitor enche com os logs e trava o worker sob carga
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log)
+    proc.log = log
+    return proc
+
+def start_gunicorn(port: int, workers: int, extra_env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    env = {**os.environ, "GUNICORN_WORKERS": str(workers), **(extra_env or {})}
+    cmd = [
+        sys.executable, "-m", "gunicorn",
+        "-c", str(ROOT / "gunicorn_conf.py"),
+        "--bind", f"127.0.0.1:{port}",
+        "--access-logfile", "/dev/null",
+        "app.main:app",
+    ]
+    return spawn_server(cmd, env)
+
+def wait_ready(base_url: str, path: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            proc.log.seek(0)
+            raise RuntimeError(f"servidor encerrou ao iniciar:\n{proc.log.read().decode(errors='replace')}")
+        try:
+            if httpx.get(base_url + path, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{base_url}{path} não respondeu em {timeout}s")
+
+def stop(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    proc.log.close()
+
+async def generate_load(
+    base_url: str,
+    path: str,
+    concurrency: int,
+    duration: float,
+    http2: bool = False,
+    connections: Optional[int] = None,
+) -> dict:
+    """
+    `concurrency` usuários em loop fechado. Com `http2`, fala h2c (prior
+    knowledge) e multiplexa os usuários em `connections` conexões.
+    """
+    latencies: List[float] = []
+    errors = 0
+    statuses: Dict[int, int] = {}
+    connections = connections or concurrency
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30.0, http1=not http2, http2=http2
+    ) as client:
+        async def user() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                try:
+                    resp = await client.get(path)
+                    statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    result = summarize(f"load{path}", latencies, elapsed).to_dict()
+    result.update({
+        "concurrency": concurrency,
+        "connections": connections,
+        "errors": errors,
+        "statuses": {str(k): v for k, v in statuses.items()},
+    })
+    return result
+
+def run(
+    workers: int = 2,
+    concurrency: int = 32,
+    duration: float = 10.0,
+    paths: Optional[List[str]] = None,
+    extra_env: Optional[Dict[str, str]] = None,
+) -> Dict[str, dict]:
+    paths = paths or ["/api/v1/health"]
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc = start_gunicorn(port, workers, extra_env)
+    try:
+        wait_ready(base_url, paths[0], proc)
+        results = {}
+        for path in paths:
+            results[f"load.{path.strip('/').replace('/', '.')}"] = asyncio.run(
+                generate_load(base_url, path, concurrency, duration)
+            )
+        return results
+    finally:
+        stop(proc)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--path", action="append", dest="paths", help="Rota a exercitar (repetível)")
+    args = parser.parse_args()
+    print(json.dumps(run(args.workers, args.concurrency, args.duration, args.paths), indent=2))
+
+if __name__ == "__main__":
+    main()
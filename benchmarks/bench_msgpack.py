@@ -0,0 +1,93 @@
+"""
+JSON vs MessagePack no envelope HttpResponse:
+- tamanho do payload para uma lista de itens;
+- encode/decode isolados (mesmas opções do JSONResponse do Starlette);
+- ponta a ponta via ASGI numa rota AppRoute, variando só o Accept.
+
+    python -m benchmarks.bench_msgpack --iterations 2000 --items 100
+"""
+import argparse
+import asyncio
+import json
+from typing import Dict, List, Optional
+
+import msgpack
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.routing import AppRoute
+from benchmarks.harness import BenchResult, measure, measure_async
+
+class Item(BaseModel):
+    id: Optional[str] = None
+    title: str
+    pages: int
+    price: float
+    published: bool
+
+def _payload(items: int) -> dict:
+    data = [
+        Item(id=f"{i:032x}", title=f"Livro {i}", pages=100 + i, price=9.9 + i, published=i % 2 == 0)
+        for i in range(items)
+    ]
+    return HttpResponse[List[Item]](success=True, data=data).model_dump(mode="json")
+
+def _json_dumps(content: dict) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def _bench_codec(content: dict, iterations: int) -> List[BenchResult]:
+    as_json = _json_dumps(content)
+    as_msgpack = msgpack.packb(content, use_bin_type=True)
+    return [
+        measure("msgpack.json_encode", lambda: _json_dumps(content), iterations),
+        measure("msgpack.json_decode", lambda: json.loads(as_json), iterations),
+        measure("msgpack.msgpack_encode", lambda: msgpack.packb(content, use_bin_type=True), iterations),
+        measure("msgpack.msgpack_decode", lambda: msgpack.unpackb(as_msgpack, raw=False), iterations),
+    ]
+
+async def _bench_asgi(content: dict, iterations: int) -> List[BenchResult]:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.get("/items", response_model=HttpResponse[List[Item]])
+    async def items():
+        return content
+
+    app = FastAPI()
+    app.include_router(router)
+    results = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for name, accept in (("msgpack.asgi_json", "application/json"), ("msgpack.asgi_msgpack", "application/msgpack")):
+            async def get() -> None:
+                resp = await client.get("/items", headers={"Accept": accept})
+                assert resp.headers["content-type"] == accept
+
+            results.append(await measure_async(name, get, iterations))
+    return results
+
+async def run(iterations: int = 2000, items: int = 100) -> Dict[str, dict]:
+    content = _payload(items)
+    json_bytes = len(_json_dumps(content))
+    msgpack_bytes = len(msgpack.packb(content, use_bin_type=True))
+    results: Dict[str, dict] = {
+        "msgpack.payload_size": {
+            "items": items,
+            "json_bytes": json_bytes,
+            "msgpack_bytes": msgpack_bytes,
+            "ratio": round(msgpack_bytes / json_bytes, 3),
+        }
+    }
+    results.update({r.name: r.to_dict() for r in _bench_codec(content, iterations)})
+    results.update({r.name: r.to_dict() for r in await _bench_asgi(content, max(iterations // 5, 200))})
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.iterations, args.items)), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compara os perfis de servidor (SERVER_PROFILE) ponta a ponta, com a mesma
+carga em /api/v1/health e nas rotas GET de coleção geradas pelo cocli:
+- standard: gunicorn + UvicornWorker com loop/parser "auto";
+- strict: gunicorn + uvloop/httptools obrigatórios;
+- http2: hypercorn, com o cliente multiplexando h2c em poucas conexões.
+
+    python -m benchmarks.bench_server --workers 2 --concurrency 64 --duration 10
+    python -m benchmarks.bench_server --profile strict --profile http2 --path /api/v1/books
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from benchmarks.bench_load import ROOT, _free_port, generate_load, spawn_server, start_gunicorn, stop, wait_ready
+
+PROFILES = ("standard", "strict", "http2")
+
+def discover_paths() -> List[str]:
+    """
+    Health + rotas GET sem parâmetros de path das features (AppRoute), o que
+    inclui as coleções geradas pelo cocli; admin fica de fora.
+    """
+    from app.main import app
+    from app.presentation.shared.routing import AppRoute
+
+    return [
+        route.path
+        for route in app.routes
+        if isinstance(route, AppRoute) and "GET" in route.methods
+        and "{" not in route.path and "/admin" not in route.path
+    ]
+
+def start_hypercorn(port: int, workers: int, extra_env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "GUNICORN_WORKERS": str(workers),
+        "HYPERCORN_BIND": f"127.0.0.1:{port}",
+        **(extra_env or {}),
+    }
+    cmd = [sys.executable, "-m", "hypercorn", "--config", f"file:{ROOT / 'hypercorn_conf.py'}", "app.main:app"]
+    return spawn_server(cmd, env)
+
+def run(
+    profiles: Optional[List[str]] = None,
+    workers: int = 2,
+    concurrency: int = 64,
+    duration: float = 10.0,
+    paths: Optional[List[str]] = None,
+    h2_connections: int = 4,
+) -> Dict[str, dict]:
+    paths = paths or discover_paths()
+    results: Dict[str, dict] = {}
+    for profile in profiles or PROFILES:
+        env = {"SERVER_PROFILE": profile}
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        http2 = profile == "http2"
+        proc = start_hypercorn(port, workers, env) if http2 else start_gunicorn(port, workers, env)
+        try:
+            wait_ready(base_url, paths[0], proc)
+            for path in paths:
+                result = asyncio.run(generate_load(
+                    base_url, path, concurrency, duration,
+                    http2=http2, connections=h2_connections if http2 else None,
+                ))
+                results[f"server.{profile}.{path.strip('/').replace('/', '.')}"] = result
+        finally:
+            stop(proc)
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", action="append", dest="profiles", choices=PROFILES, help="Perfil (repetível)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--path", action="append", dest="paths", help="Rota a exercitar (repetível)")
+    parser.add_argument("--h2-connections", type=int, default=4, help="Conexões h2c no perfil http2")
+    args = parser.parse_args()
+    print(json.dumps(
+        run(args.profiles, args.workers, args.concurrency, args.duration, args.paths, args.h2_connections),
+        indent=2,
+    ))
+
+if __name__ == "__main__":
+    main()
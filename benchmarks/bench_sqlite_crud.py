@@ -0,0 +1,124 @@
+"""
+Throughput de CRUD no SQLite sob threads concorrentes (como o threadpool dos
+workers gunicorn/uvicorn executa endpoints síncronos).
+
+    python -m benchmarks.bench_sqlite_crud --threads 8 --ops 2000
+"""
+import argparse
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import uuid4
+
+from app.infrastructure.shared.sqlite_pool import SqliteConnectionPool
+
+SCHEMA = 'CREATE TABLE IF NOT EXISTS "item" ("id" TEXT PRIMARY KEY, "name" TEXT NOT NULL, "qty" INTEGER NOT NULL)'
+INDEX = 'CREATE INDEX IF NOT EXISTS "ix_item_name" ON "item" ("name")'
+INSERT = 'INSERT INTO "item" ("id", "name", "qty") VALUES (?, ?, ?)'
+SELECT_ONE = 'SELECT "id", "name", "qty" FROM "item" WHERE "id" = ?'
+UPSERT = 'INSERT INTO "item" ("id", "name", "qty") VALUES (?, ?, ?) ON CONFLICT("id") DO UPDATE SET "name" = excluded."name", "qty" = excluded."qty"'
+DELETE = 'DELETE FROM "item" WHERE "id" = ?'
+
+def _crud_cycle(pool: SqliteConnectionPool, lock: Optional[threading.Lock]) -> None:
+    identifier = uuid4().hex
+
+    def run(sql: str, params: tuple, write: bool) -> None:
+        if lock is not None:
+            with lock:
+                _exec(pool, sql, params, write)
+        else:
+            _exec(pool, sql, params, write)
+
+    run(INSERT, (identifier, "n", 1), True)
+    run(SELECT_ONE, (identifier,), False)
+    run(UPSERT, (identifier, "m", 2), True)
+    run(DELETE, (identifier,), True)
+
+def _exec(pool: SqliteConnectionPool, sql: str, params: tuple, write: bool) -> None:
+    if write:
+        with pool.transaction() as conn:
+            conn.execute(sql, params)
+    else:
+        pool.connection().execute(sql, params).fetchone()
+
+def bench_concurrent(path: str, threads: int, ops: int, shared: bool) -> dict:
+    """
+    shared=True simula o antipadrão de uma única conexão protegida por lock.
+    """
+    pool = SqliteConnectionPool(path)
+    with pool.transaction() as conn:
+        conn.execute(SCHEMA)
+        conn.execute(INDEX)
+    lock = threading.Lock() if shared else None
+    target = pool if not shared else _SingleConnectionPool(pool)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for f in [executor.submit(_crud_cycle, target, lock) for _ in range(ops)]:
+            f.result()
+    elapsed = time.perf_counter() - started
+    pool.close()
+    return {
+        "mode": "single_connection" if shared else "per_thread_pool",
+        "threads": threads,
+        "cycles": ops,
+        "seconds": round(elapsed, 4),
+        "cycles_per_sec": round(ops / elapsed, 1),
+    }
+
+def bench_bulk(path: str, rows: int) -> dict:
+    pool = SqliteConnectionPool(path)
+    with pool.transaction() as conn:
+        conn.execute(SCHEMA)
+    payload = [(uuid4().hex, f"n{i}", i) for i in range(rows)]
+
+    started = time.perf_counter()
+    for row in payload[: rows // 2]:
+        with pool.transaction() as conn:
+            conn.execute(INSERT, row)
+    loop_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with pool.transaction() as conn:
+        conn.executemany(INSERT, payload[rows // 2 :])
+    many_elapsed = time.perf_counter() - started
+    pool.close()
+    half = rows // 2
+    return {
+        "rows": half,
+        "insert_loop_rows_per_sec": round(half / loop_elapsed, 1),
+        "executemany_rows_per_sec": round((rows - half) / many_elapsed, 1),
+    }
+
+class _SingleConnectionPool:
+    def __init__(self, pool: SqliteConnectionPool) -> None:
+        self._conn = pool.connection()
+
+    def connection(self):
+        return self._conn
+
+    def transaction(self):
+        return self._conn
+
+def run(threads: int = 8, ops: int = 2000, rows: int = 20000) -> Dict[str, dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        return {
+            "sqlite.crud_per_thread_pool": bench_concurrent(str(Path(tmp) / "pool.db"), threads, ops, shared=False),
+            "sqlite.crud_single_connection": bench_concurrent(str(Path(tmp) / "single.db"), threads, ops, shared=True),
+            "sqlite.bulk_insert": bench_bulk(str(Path(tmp) / "bulk.db"), rows),
+        }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.threads, args.ops, args.rows), indent=2))
+
+if __name__ == "__main__":
+    main()
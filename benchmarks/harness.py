@@ -0,0 +1,70 @@
+"""
+Utilitários de medição compartilhados pelas suítes de benchmark.
+"""
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, List
+
+@dataclass
+class BenchResult:
+    name: str
+    iterations: int
+    seconds: float
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+
+    def to_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data.pop("name")
+        return data
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+def summarize(name: str, samples: List[float], elapsed: float) -> BenchResult:
+    """
+    `samples` em segundos por operação; `elapsed` é o tempo de parede total.
+    """
+    ordered = sorted(samples)
+    to_us = 1_000_000
+    return BenchResult(
+        name=name,
+        iterations=len(samples),
+        seconds=round(elapsed, 4),
+        ops_per_sec=round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        mean_us=round(statistics.fmean(ordered) * to_us, 2) if ordered else 0.0,
+        p50_us=round(_percentile(ordered, 50) * to_us, 2),
+        p95_us=round(_percentile(ordered, 95) * to_us, 2),
+        p99_us=round(_percentile(ordered, 99) * to_us, 2),
+    )
+
+def measure(name: str, fn: Callable[[], object], iterations: int, warmup: int = 50) -> BenchResult:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    perf = time.perf_counter
+    started = perf()
+    for _ in range(iterations):
+        t0 = perf()
+        fn()
+        samples.append(perf() - t0)
+    return summarize(name, samples, perf() - started)
+
+async def measure_async(name: str, fn: Callable[[], Awaitable[object]], iterations: int, warmup: int = 50) -> BenchResult:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    perf = time.perf_counter
+    started = perf()
+    for _ in range(iterations):
+        t0 = perf()
+        await fn()
+        samples.append(perf() - t0)
+    return summarize(name, samples, perf() - started)
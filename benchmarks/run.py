@@ -0,0 +1,128 @@
+"""
+Executa as suítes de benchmark, grava resultados em JSON e compara com um
+baseline salvo (falha com código 1 se houver regressão acima da tolerância).
+
+    python -m benchmarks.run --suite asgi,layers --output bench_output.json
+    python -m benchmarks.run --suite asgi,layers --save-baseline
+    python -m benchmarks.run --suite asgi,layers,load,sqlite --baseline benchmarks/baseline.json --tolerance 0.15
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+SUITES = ("asgi", "layers", "load", "sqlite", "msgpack", "server")
+
+# Métricas comparadas com o baseline e o sentido de "melhor"
+HIGHER_IS_BETTER = ("ops_per_sec", "cycles_per_sec", "insert_loop_rows_per_sec", "executemany_rows_per_sec")
+LOWER_IS_BETTER = ("p50_us", "p95_us")
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+def run_suites(suites: List[str], quick: bool) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    scale = 5 if quick else 1
+    if "asgi" in suites:
+        from benchmarks import bench_asgi
+        results.update({r.name: r.to_dict() for r in asyncio.run(bench_asgi.run(2000 // scale))})
+    if "layers" in suites:
+        from benchmarks import bench_layers
+        results.update({r.name: r.to_dict() for r in asyncio.run(bench_layers.run(5000 // scale))})
+    if "sqlite" in suites:
+        from benchmarks import bench_sqlite_crud
+        results.update(bench_sqlite_crud.run(ops=2000 // scale, rows=20000 // scale))
+    if "msgpack" in suites:
+        from benchmarks import bench_msgpack
+        results.update(asyncio.run(bench_msgpack.run(2000 // scale)))
+    if "load" in suites:
+        from benchmarks import bench_load
+        results.update(bench_load.run(duration=10.0 / scale))
+    if "server" in suites:
+        from benchmarks import bench_server
+        results.update(bench_server.run(duration=10.0 / scale))
+    return results
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[dict]:
+    """
+    Retorna uma linha por métrica comparável; `regression` indica piora acima
+    da tolerância relativa.
+    """
+    rows = []
+    for name, metrics in sorted(current.items()):
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, value in metrics.items():
+            if metric not in HIGHER_IS_BETTER + LOWER_IS_BETTER or not base.get(metric):
+                continue
+            change = (value - base[metric]) / base[metric]
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            rows.append({
+                "benchmark": name,
+                "metric": metric,
+                "baseline": base[metric],
+                "current": value,
+                "change_pct": round(change * 100, 2),
+                "regression": worse > tolerance,
+            })
+    return rows
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", default="asgi,layers", help=f"Suítes separadas por vírgula: {', '.join(SUITES)}")
+    parser.add_argument("--output", type=Path, help="Arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Grava o resultado como novo baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Piora relativa tolerada (0.15 = 15%%)")
+    parser.add_argument("--quick", action="store_true", help="Menos iterações (smoke)")
+    args = parser.parse_args()
+
+    suites = [s.strip() for s in args.suite.split(",") if s.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"Suíte(s) desconhecida(s): {', '.join(sorted(unknown))}")
+
+    results = run_suites(suites, args.quick)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "suites": suites,
+        },
+        "results": results,
+    }
+
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report["comparison"] = compare(results, baseline.get("results", {}), args.tolerance)
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    if args.save_baseline:
+        args.baseline.write_text(payload + "\n", encoding="utf-8")
+        print(f"Baseline gravado em {args.baseline}", file=sys.stderr)
+
+    regressions = [r for r in report.get("comparison", []) if r["regression"]]
+    for r in regressions:
+        print(f"REGRESSÃO {r['benchmark']}.{r['metric']}: {r['baseline']} -> {r['current']} ({r['change_pct']}%)", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,28 @@
 import multiprocessing
 import os
 
+from app.core.config.settings import settings
+from app.core.server.workers import WORKER_CLASSES, require_fast_stack
+
+if settings.server_profile not in WORKER_CLASSES:
+    raise RuntimeError(
+        f"SERVER_PROFILE={settings.server_profile} não roda no gunicorn "
+        f"(perfis: {', '.join(WORKER_CLASSES)}); para http2 use "
+        "`python -m hypercorn --config file:hypercorn_conf.py app.main:app`"
+    )
+if settings.server_profile == "strict":
+    # Falha já no master, antes de subir workers
+    require_fast_stack()
+
 bind = "0.0.0.0:8080"
 workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
 threads = int(os.getenv("GUNICORN_THREADS", "1"))
-worker_class = "uvicorn.workers.UvicornWorker"
-graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+worker_class = WORKER_CLASSES[settings.server_profile]
+# App importado uma vez no master (schema OpenAPI já pronto) e herdado pelos workers
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", settings.server_graceful_timeout))
 timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
-keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", settings.server_keepalive))
+backlog = settings.server_backlog
 accesslog = "-"
 errorlog = "-"
@@ -0,0 +1,33 @@
+"""
+Perfil http2 (SERVER_PROFILE=http2): hypercorn servindo HTTP/1.1 e HTTP/2 na
+mesma porta. Sem TLS, clientes internos falam h2c (prior knowledge ou
+Upgrade) e multiplexam requisições numa única conexão; com CERTFILE/KEYFILE,
+o h2 é negociado via ALPN.
+
+    SERVER_PROFILE=http2 python -m hypercorn --config file:hypercorn_conf.py app.main:app
+"""
+import importlib.util
+import multiprocessing
+import os
+
+from app.core.config.settings import settings
+
+if settings.server_profile != "http2":
+    raise RuntimeError(
+        f"hypercorn_conf.py é o perfil http2 (SERVER_PROFILE={settings.server_profile}); "
+        "os demais perfis rodam com `gunicorn -c gunicorn_conf.py app.main:app`"
+    )
+
+bind = [os.getenv("HYPERCORN_BIND", "0.0.0.0:8080")]
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# uvloop quando instalado; sem ele, o loop asyncio padrão (HYPERCORN_WORKER_CLASS força um dos dois)
+worker_class = os.getenv("HYPERCORN_WORKER_CLASS") or ("uvloop" if importlib.util.find_spec("uvloop") else "asyncio")
+graceful_timeout = float(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", settings.server_graceful_timeout))
+keep_alive_timeout = float(os.getenv("GUNICORN_KEEPALIVE", settings.server_keepalive))
+backlog = settings.server_backlog
+h11_max_incomplete_size = settings.server_h11_max_incomplete_event_size
+h2_max_concurrent_streams = settings.server_h2_max_concurrent_streams
+certfile = os.getenv("CERTFILE") or None
+keyfile = os.getenv("KEYFILE") or None
+accesslog = "-"
+errorlog = "-"
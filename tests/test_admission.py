@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.admission.controller import AdmissionController, AdmissionRejected, admission_controller
+from app.core.config.settings import settings
+from app.core.middleware.admission import AdmissionControlMiddleware
+from app.presentation.shared.errors import AppError, app_error_handler
+from app.presentation.v1.endpoints.health.controller import HealthController
+
+def build_app(controller: AdmissionController, enforce: bool = True) -> FastAPI:
+    router = APIRouter()
+
+    @router.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    @router.get("/api/v1/ready")
+    def ready():
+        return HealthController.ready(controller)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(AppError, app_error_handler)
+    app.add_middleware(AdmissionControlMiddleware, controller=controller, enforce=enforce)
+    return app
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_slots_are_handed_off():
+    controller = AdmissionController(max_concurrency=1, max_queue=1, target_ms=10, interval_ms=200)
+    assert await controller.acquire() == 0.0
+
+    waiter = asyncio.ensure_future(controller.acquire())
+    await asyncio.sleep(0.02)
+    with pytest.raises(AdmissionRejected) as exc:
+        await controller.acquire()  # fila cheia: descarte imediato
+    assert exc.value.retry_after == 1
+    controller.release()
+    assert await waiter > 0.0  # vaga repassada a quem esperava
+    controller.release()
+
+    stats = controller.stats()
+    assert stats["in_flight"] == 0 and stats["queue_length"] == 0
+    assert stats["admitted_total"] == 2 and stats["shed_queue_full_total"] == 1
+    assert stats["avg_queue_ms"] > 0
+
+@pytest.mark.asyncio
+async def test_standing_queue_switches_to_short_target():
+    controller = AdmissionController(max_concurrency=1, max_queue=10, target_ms=10, interval_ms=200)
+    await controller.acquire()  # ocupa a única vaga até o fim
+
+    async def attempt() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire()
+        return loop.time() - started
+
+    # Fila saudável: espera até `interval`
+    waits = [asyncio.ensure_future(attempt())]
+    await asyncio.sleep(0.1)
+    waits.append(asyncio.ensure_future(attempt()))
+    await asyncio.sleep(0.12)
+    # Fila sem esvaziar há mais de `interval`: só tolera `target`
+    late = await attempt()
+    first, second = await asyncio.gather(*waits)
+
+    assert first >= 0.19 and second >= 0.19
+    assert late < 0.1
+    assert controller.stats()["shed_timeout_total"] == 3
+    controller.release()
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_overload_with_503_and_exempts_probes():
+    controller = AdmissionController(max_concurrency=2, max_queue=2, target_ms=5, interval_ms=50)
+    app = build_app(controller)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        responses = await asyncio.gather(*[ac.get("/slow") for _ in range(8)])
+        ready = await ac.get("/api/v1/ready")
+
+    codes = sorted(r.status_code for r in responses)
+    assert codes.count(200) >= 2 and codes.count(503) >= 4
+    shed = next(r for r in responses if r.status_code == 503)
+    assert shed.headers["Retry-After"] == "1"
+    assert shed.json()["error"] == "ServiceUnavailable"
+    assert ready.status_code == 200
+    assert controller.stats()["shed_total"] == codes.count(503)
+
+@pytest.mark.asyncio
+async def test_drain_fails_readiness_and_waits_for_in_flight():
+    controller = AdmissionController(max_concurrency=4, max_queue=4, target_ms=50, interval_ms=500)
+    app = build_app(controller)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        in_flight = asyncio.ensure_future(ac.get("/slow"))
+        await asyncio.sleep(0.02)
+        drain = asyncio.ensure_future(controller.drain(timeout=5))
+        await asyncio.sleep(0)
+        not_ready = await ac.get("/api/v1/ready")
+        assert not drain.done()
+        assert await drain is True
+        assert (await in_flight).status_code == 200
+
+    assert not_ready.status_code == 503
+    assert controller.in_flight == 0
+    controller.start()
+    assert controller.ready
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_in_flight_with_admission_disabled():
+    controller = AdmissionController(max_concurrency=1, max_queue=0, target_ms=5, interval_ms=50)
+    app = build_app(controller, enforce=False)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        # Sem limite: nada é descartado, mas tudo é contado
+        requests = asyncio.gather(*[ac.get("/slow") for _ in range(3)])
+        await asyncio.sleep(0.02)
+        assert controller.in_flight == 3
+        drain = asyncio.ensure_future(controller.drain(timeout=5))
+        await asyncio.sleep(0)
+        assert not drain.done()
+        assert [r.status_code for r in await requests] == [200, 200, 200]
+        assert await drain is True
+    assert controller.stats()["shed_total"] == 0
+    controller.start()
+
+@pytest.mark.asyncio
+async def test_shed_response_carries_cors_and_security_headers(monkeypatch):
+    from app.main import add_middlewares
+
+    monkeypatch.setattr(settings, "admission_enabled", True)
+    monkeypatch.setattr(admission_controller, "_max_concurrency", 0)
+    monkeypatch.setattr(admission_controller, "_max_queue", 0)
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        return []
+
+    add_middlewares(app)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        shed = await ac.get("/items", headers={"Origin": "http://localhost:3000"})
+
+    assert shed.status_code == 503
+    assert shed.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert shed.headers["x-content-type-options"] == "nosniff"
+    assert "x-request-id" in shed.headers
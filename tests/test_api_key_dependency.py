@@ -1,14 +1,14 @@
+from dataclasses import replace
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 
 @pytest.mark.asyncio
 async def test_api_key_required_when_configured(monkeypatch):
-    # ativa API key em runtime
-    from app.core.config import settings as cfg
-    monkeypatch.setattr(cfg.settings, "api_keys", ["secret-key-1"], raising=False)
+    # ativa API key em runtime: a dependência lê o snapshot a cada request
+    from app.core.config.runtime import runtime_config
+    monkeypatch.setattr(runtime_config, "current", replace(runtime_config.current, api_keys=frozenset({"secret-key-1"})))
 
-    # Reimporta app para reavaliar inclusão do router?
-    # Dependência lê settings a cada request, então basta enviar o header.
     from app.main import app
     transport = ASGITransport(app=app)
 
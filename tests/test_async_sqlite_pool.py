@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import replace
+
+import aiosqlite
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.config.runtime import runtime_config
+from app.infrastructure.shared.async_sqlite_pool import AsyncSqlitePool, PoolSaturatedError, init_async_sqlite_pool, open_pools
+from app.presentation.shared.errors import pool_saturated_handler
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connections_and_reports_stats(tmp_path):
+    pool = AsyncSqlitePool(str(tmp_path / "a.db"), max_size=2)
+    async with pool.transaction() as conn:
+        await conn.execute("CREATE TABLE t (x INTEGER)")
+        await conn.execute("INSERT INTO t VALUES (1)")
+    async with pool.acquire() as conn:
+        async with conn.execute("SELECT count(*) FROM t") as cur:
+            assert (await cur.fetchone())[0] == 1
+
+    stats = pool.stats()
+    assert stats["size"] == 1
+    assert stats["acquired_total"] == 2
+    assert stats["in_use"] == 0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_pool_times_out_when_saturated(tmp_path):
+    pool = AsyncSqlitePool(str(tmp_path / "b.db"), max_size=1, acquire_timeout=0.05, retry_after=3)
+    async with pool.acquire():
+        with pytest.raises(PoolSaturatedError) as exc:
+            async with pool.acquire():
+                pass
+    assert exc.value.retry_after == 3
+    assert pool.stats()["timeouts_total"] == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_pool_rejects_when_queue_is_full(tmp_path):
+    pool = AsyncSqlitePool(str(tmp_path / "c.db"), max_size=1, acquire_timeout=1.0, max_waiting=1)
+    async with pool.acquire():
+        waiter = asyncio.create_task(pool.acquire().__aenter__())
+        await asyncio.sleep(0)
+        assert pool.stats()["queue_depth"] == 1
+        with pytest.raises(PoolSaturatedError):
+            async with pool.acquire():
+                pass
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert pool.stats()["rejected_total"] == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_pool_closes_connection_when_pragma_fails(tmp_path, monkeypatch):
+    closed = []
+    original_close = aiosqlite.Connection.close
+
+    async def failing_execute(self, sql, *args, **kwargs):
+        raise aiosqlite.OperationalError("database is locked")
+
+    async def tracking_close(self):
+        closed.append(self)
+        await original_close(self)
+
+    monkeypatch.setattr(aiosqlite.Connection, "execute", failing_execute)
+    monkeypatch.setattr(aiosqlite.Connection, "close", tracking_close)
+    pool = AsyncSqlitePool(str(tmp_path / "d.db"), max_size=1)
+    with pytest.raises(aiosqlite.OperationalError):
+        async with pool.acquire():
+            pass
+    assert len(closed) == 1 and not closed[0]._running
+    assert pool.stats()["size"] == 0
+    monkeypatch.undo()
+    # O slot foi devolvido: a próxima aquisição conecta normalmente
+    async with pool.acquire():
+        pass
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_saturated_pool_maps_to_503_with_retry_after():
+    app = FastAPI()
+    app.add_exception_handler(PoolSaturatedError, pool_saturated_handler)
+
+    @app.get("/busy")
+    async def busy():
+        raise PoolSaturatedError("Pool de conexões saturado (timeout)", retry_after=2)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/busy")
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "2"
+    assert resp.json()["success"] is False
+
+@pytest.mark.asyncio
+async def test_admin_pool_endpoint_reports_open_pools(tmp_path, monkeypatch):
+    from app.main import app
+
+    path = str(tmp_path / "e.db")
+    resource = init_async_sqlite_pool(path, max_size=2)
+    pool = await resource.__anext__()
+    async with pool.acquire():
+        pass
+    monkeypatch.setattr(runtime_config, "current", replace(runtime_config.current, api_keys=frozenset({"secret-key-1"})))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/admin/pool", headers={"X-API-Key": "secret-key-1"})
+    await resource.aclose()
+
+    data = resp.json()["data"]
+    assert resp.status_code == 200
+    assert data[0]["path"] == path
+    assert data[0]["max_size"] == 2 and data[0]["acquired_total"] == 1 and data[0]["queue_depth"] == 0
+    assert path not in open_pools()
@@ -0,0 +1,12 @@
+from benchmarks.run import compare
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"asgi.health": {"ops_per_sec": 1000.0, "p95_us": 100.0, "iterations": 10}}
+    current = {"asgi.health": {"ops_per_sec": 800.0, "p95_us": 105.0, "iterations": 10}, "new.bench": {"ops_per_sec": 1.0}}
+
+    rows = {r["metric"]: r for r in compare(current, baseline, tolerance=0.1)}
+
+    assert set(rows) == {"ops_per_sec", "p95_us"}
+    assert rows["ops_per_sec"]["regression"] is True
+    assert rows["ops_per_sec"]["change_pct"] == -20.0
+    assert rows["p95_us"]["regression"] is False
@@ -0,0 +1,134 @@
+import json
+
+import msgpack
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+from pydantic import BaseModel
+
+from app.core.middleware.body_limit import BodyLimitMiddleware, BodyTooLargeError
+from app.presentation.shared.bulk import BulkResult, JsonArrayParser, iter_bulk_chunks
+from app.presentation.shared.errors import AppError, app_error_handler, body_too_large_handler
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.routing import AppRoute
+
+class ItemRequest(BaseModel):
+    title: str
+    pages: int
+
+def build_app(batches: list) -> FastAPI:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/items")
+    async def create(req: ItemRequest):
+        return HttpResponse[ItemRequest](success=True, data=req)
+
+    @router.post("/items/bulk", response_model=HttpResponse[BulkResult])
+    async def bulk(request: Request):
+        result = BulkResult()
+        async for chunk in iter_bulk_chunks(request, ItemRequest, result, chunk_size=2, max_item_bytes=64):
+            batches.append([item.title for item in chunk])
+            result.created += len(chunk)
+        return HttpResponse[BulkResult](success=True, data=result)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(AppError, app_error_handler)
+    app.add_exception_handler(BodyTooLargeError, body_too_large_handler)
+    app.add_middleware(BodyLimitMiddleware, default_limit=100, routes={"/items/bulk": 0})
+    return app
+
+def pieces(body: bytes, size: int = 7):
+    # Corpo chunked (sem Content-Length), em pedaços que cortam itens ao meio
+    async def gen():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    return gen()
+
+@pytest.mark.asyncio
+async def test_body_limit_rejects_by_content_length_and_while_streaming():
+    app = build_app([])
+    big = json.dumps({"title": "x" * 200, "pages": 1}).encode()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        declared = await ac.post("/items", content=big, headers={"content-type": "application/json"})
+        streamed = await ac.post("/items", content=pieces(big), headers={"content-type": "application/json"})
+        small = await ac.post("/items", json={"title": "ok", "pages": 1})
+
+    for response in (declared, streamed):
+        assert response.status_code == 413
+        assert response.json()["error"] == "PayloadTooLarge"
+    assert small.status_code == 200
+
+def test_route_limits_are_globs_and_first_match_wins():
+    middleware = BodyLimitMiddleware(None, default_limit=10, routes={"/api/v1/*/bulk": 1000, "/api/*": 0})
+    assert middleware.limit_for("/api/v1/books/bulk") == 1000
+    assert middleware.limit_for("/api/v1/books") == 0
+    assert middleware.limit_for("/other") == 10
+
+@pytest.mark.asyncio
+async def test_bulk_json_array_is_validated_in_chunks():
+    batches: list = []
+    items = [{"title": "a", "pages": 1}, {"title": "b"}, {"title": "c", "pages": 3},
+             {"title": "d", "pages": 4}, 7, {"title": "é", "pages": 5}]
+    body = json.dumps(items).encode()
+    async with AsyncClient(transport=ASGITransport(app=build_app(batches)), base_url="http://test") as ac:
+        response = await ac.post("/items/bulk", content=pieces(body), headers={"content-type": "application/json"})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["received"], data["created"], data["rejected"]) == (6, 4, 2)
+    assert [e["index"] for e in data["errors"]] == [1, 4]
+    assert data["errors"][0]["message"].startswith("pages:")
+    assert batches == [["a", "c"], ["d", "é"]]
+
+@pytest.mark.asyncio
+async def test_bulk_ndjson_and_msgpack_bodies():
+    batches: list = []
+    ndjson = b'{"title": "a", "pages": 1}\n\n{"title": "b", "pages": 2}\n{"title": "c", "pages": 3}'
+    packed = msgpack.packb([{"title": "m", "pages": 1}, {"title": "n", "pages": 2}])
+    async with AsyncClient(transport=ASGITransport(app=build_app(batches)), base_url="http://test") as ac:
+        first = await ac.post("/items/bulk", content=pieces(ndjson), headers={"content-type": "application/x-ndjson"})
+        second = await ac.post("/items/bulk", content=pieces(packed, 3), headers={"content-type": "application/msgpack"})
+
+    assert first.json()["data"]["created"] == 3
+    assert second.json()["data"]["created"] == 2
+    assert batches == [["a", "b"], ["c"], ["m", "n"]]
+
+@pytest.mark.asyncio
+async def test_bulk_aborts_on_malformed_body_or_oversized_item():
+    batches: list = []
+    async with AsyncClient(transport=ASGITransport(app=build_app(batches)), base_url="http://test") as ac:
+        broken = await ac.post(
+            "/items/bulk",
+            content=pieces(b'[{"title": "a", "pages": 1}, {"title": "b", "pages": 2}, {"title": "c", "pages": 3}, {"title": '),
+            headers={"content-type": "application/json"},
+        )
+        oversized = await ac.post("/items/bulk", content=b'{"title": "' + b"x" * 100 + b'", "pages": 1}\n', headers={"content-type": "application/x-ndjson"})
+        unsupported = await ac.post("/items/bulk", content=b"a,b", headers={"content-type": "text/csv"})
+
+    # Lotes já entregues ficam; o resto é descartado com 400
+    assert broken.status_code == 400 and "após 3 itens (2 criados)" in broken.json()["message"]
+    assert oversized.status_code == 400 and "excede 64 bytes" in oversized.json()["message"]
+    assert unsupported.status_code == 415
+    assert batches == [["a", "b"]]
+
+def test_json_array_parser_waits_for_split_tokens():
+    parser = JsonArrayParser(max_item_chars=100)
+    assert parser.feed('[1, 2') == [1]  # "2" pode continuar no próximo pedaço
+    assert parser.feed('3, {"a": "b') == [23]
+    assert parser.feed('"}, []') == [{"a": "b"}]
+    assert parser.feed(']', final=True) == [[]]
+    with pytest.raises(ValueError):
+        JsonArrayParser(100).feed('{"a": 1}', final=True)
+
+@pytest.mark.parametrize("first, second, expected", [
+    ("[12.", "5]", 12.5),
+    ("[1e", "3]", 1e3),
+    ("[1.5E+", "2]", 1.5e2),
+    ("[-", "7]", -7),
+    ("[4", "2]", 42),
+])
+def test_json_array_parser_keeps_numbers_split_mid_token(first, second, expected):
+    parser = JsonArrayParser(max_item_chars=100)
+    assert parser.feed(first) == []
+    assert parser.feed(second, final=True) == [expected]
@@ -0,0 +1,157 @@
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from app.infrastructure.shared.caching_port import AsyncCachingPort, CachingPort, TTLCache, _MISSING, init_caching_port, open_caches
+from app.core.config.runtime import runtime_config
+
+@dataclass
+class Note:
+    text: str
+    id: Optional[str] = None
+
+class CountingAdapter:
+    def __init__(self, items: Optional[Dict[str, Note]] = None) -> None:
+        self.items = items if items is not None else {}
+        self.reads = 0
+
+    def get_all(self) -> List[Note]:
+        self.reads += 1
+        return list(self.items.values())
+
+    def get_one(self, identifier: str) -> Optional[Note]:
+        self.reads += 1
+        return self.items.get(identifier)
+
+    def create(self, entity: Note) -> Note:
+        entity.id = str(len(self.items) + 1)
+        self.items[entity.id] = entity
+        return entity
+
+    def update(self, identifier: str, entity: Note) -> Note:
+        entity.id = identifier
+        self.items[identifier] = entity
+        return entity
+
+    def delete(self, identifier: str) -> None:
+        self.items.pop(identifier, None)
+
+    def ping(self) -> str:
+        return "pong"
+
+class AsyncCountingAdapter(CountingAdapter):
+    async def get_all(self) -> List[Note]:
+        return super().get_all()
+
+    async def get_one(self, identifier: str) -> Optional[Note]:
+        return super().get_one(identifier)
+
+    async def update(self, identifier: str, entity: Note) -> Note:
+        return super().update(identifier, entity)
+
+def test_ttl_cache_lru_and_expiry(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("app.infrastructure.shared.caching_port.time.monotonic", lambda: clock[0])
+    cache = TTLCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" passa a ser o mais recente
+    cache.set("c", 3)
+    assert cache.get("b") is _MISSING
+    assert cache.stats()["evictions"] == 1
+
+    clock[0] += 11
+    assert cache.get("a") is _MISSING
+
+def test_ttl_cache_drops_sets_from_before_an_invalidation():
+    cache = TTLCache(maxsize=4, ttl_seconds=10)
+    version = cache.version
+    cache.pop("k")
+    cache.set("k", "stale", version)
+    assert cache.get("k") is _MISSING
+    cache.set("k", "fresh", cache.version)
+    assert cache.get("k") == "fresh"
+
+def test_read_through_and_write_invalidation():
+    inner = CountingAdapter({"1": Note("x", "1")})
+    port = CachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir="")
+
+    assert port.get_one("1").text == "x"
+    assert port.get_one("1").text == "x"
+    assert len(port.get_all()) == 1
+    assert len(port.get_all()) == 1
+    assert inner.reads == 2
+
+    port.update("1", Note("y"))
+    assert port.get_one("1").text == "y"
+    port.create(Note("z"))
+    assert len(port.get_all()) == 2
+    port.delete("1")
+    assert port.get_one("1") is None
+
+    stats = port.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 5
+    assert port.ping() == "pong"
+
+def test_invalidation_is_shared_across_workers(tmp_path):
+    inner = CountingAdapter({"1": Note("x", "1")})
+    worker_a = CachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir=str(tmp_path))
+    worker_b = CachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir=str(tmp_path))
+
+    assert worker_b.get_one("1").text == "x"
+    worker_a.update("1", Note("y"))
+    assert worker_b.get_one("1").text == "y"
+    assert worker_b.stats()["shared"] is True
+
+def test_resource_shutdown_closes_shared_generation(tmp_path):
+    resource = init_caching_port(CountingAdapter(), namespace="note", invalidation_dir=str(tmp_path))
+    port = next(resource)
+    mm = port._generation._mm
+    resource.close()
+    assert mm.closed
+    assert port.stats()["shared"] is False
+    port.create(Note("x"))  # segue só com invalidação local
+
+def test_own_write_does_not_hide_unseen_writes_from_other_workers(tmp_path):
+    inner = CountingAdapter({"1": Note("a", "1"), "2": Note("b", "2")})
+    worker_a = CachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir=str(tmp_path))
+    worker_b = CachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir=str(tmp_path))
+
+    assert worker_a.get_one("2").text == "b"
+    worker_b.update("2", Note("b2"))
+    # A escreve antes de ler de novo: o bump dele não pode engolir o de B
+    worker_a.update("1", Note("a2"))
+    assert worker_a.get_one("2").text == "b2"
+
+@pytest.mark.asyncio
+async def test_async_caching_port():
+    inner = AsyncCountingAdapter({"1": Note("x", "1")})
+    port = AsyncCachingPort(inner, namespace="note", maxsize=16, ttl_seconds=60, invalidation_dir="")
+
+    assert (await port.get_one("1")).text == "x"
+    assert (await port.get_one("1")).text == "x"
+    assert inner.reads == 1
+    await port.update("1", Note("y"))
+    assert (await port.get_one("1")).text == "y"
+
+@pytest.mark.asyncio
+async def test_admin_cache_endpoint_reports_open_caches(monkeypatch):
+    from app.main import app
+
+    resource = init_caching_port(CountingAdapter({"1": Note("x", "1")}), namespace="note_admin", invalidation_dir="")
+    port = next(resource)
+    port.get_one("1")
+    port.get_one("1")
+    monkeypatch.setattr(runtime_config, "current", replace(runtime_config.current, api_keys=frozenset({"secret-key-1"})))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/admin/cache", headers={"X-API-Key": "secret-key-1"})
+    resource.close()
+
+    data = {item["namespace"]: item for item in resp.json()["data"]}
+    assert resp.status_code == 200
+    assert data["note_admin"]["hits"] == 1 and data["note_admin"]["misses"] == 1
+    assert data["note_admin"]["shared"] is False
+    assert "note_admin" not in open_caches()
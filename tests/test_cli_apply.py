@@ -0,0 +1,113 @@
+import json
+
+import pytest
+import typer
+
+from tools.cli import (
+    ResourcePlan,
+    apply_plans,
+    build_spec,
+    load_spec,
+    render_resource,
+    update_container_source,
+    update_router_source,
+)
+
+CONTAINER = '''from dependency_injector import containers, providers
+
+from app.infrastructure.health.adapters.health_check_adapter import HealthCheckAdapter
+
+
+class Container(containers.DeclarativeContainer):
+    health_check_adapter = providers.Singleton(HealthCheckAdapter)
+'''
+
+ROUTER = '''from fastapi import APIRouter
+from app.presentation.v1.endpoints.health.endpoints import router as health_router
+
+api_router = APIRouter(prefix="/api/v1")
+api_router.include_router(health_router)
+'''
+
+def test_container_edit_is_idempotent_and_updates_changed_providers():
+    plan = render_resource(build_spec("book", "/books", fields="title:str", backend="sqlite"))
+    once = update_container_source(CONTAINER, plan.container_imports, plan.container_providers)
+    twice = update_container_source(once, plan.container_imports, plan.container_providers)
+    assert once == twice
+    assert once.count("sqlite_pool = providers.Resource") == 1
+    assert once.count("from app.core.config.settings import settings") == 1
+
+    cached = render_resource(build_spec("book", "/books", fields="title:str", backend="sqlite", cache=True))
+    updated = update_container_source(once, cached.container_imports, cached.container_providers)
+    assert updated.count("book_adapter = ") == 1
+    assert 'providers.Resource(init_caching_port, inner=providers.Singleton(SqliteBookAdapter' in updated
+
+def test_router_edit_is_idempotent():
+    entries = [
+        ("from app.presentation.v1.endpoints.book.endpoints import router as book_router", "api_router.include_router(book_router)"),
+    ]
+    once = update_router_source(ROUTER, entries)
+    assert update_router_source(once, entries) == once
+    assert once.index("import router as book_router") < once.index("api_router = APIRouter(")
+    assert once.rstrip().endswith("api_router.include_router(book_router)")
+
+def test_apply_plans_only_rewrites_changed_files(tmp_path):
+    plan = ResourcePlan(spec=build_spec("book", "/books"))
+    plan.files = {tmp_path / "a" / "one.py": "one\n", tmp_path / "two.py": "two\n"}
+    assert sorted(apply_plans([plan], root=tmp_path)[0]) == ["a/one.py", "two.py"]
+
+    written, unchanged = apply_plans([plan], root=tmp_path)
+    assert written == [] and len(unchanged) == 2
+
+    plan.files[tmp_path / "two.py"] = "dois\n"
+    written, _ = apply_plans([plan], root=tmp_path)
+    assert written == ["two.py"]
+    manifest = json.loads((tmp_path / ".cocli-manifest.json").read_text())
+    assert set(manifest) == {"a/one.py", "two.py"}
+
+def test_load_spec_applies_defaults(tmp_path):
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(
+        "defaults:\n"
+        "  backend: sqlite\n"
+        "resources:\n"
+        "  - resource: book\n"
+        "    path: /books\n"
+        "    fields: {title: str, pages: int}\n"
+        "    index: [title]\n"
+        "  - resource: author\n"
+        "    path: /authors\n"
+        "    backend: memory\n"
+        "    methods: [GET]\n"
+    )
+    book, author = load_spec(spec_file)
+    assert book.backend == "sqlite" and book.index == ("title",)
+    assert book.fields == (("title", "str"), ("pages", "int"))
+    assert author.backend == "memory" and author.methods == ("GET",)
+
+def test_bulk_renders_streaming_route_and_requires_post():
+    plan = render_resource(build_spec("book", "/books", fields="title:str", backend="aiosqlite", bulk=True))
+    sources = {path.name: code for path, code in plan.files.items()}
+    assert "async def execute(self, entities" in sources["bulk_create_book.py"]
+    assert '@router.post("/books/bulk"' in sources["endpoints.py"]
+    assert sources["endpoints.py"].count("bulk_create_uc=await container.book_bulk_create_uc()") == 6
+    assert "    book_bulk_create_uc = providers.Singleton(BulkCreateBookUseCase, port=book_adapter)" in plan.container_providers
+    for code in plan.files.values():
+        compile(code, "<generated>", "exec")
+
+    with pytest.raises(typer.BadParameter):
+        build_spec("book", "/books", methods="GET", bulk=True)
+
+def test_export_renders_async_job_route_and_requires_get():
+    plan = render_resource(build_spec("book", "/books", fields="title:str", export=True))
+    sources = {path.name: code for path, code in plan.files.items()}
+    assert "def render_book_csv(rows" in sources["export_book.py"]
+    assert 'self._jobs.submit(render_book_csv, rows, name="export_book")' in sources["export_book.py"]
+    assert '@router.post("/books/export", response_model=HttpResponse[JobResponse], status_code=202' in sources["endpoints.py"]
+    assert "return JobsController.accepted(request, record)" in sources["controller.py"]
+    assert "    book_export_uc = providers.Singleton(ExportBookUseCase, port=book_adapter, jobs=job_runner)" in plan.container_providers
+    for code in plan.files.values():
+        compile(code, "<generated>", "exec")
+
+    with pytest.raises(typer.BadParameter):
+        build_spec("book", "/books", methods="POST", export=True)
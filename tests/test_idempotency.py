@@ -0,0 +1,130 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+from pydantic import BaseModel
+
+from app.infrastructure.shared.idempotency_store import (
+    ACQUIRED,
+    COMPLETED,
+    MISMATCH,
+    PENDING,
+    InMemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+    StoredResponse,
+)
+from app.infrastructure.shared.sqlite_pool import SqliteConnectionPool
+from app.presentation.shared.errors import AppError, app_error_handler
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.idempotency import idempotent
+from app.presentation.shared.routing import AppRoute
+
+class ItemRequest(BaseModel):
+    title: str
+
+def build_app(store, calls: list, fail_first: bool = False) -> FastAPI:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/items", response_model=HttpResponse[ItemRequest], status_code=201)
+    @idempotent
+    async def create(request: Request, req: ItemRequest):
+        calls.append(req.title)
+        await asyncio.sleep(0.05)
+        if fail_first and len(calls) == 1:
+            raise AppError("falhou")
+        return HttpResponse[ItemRequest](success=True, data=req)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(AppError, app_error_handler)
+    app.state.container = SimpleNamespace(idempotency_store=lambda: store)
+    return app
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_run_the_use_case_once():
+    calls: list = []
+    app = build_app(InMemoryIdempotencyStore(100, 60, 30), calls)
+    headers = {"Idempotency-Key": "abc"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        responses = await asyncio.gather(*[ac.post("/items", json={"title": "a"}, headers=headers) for _ in range(3)])
+        other_client = await ac.post("/items", json={"title": "a"}, headers={**headers, "X-API-Key": "k2"})
+        reused = await ac.post("/items", json={"title": "b"}, headers=headers)
+        no_key = await ac.post("/items", json={"title": "a"})
+
+    assert calls == ["a", "a", "a"]  # 1x para as duplicatas, 1x outra API key, 1x sem header
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert sorted(r.headers.get("Idempotent-Replayed", "") for r in responses) == ["", "true", "true"]
+    assert all(r.json() == responses[0].json() for r in responses)
+    assert other_client.status_code == 201 and "Idempotent-Replayed" not in other_client.headers
+    assert reused.status_code == 422
+    assert no_key.status_code == 201
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_the_key():
+    calls: list = []
+    app = build_app(InMemoryIdempotencyStore(100, 60, 30), calls, fail_first=True)
+    headers = {"Idempotency-Key": "retry"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        failed = await ac.post("/items", json={"title": "a"}, headers=headers)
+        retried = await ac.post("/items", json={"title": "a"}, headers=headers)
+
+    assert failed.status_code == 400
+    assert retried.status_code == 201
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_replay_stores_the_body_filtered_by_response_model():
+    store = InMemoryIdempotencyStore(100, 60, 30)
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/items", response_model=HttpResponse[ItemRequest], status_code=201)
+    @idempotent
+    async def create(request: Request, req: ItemRequest):
+        # Campo interno que o response_model não expõe
+        return {"success": True, "data": {"title": req.title, "owner_token": "s3cr3t"}}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.state.container = SimpleNamespace(idempotency_store=lambda: store)
+    headers = {"Idempotency-Key": "filtered"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        first = await ac.post("/items", json={"title": "a"}, headers=headers)
+        replay = await ac.post("/items", json={"title": "a"}, headers=headers)
+
+    assert first.status_code == replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert first.json() == replay.json()
+    assert replay.json()["data"] == {"title": "a"}
+
+def test_in_memory_store_is_bounded_and_expires():
+    store = InMemoryIdempotencyStore(maxsize=2, ttl_seconds=0.0, lock_timeout=30)
+    assert store.reserve("a", "f")[0] == ACQUIRED
+    assert store.reserve("a", "f")[0] == PENDING
+    assert store.reserve("a", "g")[0] == MISMATCH
+    store.complete("a", "f", StoredResponse(201, {"ok": True}))
+    assert store.reserve("a", "f")[0] == ACQUIRED  # ttl 0: resposta expirada
+
+    store.reserve("b", "f")
+    store.reserve("c", "f")
+    assert store.reserve("a", "f")[0] == ACQUIRED  # "a" despejada pelo limite
+
+def test_sqlite_store_is_shared_between_workers(tmp_path):
+    path = str(tmp_path / "idem.db")
+    worker_a = SqliteIdempotencyStore(SqliteConnectionPool(path), maxsize=10, ttl_seconds=60, lock_timeout=30)
+    worker_b = SqliteIdempotencyStore(SqliteConnectionPool(path), maxsize=10, ttl_seconds=60, lock_timeout=30)
+
+    assert worker_a.reserve("k", "f") == (ACQUIRED, None)
+    assert worker_b.reserve("k", "f") == (PENDING, None)
+    worker_a.complete("k", "f", StoredResponse(201, {"data": [1, 2]}))
+    assert worker_b.reserve("k", "f") == (COMPLETED, StoredResponse(201, {"data": [1, 2]}))
+    assert worker_b.reserve("k", "other")[0] == MISMATCH
+
+    for i in range(20):
+        worker_a.reserve(f"extra-{i}", "f")
+    worker_a.prune()
+    count = worker_a._pool.connection().execute('SELECT count(*) FROM "idempotency"').fetchone()[0]
+    assert count == 10
+    worker_a.close()
+    worker_b.close()
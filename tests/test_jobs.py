@@ -0,0 +1,125 @@
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+
+from app.core.di.container import Container
+from app.core.shared.errors import ServiceSaturatedError
+from app.infrastructure.shared.job_runner import (
+    CANCELLED,
+    SUCCEEDED,
+    JobQueueFullError,
+    JobRunner,
+    JobTimeoutError,
+)
+from app.presentation.shared.errors import AppError, app_error_handler, pool_saturated_handler
+from app.presentation.shared.routing import AppRoute
+from app.presentation.v1.endpoints.jobs.controller import JobsController
+from app.presentation.v1.endpoints.jobs.endpoints import router as jobs_router
+
+def square_sum(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+def nap(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(max_workers=1, max_pending=3, retry_after=2)
+    yield runner
+    runner.shutdown()
+
+@pytest.mark.asyncio
+async def test_run_offloads_and_records_timing(runner):
+    assert await runner.run(square_sum, 1000) == square_sum(1000)
+    assert runner.run_sync(square_sum, 10) == square_sum(10)
+    stats = runner.stats()
+    assert stats["succeeded_total"] == 2
+    assert stats["pending"] == 0
+    assert stats["avg_run_ms"] >= 0.0
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_queued_jobs_can_be_cancelled(runner):
+    running = runner.submit(nap, 0.3)
+    runner.submit(nap, 0.3)
+    queued = runner.submit(nap, 0.3)  # max_workers=1: fica na fila
+    with pytest.raises(JobQueueFullError) as exc:
+        runner.submit(nap, 0.3)
+    assert exc.value.retry_after == 2
+
+    assert runner.cancel(queued.id) is True
+    assert runner.get(queued.id).status == CANCELLED
+    with pytest.raises(JobTimeoutError):
+        await runner.run(nap, 0.3, timeout=0.01)
+
+    while runner.get(running.id).status != SUCCEEDED:
+        await asyncio.sleep(0.02)
+    record = runner.get(running.id)
+    assert record.result == 0.3
+    assert record.queue_ms is not None and record.run_ms >= 300
+    assert runner.stats()["rejected_total"] == 1
+
+@pytest.mark.asyncio
+async def test_async_job_mode_returns_202_and_status_endpoint(runner):
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/reports", status_code=202)
+    def create_report(request: Request):
+        return JobsController.accepted(request, runner.submit(square_sum, 2000, name="report"))
+
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(jobs_router)
+    app.add_exception_handler(AppError, app_error_handler)
+    app.add_exception_handler(ServiceSaturatedError, pool_saturated_handler)
+
+    container = Container()
+    with container.job_runner.override(runner):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            accepted = await ac.post("/reports")
+            location = accepted.headers["Location"]
+            for _ in range(100):
+                status = await ac.get(location)
+                if status.json()["data"]["status"] == SUCCEEDED:
+                    break
+                await asyncio.sleep(0.02)
+            missing = await ac.get("/jobs/unknown")
+            # Id criado por outro worker (outro runner): não é um 404 comum
+            misdirected = await ac.get(f"/jobs/{JobRunner(max_workers=1, max_pending=1)._new_id()}")
+
+    assert accepted.status_code == 202
+    assert accepted.json()["data"]["name"] == "report"
+    assert status.json()["data"]["result"] == square_sum(2000)
+    assert status.json()["data"]["run_ms"] is not None
+    assert missing.status_code == 404
+    assert misdirected.status_code == 421 and "outro worker" in misdirected.json()["message"]
+
+def test_failed_resubmit_after_broken_pool_releases_the_slot(runner, monkeypatch):
+    class BrokenExecutor:
+        def __init__(self, error: BaseException) -> None:
+            self.error = error
+
+        def submit(self, *args, **kwargs):
+            raise self.error
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = (wait, cancel_futures)
+
+    broken = BrokenExecutor(BrokenProcessPool())
+    executors = iter([broken, BrokenExecutor(RuntimeError("sem processos"))])
+
+    def ensure_executor():
+        runner._executor = next(executors)
+        return runner._executor
+
+    monkeypatch.setattr(runner, "_ensure_executor", ensure_executor)
+    with pytest.raises(RuntimeError):
+        runner.submit(square_sum, 10)
+    assert runner.stats()["pending"] == 0
+    # O pool quebrado é encerrado antes de ser substituído
+    assert broken.shut_down == (False, True)
+    runner._executor = None
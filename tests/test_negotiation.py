@@ -0,0 +1,61 @@
+import msgpack
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient, ASGITransport
+from pydantic import BaseModel
+
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.negotiation import negotiated_openapi, preferred_media_type
+from app.presentation.shared.routing import AppRoute
+
+class ItemRequest(BaseModel):
+    title: str
+    pages: int
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/items", response_model=HttpResponse[ItemRequest], status_code=201)
+    def create(req: ItemRequest):
+        return HttpResponse[ItemRequest](success=True, data=req)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+MSGPACK = {"Content-Type": "application/msgpack", "Accept": "application/msgpack"}
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, "application/json"),
+    ("*/*", "application/json"),
+    ("application/msgpack", "application/msgpack"),
+    ("application/x-msgpack, */*;q=0.1", "application/msgpack"),
+    ("application/json, application/msgpack", "application/json"),
+    ("application/json;q=0.5, application/msgpack", "application/msgpack"),
+])
+def test_preferred_media_type(accept, expected):
+    assert preferred_media_type(accept) == expected
+
+@pytest.mark.asyncio
+async def test_msgpack_request_and_response_round_trip():
+    app = build_app()
+    body = msgpack.packb({"title": "a", "pages": 3})
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        packed = await ac.post("/items", content=body, headers=MSGPACK)
+        plain = await ac.post("/items", json={"title": "a", "pages": 3})
+        invalid = await ac.post("/items", content=msgpack.packb({"title": "a", "pages": "x"}), headers=MSGPACK)
+
+    assert packed.status_code == 201
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert "Accept" in packed.headers["vary"]
+    assert msgpack.unpackb(packed.content) == plain.json()
+    assert plain.headers["content-type"] == "application/json"
+    assert invalid.status_code == 422
+
+def test_openapi_documents_msgpack_for_bodies_and_success_responses():
+    app = build_app()
+    operation = negotiated_openapi(app)["paths"]["/items"]["post"]
+
+    assert set(operation["requestBody"]["content"]) == {"application/json", "application/msgpack"}
+    assert set(operation["responses"]["201"]["content"]) == {"application/json", "application/msgpack"}
+    assert set(operation["responses"]["422"]["content"]) == {"application/json"}
@@ -0,0 +1,90 @@
+import gzip
+import json
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient, ASGITransport
+from pydantic import BaseModel
+
+from app.presentation.shared.http_response import HttpResponse
+from app.presentation.shared.negotiation import accepts_gzip, negotiated_openapi
+from app.presentation.shared.openapi import install_docs, serialize_openapi
+from app.presentation.shared.routing import AppRoute
+
+class ItemRequest(BaseModel):
+    title: str
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.post("/items", response_model=HttpResponse[ItemRequest], status_code=201)
+    def create(req: ItemRequest):
+        return HttpResponse[ItemRequest](success=True, data=req)
+
+    app = FastAPI(title="Docs", openapi_url=None, docs_url=None, redoc_url=None)
+    app.include_router(router)
+    app.openapi = lambda: negotiated_openapi(app)
+    return app
+
+def fail() -> None:
+    raise AssertionError("schema montado durante a requisição")
+
+@pytest.mark.asyncio
+async def test_schema_is_precomputed_and_served_with_etag():
+    app = build_app()
+    payloads = install_docs(app)
+    # Pronto no boot (master com preload): qualquer montagem depois falharia
+    assert payloads["/openapi.json"].body and payloads["/openapi.json"].gzipped
+    app.openapi = fail
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        first = await ac.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        zipped = await ac.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        refused = await ac.get("/openapi.json", headers={"Accept-Encoding": "gzip;q=0"})
+        cached = await ac.get("/openapi.json", headers={"If-None-Match": first.headers["ETag"]})
+        docs = await ac.get("/docs")
+        redoc = await ac.get("/redoc")
+
+    assert first.status_code == 200
+    assert first.content == payloads["/openapi.json"].body
+    assert "application/msgpack" in first.json()["paths"]["/items"]["post"]["requestBody"]["content"]
+    assert "content-encoding" not in first.headers
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.json() == first.json()
+    assert zipped.headers["ETag"] == first.headers["ETag"]
+    assert "content-encoding" not in refused.headers and refused.content == first.content
+    assert cached.status_code == 304 and cached.content == b""
+    assert docs.status_code == 200 and "/openapi.json" in docs.text
+    assert redoc.status_code == 200 and docs.headers["ETag"] != redoc.headers["ETag"]
+    assert "/openapi.json" not in first.json()["paths"]
+
+@pytest.mark.asyncio
+async def test_build_time_file_is_served_as_is(tmp_path):
+    body = serialize_openapi(build_app())
+    path = tmp_path / "openapi.json"
+    path.write_bytes(body)
+
+    app = build_app()
+    app.openapi = fail
+    payloads = install_docs(app, docs_url=None, redoc_url=None, openapi_file=str(path))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/openapi.json")
+        docs = await ac.get("/docs")
+
+    assert response.content == body
+    assert gzip.decompress(payloads["/openapi.json"].gzipped) == body
+    assert app.openapi_schema == json.loads(body)
+    assert docs.status_code == 404
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("identity, *;q=0", False),
+    ("gzip;q=0.5, identity", False),
+    ("br;q=1.0, gzip;q=0.8, *;q=0.1", True),
+    ("", False),
+])
+def test_gzip_only_when_accepted_with_positive_quality(accept_encoding, expected):
+    assert accepts_gzip(accept_encoding) is expected
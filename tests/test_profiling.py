@@ -0,0 +1,135 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.config import settings as cfg
+from app.core.config.runtime import runtime_config
+from app.core.middleware.profiling import ProfilingMiddleware
+from app.core.profiling.store import ProfileRecord, ProfileStore, profile_store
+from app.core.profiling.timings import phase
+from app.presentation.shared.routing import AppRoute
+
+def busy_work() -> int:
+    return sum(i * i for i in range(2000))
+
+def build_app(store: ProfileStore) -> FastAPI:
+    router = APIRouter(route_class=AppRoute)
+
+    @router.get("/work")
+    def work():
+        with phase("controller"):
+            return {"value": busy_work()}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ProfilingMiddleware, store=store)
+    return app
+
+@pytest.fixture
+def profiling_on(monkeypatch):
+    monkeypatch.setattr(cfg.settings, "profiling_enabled", True)
+    monkeypatch.setattr(cfg.settings, "profiling_sample_rate", 0.0)
+    monkeypatch.setattr(runtime_config, "current", replace(runtime_config.current, api_keys=frozenset({"secret-key-1"})))
+
+@pytest.mark.asyncio
+async def test_profile_header_with_api_key_captures_phases_and_cprofile(profiling_on):
+    store = ProfileStore(capacity=2)
+    app = build_app(store)
+    headers = {"X-Profile": "1", "X-API-Key": "secret-key-1"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.get("/work", headers=headers)
+
+    assert resp.status_code == 200
+    server_timing = resp.headers["Server-Timing"]
+    for name in ("endpoint", "controller", "di", "deps", "serialize", "mw", "total"):
+        assert f"{name};dur=" in server_timing
+
+    [record] = store.list()
+    assert record.path == "/work"
+    assert record.status == 200
+    assert "busy_work" in record.stats
+
+def other_request_work() -> int:
+    return sum(i * i for i in range(2000))
+
+@pytest.mark.asyncio
+async def test_async_profile_excludes_work_done_by_the_loop_during_awaits(profiling_on):
+    store = ProfileStore(capacity=2)
+    router = APIRouter(route_class=AppRoute)
+
+    @router.get("/slow")
+    async def slow():
+        busy_work()
+        await asyncio.sleep(0.05)
+        return {"value": busy_work()}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ProfilingMiddleware, store=store)
+
+    async def neighbour():
+        # Outra "requisição" rodando no mesmo loop enquanto /slow aguarda
+        for _ in range(5):
+            other_request_work()
+            await asyncio.sleep(0.005)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp, _ = await asyncio.gather(ac.get("/slow", headers={"X-Profile": "1", "X-API-Key": "secret-key-1"}), neighbour())
+
+    assert resp.json() == {"value": busy_work()}
+    [record] = store.list()
+    assert "busy_work" in record.stats
+    assert "other_request_work" not in record.stats
+
+@pytest.mark.asyncio
+async def test_unselected_requests_are_not_profiled(profiling_on):
+    store = ProfileStore(capacity=2)
+    app = build_app(store)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        plain = await ac.get("/work")
+        wrong_key = await ac.get("/work", headers={"X-Profile": "1", "X-API-Key": "nope"})
+
+    assert "Server-Timing" not in plain.headers
+    assert "Server-Timing" not in wrong_key.headers
+    assert store.list() == []
+
+@pytest.mark.asyncio
+async def test_sampled_requests_only_record_timings(profiling_on, monkeypatch):
+    monkeypatch.setattr(cfg.settings, "profiling_sample_rate", 1.0)
+    store = ProfileStore(capacity=2)
+    app = build_app(store)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        for _ in range(3):
+            resp = await ac.get("/work")
+
+    assert "Server-Timing" in resp.headers
+    records = store.list()
+    assert len(records) == 2  # ring buffer limitado
+    assert all(r.stats is None for r in records)
+
+@pytest.mark.asyncio
+async def test_admin_profiles_endpoint(monkeypatch):
+    from app.main import app
+
+    profile_store.clear()
+    profile_store.add(ProfileRecord(
+        id="abc123", method="GET", path="/api/v1/health", status=200, request_id="rid",
+        started_at=0.0, total_ms=1.5, phases={"endpoint": 1.0}, stats="stats",
+    ))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        disabled = await ac.get("/api/v1/admin/profiles")
+        monkeypatch.setattr(runtime_config, "current", replace(runtime_config.current, api_keys=frozenset({"secret-key-1"})))
+        listed = await ac.get("/api/v1/admin/profiles", headers={"X-API-Key": "secret-key-1"})
+        detail = await ac.get("/api/v1/admin/profiles/abc123", headers={"X-API-Key": "secret-key-1"})
+        missing = await ac.get("/api/v1/admin/profiles/zzz", headers={"X-API-Key": "secret-key-1"})
+    profile_store.clear()
+
+    assert disabled.status_code == 403
+    assert listed.json()["data"][0]["has_stats"] is True
+    assert "stats" not in listed.json()["data"][0]
+    assert detail.json()["data"]["stats"] == "stats"
+    assert missing.status_code == 404
@@ -0,0 +1,126 @@
+import asyncio
+import os
+import signal
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.config.runtime import RuntimeConfigStore
+from app.core.config.settings import Settings
+from app.core.middleware.cors import RuntimeCORSMiddleware
+from app.core.middleware.security_headers import SecurityHeadersMiddleware
+
+def build_store(tmp_path, content: str) -> RuntimeConfigStore:
+    path = tmp_path / "runtime.env"
+    path.write_text(content)
+    return RuntimeConfigStore(Settings(_env_file=None, runtime_config_file=str(path)))
+
+def build_app(store: RuntimeConfigStore) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    app.add_middleware(RuntimeCORSMiddleware, store=store, allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(SecurityHeadersMiddleware, store=store)
+    return app
+
+def test_reload_validates_before_swapping(tmp_path):
+    store = build_store(tmp_path, "")
+    first = store.current
+    assert first.version == 1 and not first.auth_enabled
+
+    (tmp_path / "runtime.env").write_text('API_KEYS=["k1","k2"]\nENABLE_HSTS=true\n')
+    assert store.reload() is True
+    assert store.current.api_keys == frozenset({"k1", "k2"}) and store.current.version == 2
+    assert first.api_keys == frozenset()  # snapshot anterior intacto para quem já o leu
+
+    for invalid in ('CORS_ORIGINS=["localhost:3000"]\n', 'API_KEYS=[" k1"]\n', "GZIP_MIN_SIZE=abc\n", "UNKNOWN_KEY=1\n"):
+        (tmp_path / "runtime.env").write_text(invalid)
+        assert store.reload() is False
+    assert store.current.version == 2 and store.current.api_keys == frozenset({"k1", "k2"})
+    assert store.stats()["failures_total"] == 4
+
+@pytest.mark.asyncio
+async def test_middlewares_follow_the_swapped_snapshot(tmp_path):
+    store = build_store(tmp_path, 'CORS_ORIGINS=["https://a.example"]\n')
+    app = build_app(store)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        before = await ac.get("/ping", headers={"Origin": "https://b.example"})
+        (tmp_path / "runtime.env").write_text('CORS_ORIGINS=["https://b.example"]\nENABLE_HSTS=true\n')
+        store.reload()
+        after = await ac.get("/ping", headers={"Origin": "https://b.example"})
+
+    assert "access-control-allow-origin" not in before.headers
+    assert "strict-transport-security" not in before.headers
+    assert before.headers["x-frame-options"] == "DENY"
+    assert after.headers["access-control-allow-origin"] == "https://b.example"
+    assert after.headers["strict-transport-security"].startswith("max-age=")
+
+def test_refresh_picks_up_changes_made_after_compile(tmp_path):
+    # Import (master) compila; o arquivo muda antes do startup do worker
+    store = build_store(tmp_path, 'API_KEYS=["old"]\n')
+    assert store.refresh() is False and store.current.version == 1
+    (tmp_path / "runtime.env").write_text('API_KEYS=["new-key"]\n')
+    assert store.refresh() is True
+    assert store.current.api_keys == frozenset({"new-key"})
+    # Arquivo inválido não é relido a cada verificação, só quando mudar de novo
+    (tmp_path / "runtime.env").write_text('API_KEYS=[" bad"]\n')
+    assert store.refresh() is False and store.refresh() is False
+    assert store.stats()["failures_total"] == 1
+
+def test_unreadable_file_is_rejected_like_invalid_config(tmp_path, monkeypatch):
+    store = build_store(tmp_path, "")
+
+    def unreadable(**_):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr("app.core.config.runtime.Settings", unreadable)
+    assert store.reload() is False
+    assert store.current.version == 1 and store.stats()["failures_total"] == 1
+
+@pytest.mark.asyncio
+async def test_watcher_survives_unexpected_errors(tmp_path, monkeypatch):
+    store = build_store(tmp_path, "")
+    calls = []
+
+    def flaky_refresh() -> bool:
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return False
+
+    monkeypatch.setattr(store, "refresh", flaky_refresh)
+    watcher = asyncio.ensure_future(store.watch(0.01))
+    for _ in range(50):
+        if len(calls) >= 2:
+            break
+        await asyncio.sleep(0.01)
+    assert not watcher.done()
+    watcher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await watcher
+    assert len(calls) >= 2
+
+@pytest.mark.asyncio
+async def test_file_change_and_sighup_trigger_reload(tmp_path):
+    store = build_store(tmp_path, "")
+    watcher = asyncio.ensure_future(store.watch(0.01))
+    await asyncio.sleep(0.03)
+    (tmp_path / "runtime.env").write_text('API_KEYS=["from-file"]\n')
+    for _ in range(50):
+        if store.current.version == 2:
+            break
+        await asyncio.sleep(0.01)
+    watcher.cancel()
+    assert store.current.api_keys == frozenset({"from-file"})
+
+    assert store.install_signal_handler() is True
+    try:
+        os.kill(os.getpid(), signal.SIGHUP)
+        await asyncio.sleep(0.05)
+    finally:
+        store.remove_signal_handler()
+    assert store.current.version == 3
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+import runpy
+from pathlib import Path
+
+import pytest
+from gunicorn.config import Config
+from gunicorn.glogging import Logger
+
+from app.core.config.settings import settings
+from app.core.server import workers
+from app.core.server.workers import StrictUvicornWorker, TunedUvicornWorker, lifespan_drain_timeout, require_fast_stack
+
+def build_worker(worker_class):
+    cfg = Config()
+    cfg.set("backlog", 4096)
+    cfg.set("keepalive", 7)
+    return worker_class(0, os.getpid(), [], None, 30, cfg, Logger(cfg))
+
+def test_strict_worker_pins_uvloop_httptools_and_tuning(monkeypatch):
+    monkeypatch.setattr(settings, "server_limit_concurrency", 500)
+    monkeypatch.setattr(settings, "server_h11_max_incomplete_event_size", 8192)
+    worker = build_worker(StrictUvicornWorker)
+
+    assert (worker.config.loop, worker.config.http) == ("uvloop", "httptools")
+    assert worker.config.limit_concurrency == 500
+    assert worker.config.h11_max_incomplete_event_size == 8192
+    assert worker.config.backlog == 4096
+    assert worker.config.timeout_keep_alive == 7
+    # graceful_timeout (30) menos a reserva para fechar os resources
+    assert worker.config.timeout_graceful_shutdown == 25
+
+def test_lifespan_drain_only_gets_what_the_server_left(monkeypatch):
+    monkeypatch.setattr(settings, "server_drain_delay", 3.0)
+    # 30 - 3 (readiness) - 22 (uvicorn) = 5 s: metade para drenar, metade para os resources
+    assert lifespan_drain_timeout(30) == 2.5
+    # graceful_timeout curto: o uvicorn fica com o mínimo de 1 s e o resto é dividido
+    assert lifespan_drain_timeout(6) == 1.0
+    assert lifespan_drain_timeout(2) == 0.0
+
+def test_standard_worker_keeps_auto_and_unlimited_concurrency(monkeypatch):
+    monkeypatch.setattr(settings, "server_limit_concurrency", 0)
+    worker = build_worker(TunedUvicornWorker)
+
+    assert (worker.config.loop, worker.config.http) == ("auto", "auto")
+    assert worker.config.limit_concurrency is None
+
+def test_strict_profile_fails_loudly_without_fast_stack(monkeypatch):
+    monkeypatch.setattr(workers.importlib.util, "find_spec", lambda name: None if name == "httptools" else object())
+    with pytest.raises(RuntimeError, match="httptools"):
+        require_fast_stack()
+    with pytest.raises(RuntimeError):
+        build_worker(StrictUvicornWorker)
+
+def test_hypercorn_profile_falls_back_to_asyncio_without_uvloop(monkeypatch):
+    conf = str(Path(__file__).resolve().parents[1] / "hypercorn_conf.py")
+    monkeypatch.setattr(settings, "server_profile", "http2")
+    monkeypatch.delenv("HYPERCORN_WORKER_CLASS", raising=False)
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: None if name == "uvloop" else find_spec(name, *args))
+    assert runpy.run_path(conf)["worker_class"] == "asyncio"
+
+    monkeypatch.setattr(importlib.util, "find_spec", find_spec)
+    monkeypatch.setenv("HYPERCORN_WORKER_CLASS", "asyncio")
+    assert runpy.run_path(conf)["worker_class"] == "asyncio"
@@ -0,0 +1,85 @@
+import sys
+import threading
+import types
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+import pytest
+
+from app.infrastructure.shared.sqlite_pool import SqliteConnectionPool, init_sqlite_pool
+from tools.cli import render_sqlite_adapter
+
+@dataclass
+class Gadget:
+    name: str
+    qty: int
+    active: bool
+    id: Optional[str] = None
+
+class GadgetPort(Protocol): ...
+
+@pytest.fixture
+def adapter_cls(monkeypatch):
+    # Módulos de domínio que o adapter gerado importa
+    entities = types.ModuleType("app.domain.gadget.entities.gadget")
+    entities.Gadget = Gadget
+    ports = types.ModuleType("app.domain.gadget.ports.gadget_port")
+    ports.GadgetPort = GadgetPort
+    monkeypatch.setitem(sys.modules, entities.__name__, entities)
+    monkeypatch.setitem(sys.modules, ports.__name__, ports)
+
+    code = render_sqlite_adapter("gadget", "Gadget", [("name", "str"), ("qty", "int"), ("active", "bool")], ["name"])
+    namespace: dict = {"__name__": "generated_gadget_adapter"}
+    exec(compile(code, "sqlite_gadget_adapter.py", "exec"), namespace)
+    return namespace["SqliteGadgetAdapter"]
+
+@pytest.fixture
+def pool(tmp_path):
+    gen = init_sqlite_pool(str(tmp_path / "test.db"))
+    p = next(gen)
+    yield p
+    gen.close()
+
+def test_pool_one_connection_per_thread_in_wal(pool):
+    main_conn = pool.connection()
+    assert pool.connection() is main_conn
+    assert main_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(pool.connection()))
+    t.start()
+    t.join()
+    assert seen[0] is not main_conn
+    assert pool.size == 2
+
+def test_pool_close_releases_connections(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "close.db"))
+    pool.connection()
+    pool.close()
+    assert pool.size == 0
+
+def test_generated_adapter_crud(adapter_cls, pool):
+    adapter = adapter_cls(pool)
+    created = adapter.create(Gadget(name="a", qty=1, active=True))
+    assert created.id
+
+    fetched = adapter.get_one(created.id)
+    assert fetched == Gadget(name="a", qty=1, active=True, id=created.id)
+
+    adapter.update(created.id, Gadget(name="b", qty=2, active=False))
+    assert adapter.get_one(created.id).name == "b"
+    assert adapter.get_one(created.id).active is False
+
+    adapter.delete(created.id)
+    assert adapter.get_one(created.id) is None
+
+def test_generated_adapter_bulk_ops(adapter_cls, pool):
+    adapter = adapter_cls(pool)
+    items = adapter.create_many(Gadget(name=f"g{i}", qty=i, active=True) for i in range(50))
+    assert len(adapter.get_all()) == 50
+
+    adapter.delete_many(i.id for i in items[:10])
+    assert len(adapter.get_all()) == 40
+
+    index = pool.connection().execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'ix_gadget_name'").fetchone()
+    assert index is not None
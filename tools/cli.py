@@ -1,10 +1,16 @@
 
 from __future__ import annotations
 
+import ast
+import hashlib
+import json
 import re
 import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import typer
 
@@ -50,67 +56,276 @@ def append_once(path: Path, needle: str, block: str) -> None:
     with path.open("a", encoding="utf-8") as f:
         f.write("\n" + block.strip() + "\n")
 
-def insert_in_container(path: Path, needle: str, imports_block: str, providers_block: str) -> None:
+SQLITE_TYPES = {"str": "TEXT", "int": "INTEGER", "float": "REAL", "bool": "INTEGER"}
+
+def sqlite_statements(
+    resource_snake: str,
+    fields_list: List[Tuple[str, str]],
+    index_fields: List[str],
+) -> Tuple[str, str, str]:
     """
-    Insere imports no topo e providers dentro da classe Container.
+    Monta o bloco de SQL constante (schema, índices e CRUD) e as expressões de
+    conversão entidade <-> linha, compartilhados pelos adapters sqlite/aiosqlite.
     """
-    text = path.read_text(encoding="utf-8")
-    if needle in text:
-        return
-    
-    lines = text.split('\n')
-    
-    # Encontrar onde inserir imports (após os imports existentes)
-    import_insert_idx = 0
-    for i, line in enumerate(lines):
-        if line.startswith('from ') or line.startswith('import '):
-            import_insert_idx = i + 1
-    
-    # Encontrar onde inserir providers (dentro da classe Container, após o último provider)
-    provider_insert_idx = len(lines)
-    in_container_class = False
-    
-    for i, line in enumerate(lines):
-        if 'class Container(' in line:
-            in_container_class = True
-        elif in_container_class and line.strip().startswith('providers.Singleton'):
-            provider_insert_idx = i + 1
-    
-    # Inserir imports
-    lines.insert(import_insert_idx, imports_block)
-    
-    # Inserir providers (ajustar índice devido à inserção anterior)
-    lines.insert(provider_insert_idx + 1, providers_block)
-    
-    # Escrever arquivo
-    path.write_text('\n'.join(lines), encoding='utf-8')
-
-
-@app.callback(invoke_without_command=True)
-def scaffold(
-    resource: str = typer.Option(..., "--resource", "-r", help="Nome lógico do recurso (ex.: book)"),
-    endpoint_path: str = typer.Option(..., "--path", "-p", help="Caminho do endpoint (ex.: /books)"),
-    methods: str = typer.Option("GET,POST,PUT,DELETE", "--methods", "-m", help="Lista separada por vírgulas"),
-    fields: str = typer.Option("", "--fields", "-f", help="Campos nome:tipo"),
-    component: str = typer.Option("full", "--component", "-c", help="Componente a gerar: model, usecase, endpoints, adapter, full"),
-):
+    table = f'"{resource_snake}"'
+    names = [n for n, _ in fields_list]
+    columns = ["id"] + names
+    cols_sql = ", ".join(f'"{c}"' for c in columns)
+    placeholders = ", ".join("?" for _ in columns)
+
+    ddl = ['"id" TEXT PRIMARY KEY'] + [f'"{n}" {SQLITE_TYPES[t]} NOT NULL' for n, t in fields_list]
+    schema = [f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(ddl)})"]
+    for name in index_fields:
+        schema.append(f'CREATE INDEX IF NOT EXISTS "ix_{resource_snake}_{name}" ON {table} ("{name}")')
+
+    if names:
+        set_sql = ", ".join(f'"{n}" = excluded."{n}"' for n in names)
+        upsert_sql = f"INSERT INTO {table} ({cols_sql}) VALUES ({placeholders}) ON CONFLICT(\"id\") DO UPDATE SET {set_sql}"
+    else:
+        upsert_sql = f"INSERT INTO {table} ({cols_sql}) VALUES ({placeholders}) ON CONFLICT(\"id\") DO NOTHING"
+
+    statements = {
+        "_SELECT_ALL": f"SELECT {cols_sql} FROM {table}",
+        "_SELECT_ONE": f'SELECT {cols_sql} FROM {table} WHERE "id" = ?',
+        "_INSERT": f"INSERT INTO {table} ({cols_sql}) VALUES ({placeholders})",
+        "_UPSERT": upsert_sql,
+        "_DELETE": f'DELETE FROM {table} WHERE "id" = ?',
+    }
+    constants = ["_SCHEMA = ("] + [f"    {stmt!r}," for stmt in schema] + [")"]
+    constants += [f"{name} = {sql!r}" for name, sql in statements.items()]
+    # Indentação do corpo da classe no template (8 espaços antes do dedent)
+    constants_str = ("\n" + " " * 8).join(constants)
+
+    to_row = ", ".join(["entity.id"] + [f"entity.{n}" for n in names])
+    from_row_args = ["id=row[0]"]
+    for i, (name, typ) in enumerate(fields_list, start=1):
+        from_row_args.append(f"{name}=bool(row[{i}])" if typ == "bool" else f"{name}=row[{i}]")
+    return constants_str, to_row, ", ".join(from_row_args)
+
+def render_sqlite_adapter(
+    resource_snake: str,
+    resource_pascal: str,
+    fields_list: List[Tuple[str, str]],
+    index_fields: List[str],
+) -> str:
     """
-    Gera estrutura mínima para novo recurso seguindo a arquitetura do projeto:
-    - Domain: entidade e (opcional) port
-    - Application: DTO, Mapper, UseCases básicos
-    - Infrastructure: Adapter stub
-    - Presentation: Schemas, Controller e Endpoints
-    - DI: registra providers no container
-    - API Router: inclui o router novo
+    Gera o adapter SQLite do recurso: schema derivado de --fields, índices em
+    --index e SQL constante (preparado uma vez por conexão pelo cache do sqlite3).
+    """
+    constants, to_row, from_row = sqlite_statements(resource_snake, fields_list, index_fields)
+
+    return textwrap.dedent(f"""
+    from typing import Iterable, List, Optional, Tuple
+    from uuid import uuid4
+    from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
+    from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
+    from app.infrastructure.shared.sqlite_pool import SqliteConnectionPool
+    from app.core.config.logging import get_logger
+
+    logger = get_logger(__name__)
+
+    class Sqlite{resource_pascal}Adapter({resource_pascal}Port):
+        {constants}
+
+        def __init__(self, pool: SqliteConnectionPool) -> None:
+            self._pool = pool
+            with self._pool.transaction() as conn:
+                for stmt in self._SCHEMA:
+                    conn.execute(stmt)
+
+        @staticmethod
+        def _to_row(entity: {resource_pascal}) -> Tuple:
+            return ({to_row},)
+
+        @staticmethod
+        def _from_row(row: Tuple) -> {resource_pascal}:
+            return {resource_pascal}({from_row})
+
+        def get_all(self) -> List[{resource_pascal}]:
+            logger.debug("Sqlite{resource_pascal}Adapter.get_all")
+            rows = self._pool.connection().execute(self._SELECT_ALL).fetchall()
+            return [self._from_row(r) for r in rows]
+
+        def get_one(self, identifier: str) -> Optional[{resource_pascal}]:
+            logger.debug("Sqlite{resource_pascal}Adapter.get_one: %s", identifier)
+            row = self._pool.connection().execute(self._SELECT_ONE, (identifier,)).fetchone()
+            return self._from_row(row) if row else None
+
+        def create(self, entity: {resource_pascal}) -> {resource_pascal}:
+            logger.debug("Sqlite{resource_pascal}Adapter.create: %s", entity)
+            entity.id = uuid4().hex
+            with self._pool.transaction() as conn:
+                conn.execute(self._INSERT, self._to_row(entity))
+            return entity
+
+        def create_many(self, entities: Iterable[{resource_pascal}]) -> List[{resource_pascal}]:
+            items = list(entities)
+            logger.debug("Sqlite{resource_pascal}Adapter.create_many: %d", len(items))
+            for entity in items:
+                entity.id = uuid4().hex
+            with self._pool.transaction() as conn:
+                conn.executemany(self._INSERT, [self._to_row(e) for e in items])
+            return items
+
+        def update(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}:
+            logger.debug("Sqlite{resource_pascal}Adapter.update: %s", identifier)
+            entity.id = identifier
+            with self._pool.transaction() as conn:
+                conn.execute(self._UPSERT, self._to_row(entity))
+            return entity
+
+        def delete(self, identifier: str) -> None:
+            logger.debug("Sqlite{resource_pascal}Adapter.delete: %s", identifier)
+            with self._pool.transaction() as conn:
+                conn.execute(self._DELETE, (identifier,))
+
+        def delete_many(self, identifiers: Iterable[str]) -> None:
+            with self._pool.transaction() as conn:
+                conn.executemany(self._DELETE, [(i,) for i in identifiers])
+    """).strip() + "\n"
+
+def render_async_sqlite_adapter(
+    resource_snake: str,
+    resource_pascal: str,
+    fields_list: List[Tuple[str, str]],
+    index_fields: List[str],
+) -> str:
+    """
+    Variante assíncrona (aiosqlite) do adapter SQLite. O schema é criado na
+    primeira operação, pois o construtor do provider não pode ser aguardado.
     """
+    constants, to_row, from_row = sqlite_statements(resource_snake, fields_list, index_fields)
+
+    return textwrap.dedent(f"""
+    import asyncio
+    from typing import Iterable, List, Optional, Tuple
+    from uuid import uuid4
+    from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
+    from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
+    from app.infrastructure.shared.async_sqlite_pool import AsyncSqlitePool
+    from app.core.config.logging import get_logger
+
+    logger = get_logger(__name__)
+
+    class AsyncSqlite{resource_pascal}Adapter({resource_pascal}Port):
+        {constants}
+
+        def __init__(self, pool: AsyncSqlitePool) -> None:
+            self._pool = pool
+            self._schema_ready = False
+            self._schema_lock = asyncio.Lock()
+
+        async def _ensure_schema(self) -> None:
+            if self._schema_ready:
+                return
+            async with self._schema_lock:
+                if self._schema_ready:
+                    return
+                async with self._pool.transaction() as conn:
+                    for stmt in self._SCHEMA:
+                        await conn.execute(stmt)
+                self._schema_ready = True
+
+        @staticmethod
+        def _to_row(entity: {resource_pascal}) -> Tuple:
+            return ({to_row},)
+
+        @staticmethod
+        def _from_row(row: Tuple) -> {resource_pascal}:
+            return {resource_pascal}({from_row})
+
+        async def get_all(self) -> List[{resource_pascal}]:
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.get_all")
+            await self._ensure_schema()
+            async with self._pool.acquire() as conn:
+                async with conn.execute(self._SELECT_ALL) as cursor:
+                    rows = await cursor.fetchall()
+            return [self._from_row(r) for r in rows]
+
+        async def get_one(self, identifier: str) -> Optional[{resource_pascal}]:
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.get_one: %s", identifier)
+            await self._ensure_schema()
+            async with self._pool.acquire() as conn:
+                async with conn.execute(self._SELECT_ONE, (identifier,)) as cursor:
+                    row = await cursor.fetchone()
+            return self._from_row(row) if row else None
+
+        async def create(self, entity: {resource_pascal}) -> {resource_pascal}:
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.create: %s", entity)
+            await self._ensure_schema()
+            entity.id = uuid4().hex
+            async with self._pool.transaction() as conn:
+                await conn.execute(self._INSERT, self._to_row(entity))
+            return entity
+
+        async def create_many(self, entities: Iterable[{resource_pascal}]) -> List[{resource_pascal}]:
+            items = list(entities)
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.create_many: %d", len(items))
+            await self._ensure_schema()
+            for entity in items:
+                entity.id = uuid4().hex
+            async with self._pool.transaction() as conn:
+                await conn.executemany(self._INSERT, [self._to_row(e) for e in items])
+            return items
+
+        async def update(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}:
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.update: %s", identifier)
+            await self._ensure_schema()
+            entity.id = identifier
+            async with self._pool.transaction() as conn:
+                await conn.execute(self._UPSERT, self._to_row(entity))
+            return entity
+
+        async def delete(self, identifier: str) -> None:
+            logger.debug("AsyncSqlite{resource_pascal}Adapter.delete: %s", identifier)
+            await self._ensure_schema()
+            async with self._pool.transaction() as conn:
+                await conn.execute(self._DELETE, (identifier,))
+
+        async def delete_many(self, identifiers: Iterable[str]) -> None:
+            await self._ensure_schema()
+            async with self._pool.transaction() as conn:
+                await conn.executemany(self._DELETE, [(i,) for i in identifiers])
+    """).strip() + "\n"
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """
+    Parâmetros já validados de um recurso (linha de comando ou entrada do spec).
+    """
+    resource: str
+    endpoint_path: str
+    methods: Tuple[str, ...]
+    fields: Tuple[Tuple[str, str], ...]
+    component: str = "full"
+    backend: str = "memory"
+    index: Tuple[str, ...] = ()
+    cache: bool = False
+    idempotent: bool = False
+    bulk: bool = False
+    export: bool = False
+
+def build_spec(
+    resource: str,
+    endpoint_path: str,
+    methods: str = "GET,POST,PUT,DELETE",
+    fields: str = "",
+    component: str = "full",
+    backend: str = "memory",
+    index: str = "",
+    cache: bool = False,
+    idempotent: bool = False,
+    bulk: bool = False,
+    export: bool = False,
+) -> ResourceSpec:
     # Validação de componente
     valid_components = {"model", "usecase", "endpoints", "adapter", "full"}
     if component not in valid_components:
         raise typer.BadParameter(f"Componente inválido: {component}. Use: {', '.join(valid_components)}")
-    
-    resource_snake = snake(resource)
-    resource_pascal = pascal(resource)
-    feature_dir = APP_ROOT / "app" / "presentation" / "v1" / "endpoints" / resource_snake
+    valid_backends = {"memory", "sqlite", "aiosqlite"}
+    if backend not in valid_backends:
+        raise typer.BadParameter(f"Backend inválido: {backend}. Use: {', '.join(sorted(valid_backends))}")
 
     meths = [m.strip().upper() for m in methods.split(",") if m.strip()]
     valid = {"GET", "POST", "PUT", "DELETE"}
@@ -121,16 +336,79 @@ def scaffold(
         raise typer.BadParameter("Informe pelo menos um método em --methods.")
 
     fields_list = parse_fields(fields)
-    print(f"DEBUG: resource_snake={resource_snake}, fields_list={fields_list}, component={component}")
+    index_fields = [snake(i) for i in index.split(",") if i.strip()]
+    for name in index_fields:
+        if name not in {n for n, _ in fields_list}:
+            raise typer.BadParameter(f"Índice '{name}' não está em --fields.")
+    if bulk and "POST" not in meths:
+        raise typer.BadParameter("--bulk exige POST em --methods.")
+    if export and "GET" not in meths:
+        raise typer.BadParameter("--export exige GET em --methods.")
+    return ResourceSpec(
+        resource=snake(resource),
+        endpoint_path=endpoint_path,
+        methods=tuple(meths),
+        fields=tuple(fields_list),
+        component=component,
+        backend=backend,
+        index=tuple(index_fields),
+        cache=cache,
+        idempotent=idempotent,
+        bulk=bulk,
+        export=export,
+    )
+
+@dataclass
+class ResourcePlan:
+    """
+    Resultado puro da renderização de um recurso: conteúdo de cada arquivo e as
+    edições de container/router, aplicadas depois por `apply_plans`.
+    """
+    spec: ResourceSpec
+    files: Dict[Path, str] = field(default_factory=dict)
+    container_imports: List[str] = field(default_factory=list)
+    container_providers: List[str] = field(default_factory=list)
+    router_import: Optional[str] = None
+    router_include: Optional[str] = None
+
+def render_resource(spec: ResourceSpec) -> ResourcePlan:
+    """
+    Renderiza os arquivos do recurso sem tocar no disco.
+    """
+    resource = spec.resource
+    endpoint_path = spec.endpoint_path
+    component = spec.component
+    backend = spec.backend
+    cache = spec.cache
+    idempotent = spec.idempotent
+    bulk = spec.bulk
+    export = spec.export
+    meths = list(spec.methods)
+    fields_list = list(spec.fields)
+    index_fields = list(spec.index)
+    plan = ResourcePlan(spec=spec)
+    files = plan.files
+
+    resource_snake = snake(resource)
+    resource_pascal = pascal(resource)
+    feature_dir = APP_ROOT / "app" / "presentation" / "v1" / "endpoints" / resource_snake
+
+    adapter_class, adapter_module = {
+        "memory": (f"InMemory{resource_pascal}Adapter", f"in_memory_{resource_snake}_adapter"),
+        "sqlite": (f"Sqlite{resource_pascal}Adapter", f"sqlite_{resource_snake}_adapter"),
+        "aiosqlite": (f"AsyncSqlite{resource_pascal}Adapter", f"async_sqlite_{resource_snake}_adapter"),
+    }[backend]
+    # Backend assíncrono gera port, use cases, controller e endpoints com async/await
+    is_async = backend == "aiosqlite"
+    adef = "async def" if is_async else "def"
+    aw = "await " if is_async else ""
+    caching_factory = "init_async_caching_port" if is_async else "init_caching_port"
 
     # --- Domain (Model) ---
     if component in ["model", "full"]:
         domain_base = APP_ROOT / "app" / "domain" / resource_snake
-        print(f"DEBUG: domain_base={domain_base}")
         entities_dir = domain_base / "entities"
         ports_dir = domain_base / "ports"
-        entities_dir.mkdir(parents=True, exist_ok=True)
-        ports_dir.mkdir(parents=True, exist_ok=True)
 
         entity_code = [
             "from dataclasses import dataclass",
@@ -144,20 +422,22 @@ def scaffold(
                 py_typ = {"str":"str","int":"int","float":"float","bool":"bool"}[typ]
                 entity_code.append(f"    {name}: {py_typ}")
         entity_code.append("    id: Optional[str] = None")
-        (entities_dir / f"{resource_snake}.py").write_text("\n".join(entity_code) + "\n", encoding="utf-8")
+        files[entities_dir / f"{resource_snake}.py"] = "\n".join(entity_code) + "\n"
 
         port_code = textwrap.dedent(f"""
-        from typing import Protocol, List, Optional
+        from typing import Iterable, Protocol, List, Optional
         from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
 
         class {resource_pascal}Port(Protocol):
-            def get_all(self) -> List[{resource_pascal}]: ...
-            def get_one(self, identifier: str) -> Optional[{resource_pascal}]: ...
-            def create(self, entity: {resource_pascal}) -> {resource_pascal}: ...
-            def update(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}: ...
-            def delete(self, identifier: str) -> None: ...
+            {adef} get_all(self) -> List[{resource_pascal}]: ...
+            {adef} get_one(self, identifier: str) -> Optional[{resource_pascal}]: ...
+            {adef} create(self, entity: {resource_pascal}) -> {resource_pascal}: ...
+            {adef} update(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}: ...
+            {adef} delete(self, identifier: str) -> None: ...
         """).strip() + "\n"
-        (ports_dir / f"{resource_snake}_port.py").write_text(port_code, encoding="utf-8")
+        if bulk:
+            port_code += f"    {adef} create_many(self, entities: Iterable[{resource_pascal}]) -> List[{resource_pascal}]: ...\n"
+        files[ports_dir / f"{resource_snake}_port.py"] = port_code
 
     # --- Application (DTO, Mapper, UseCases) ---
     if component in ["usecase", "full"]:
@@ -165,9 +445,6 @@ def scaffold(
         dtos_dir = app_base / "dtos"
         mappers_dir = app_base / "mappers"
         use_cases_dir = app_base / "use_cases"
-        dtos_dir.mkdir(parents=True, exist_ok=True)
-        mappers_dir.mkdir(parents=True, exist_ok=True)
-        use_cases_dir.mkdir(parents=True, exist_ok=True)
 
         # DTO
         if fields_list:
@@ -190,7 +467,7 @@ class {resource_pascal}DTO:
             class {resource_pascal}DTO:
                 id: Optional[str] = None
             """).strip() + "\n"
-        (dtos_dir / f"{resource_snake}_dto.py").write_text(dto_code, encoding="utf-8")
+        files[dtos_dir / f"{resource_snake}_dto.py"] = dto_code
 
         # Mapper
         mapper_code = textwrap.dedent(f"""
@@ -207,7 +484,7 @@ class {resource_pascal}DTO:
             def to_domain(dto: {resource_pascal}DTO) -> {resource_pascal}:
                 return {resource_pascal}(**asdict(dto))
         """).strip() + "\n"
-        (mappers_dir / f"{resource_snake}_mapper.py").write_text(mapper_code, encoding="utf-8")
+        files[mappers_dir / f"{resource_snake}_mapper.py"] = mapper_code
 
         # UseCases (básicos conforme métodos)
         uc_templates = {}
@@ -221,8 +498,8 @@ class {resource_pascal}DTO:
                 def __init__(self, port: {resource_pascal}Port) -> None:
                     self._port = port
 
-                def execute(self) -> List[{resource_pascal}]:
-                    return self._port.get_all()
+                {adef} execute(self) -> List[{resource_pascal}]:
+                    return {aw}self._port.get_all()
             """).strip() + "\n"
             uc_templates["get"] = textwrap.dedent(f"""
             from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
@@ -233,8 +510,8 @@ class {resource_pascal}DTO:
                 def __init__(self, port: {resource_pascal}Port) -> None:
                     self._port = port
 
-                def execute(self, identifier: str) -> Optional[{resource_pascal}]:
-                    return self._port.get_one(identifier)
+                {adef} execute(self, identifier: str) -> Optional[{resource_pascal}]:
+                    return {aw}self._port.get_one(identifier)
             """).strip() + "\n"
         if "POST" in meths:
             uc_templates["create"] = textwrap.dedent(f"""
@@ -245,8 +522,8 @@ class {resource_pascal}DTO:
                 def __init__(self, port: {resource_pascal}Port) -> None:
                     self._port = port
 
-                def execute(self, entity: {resource_pascal}) -> {resource_pascal}:
-                    return self._port.create(entity)
+                {adef} execute(self, entity: {resource_pascal}) -> {resource_pascal}:
+                    return {aw}self._port.create(entity)
             """).strip() + "\n"
         if "PUT" in meths:
             uc_templates["update"] = textwrap.dedent(f"""
@@ -257,8 +534,8 @@ class {resource_pascal}DTO:
                 def __init__(self, port: {resource_pascal}Port) -> None:
                     self._port = port
 
-                def execute(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}:
-                    return self._port.update(identifier, entity)
+                {adef} execute(self, identifier: str, entity: {resource_pascal}) -> {resource_pascal}:
+                    return {aw}self._port.update(identifier, entity)
             """).strip() + "\n"
         if "DELETE" in meths:
             uc_templates["delete"] = textwrap.dedent(f"""
@@ -268,19 +545,71 @@ class {resource_pascal}DTO:
                 def __init__(self, port: {resource_pascal}Port) -> None:
                     self._port = port
 
-                def execute(self, identifier: str) -> None:
-                    self._port.delete(identifier)
+                {adef} execute(self, identifier: str) -> None:
+                    {aw}self._port.delete(identifier)
+            """).strip() + "\n"
+
+        if bulk:
+            uc_templates["bulk_create"] = textwrap.dedent(f"""
+            from typing import Iterable, List
+            from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
+            from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
+
+            class BulkCreate{resource_pascal}UseCase:
+                def __init__(self, port: {resource_pascal}Port) -> None:
+                    self._port = port
+
+                {adef} execute(self, entities: Iterable[{resource_pascal}]) -> List[{resource_pascal}]:
+                    # Um lote por chamada: o adapter grava tudo em uma transação
+                    return {aw}self._port.create_many(entities)
+            """).strip() + "\n"
+
+        if export:
+            uc_templates["export"] = textwrap.dedent(f"""
+            import csv
+            import io
+            from dataclasses import asdict, fields
+            from typing import Any, Dict, List
+            from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
+            from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
+            from app.infrastructure.shared.job_runner import JobRecord, JobRunner
+
+            def render_{resource_snake}_csv(rows: List[Dict[str, Any]]) -> str:
+                # Roda num processo filho do JobRunner: função de módulo, só dados serializáveis
+                out = io.StringIO()
+                writer = csv.DictWriter(out, fieldnames=[f.name for f in fields({resource_pascal})])
+                writer.writeheader()
+                writer.writerows(rows)
+                return out.getvalue()
+
+            class Export{resource_pascal}UseCase:
+                def __init__(self, port: {resource_pascal}Port, jobs: JobRunner) -> None:
+                    self._port = port
+                    self._jobs = jobs
+
+                {adef} execute(self) -> JobRecord:
+                    rows = [asdict(e) for e in {aw}self._port.get_all()]
+                    return self._jobs.submit(render_{resource_snake}_csv, rows, name="export_{resource_snake}")
             """).strip() + "\n"
 
         for name, code in uc_templates.items():
-            (use_cases_dir / f"{name}_{resource_snake}.py").write_text(code, encoding="utf-8")
+            files[use_cases_dir / f"{name}_{resource_snake}.py"] = code
 
-    # --- Infrastructure (Adapter stub em memória) ---
-    if component in ["adapter", "full"]:
+    # --- Infrastructure (Adapter em memória ou SQLite) ---
+    if component in ["adapter", "full"] and backend == "sqlite":
+        infra_dir = APP_ROOT / "app" / "infrastructure" / resource_snake / "adapters"
+        adapter_code = render_sqlite_adapter(resource_snake, resource_pascal, fields_list, index_fields)
+        files[infra_dir / f"{adapter_module}.py"] = adapter_code
+
+    if component in ["adapter", "full"] and backend == "aiosqlite":
+        infra_dir = APP_ROOT / "app" / "infrastructure" / resource_snake / "adapters"
+        adapter_code = render_async_sqlite_adapter(resource_snake, resource_pascal, fields_list, index_fields)
+        files[infra_dir / f"{adapter_module}.py"] = adapter_code
+
+    if component in ["adapter", "full"] and backend == "memory":
         infra_dir = APP_ROOT / "app" / "infrastructure" / resource_snake / "adapters"
-        infra_dir.mkdir(parents=True, exist_ok=True)
         adapter_code = textwrap.dedent(f"""
-        from typing import List, Optional
+        from typing import Iterable, List, Optional
         from app.domain.{resource_snake}.entities.{resource_snake} import {resource_pascal}
         from app.domain.{resource_snake}.ports.{resource_snake}_port import {resource_pascal}Port
         from app.core.config.logging import get_logger
@@ -320,14 +649,24 @@ class {resource_pascal}DTO:
                 logger.debug("InMemory{resource_pascal}Adapter.delete: %s", identifier)
                 self._items = [x for x in self._items if getattr(x, "id", None) != identifier]
         """).strip() + "\n"
-        (infra_dir / f"in_memory_{resource_snake}_adapter.py").write_text(adapter_code, encoding="utf-8")
+        if bulk:
+            adapter_code += textwrap.indent(textwrap.dedent(f"""
+            def create_many(self, entities: Iterable[{resource_pascal}]) -> List[{resource_pascal}]:
+                items = list(entities)
+                logger.debug("InMemory{resource_pascal}Adapter.create_many: %d", len(items))
+                for entity in items:
+                    entity.id = str(self._next_id)
+                    self._next_id += 1
+                self._items.extend(items)
+                return items
+            """), "    ")
+        files[infra_dir / f"in_memory_{resource_snake}_adapter.py"] = adapter_code
 
     # --- Presentation (Schemas, Controller e Endpoints) ---
     if component in ["endpoints", "full"]:
         schemas_dir = APP_ROOT / "app" / "presentation" / "v1" / "schemas"
         controller_path = feature_dir / "controller.py"
         endpoints_path = feature_dir / "endpoints.py"
-        feature_dir.mkdir(parents=True, exist_ok=True)
 
         # Schemas
         req_schema_name = f"{resource_pascal}Request"
@@ -353,8 +692,8 @@ from typing import Optional
 class {res_schema_name}(BaseModel):
 {res_fields}
 """
-        (schemas_dir / f"{resource_snake}_request.py").write_text(req_schema_code.strip() + "\n", encoding="utf-8")
-        (schemas_dir / f"{resource_snake}_response.py").write_text(res_schema_code.strip() + "\n", encoding="utf-8")
+        files[schemas_dir / f"{resource_snake}_request.py"] = req_schema_code.strip() + "\n"
+        files[schemas_dir / f"{resource_snake}_response.py"] = res_schema_code.strip() + "\n"
 
         # Controller
         controller_code = f"""
@@ -370,46 +709,69 @@ from app.application.{resource_snake}.dtos.{resource_snake}_dto import {resource
 {"from app.application.%s.use_cases.create_%s import Create%sUseCase" % (resource_snake, resource_snake, resource_pascal) if "POST" in meths else ""}
 {"from app.application.%s.use_cases.update_%s import Update%sUseCase" % (resource_snake, resource_snake, resource_pascal) if "PUT" in meths else ""}
 {"from app.application.%s.use_cases.delete_%s import Delete%sUseCase" % (resource_snake, resource_snake, resource_pascal) if "DELETE" in meths else ""}
+{"from app.application.%s.use_cases.bulk_create_%s import BulkCreate%sUseCase" % (resource_snake, resource_snake, resource_pascal) if bulk else ""}
+{"from app.application.%s.use_cases.export_%s import Export%sUseCase" % (resource_snake, resource_snake, resource_pascal) if export else ""}
+{"from fastapi import Request" if bulk or export else ""}
+{"from starlette.concurrency import run_in_threadpool" if bulk and not is_async else ""}
+{"from app.presentation.shared.bulk import BulkResult, iter_bulk_chunks" if bulk else ""}
+{"from app.presentation.shared.negotiation import NegotiatedResponse" if export else ""}
+{"from app.presentation.v1.endpoints.jobs.controller import JobsController" if export else ""}
 
 class {resource_pascal}Controller:
-    def __init__(self{", list_uc: List%sUseCase" % resource_pascal if "GET" in meths else ""}{", get_uc: Get%sUseCase" % resource_pascal if "GET" in meths else ""}{", create_uc: Create%sUseCase" % resource_pascal if "POST" in meths else ""}{", update_uc: Update%sUseCase" % resource_pascal if "PUT" in meths else ""}{", delete_uc: Delete%sUseCase" % resource_pascal if "DELETE" in meths else ""}) -> None:
+    def __init__(self{", list_uc: List%sUseCase" % resource_pascal if "GET" in meths else ""}{", get_uc: Get%sUseCase" % resource_pascal if "GET" in meths else ""}{", create_uc: Create%sUseCase" % resource_pascal if "POST" in meths else ""}{", update_uc: Update%sUseCase" % resource_pascal if "PUT" in meths else ""}{", delete_uc: Delete%sUseCase" % resource_pascal if "DELETE" in meths else ""}{", bulk_create_uc: BulkCreate%sUseCase" % resource_pascal if bulk else ""}{", export_uc: Export%sUseCase" % resource_pascal if export else ""}) -> None:
 {"        self._list_uc = list_uc" if "GET" in meths else ""}
 {"        self._get_uc = get_uc" if "GET" in meths else ""}
 {"        self._create_uc = create_uc" if "POST" in meths else ""}
 {"        self._update_uc = update_uc" if "PUT" in meths else ""}
 {"        self._delete_uc = delete_uc" if "DELETE" in meths else ""}
+{"        self._bulk_create_uc = bulk_create_uc" if bulk else ""}
+{"        self._export_uc = export_uc" if export else ""}
 
-{"    def list(self) -> HttpResponse[list[%s]]:" % res_schema_name if "GET" in meths else ""}
-{"        entities = self._list_uc.execute()" if "GET" in meths else ""}
+{"    %s list(self) -> HttpResponse[list[%s]]:" % (adef, res_schema_name) if "GET" in meths else ""}
+{"        entities = %sself._list_uc.execute()" % aw if "GET" in meths else ""}
 {"        dtos = [ %sMapper.to_dto(e) for e in entities ]" % resource_pascal if "GET" in meths else ""}
 {"        data = [ %s(**asdict(d)) for d in dtos ]" % res_schema_name if "GET" in meths else ""}
 {"        return HttpResponse[list[%s]](success=True, data=data)" % res_schema_name if "GET" in meths else ""}
 
-{"    def get(self, identifier: str) -> HttpResponse[%s]:" % res_schema_name if "GET" in meths else ""}
-{"        entity = self._get_uc.execute(identifier)" if "GET" in meths else ""}
+{"    %s get(self, identifier: str) -> HttpResponse[%s]:" % (adef, res_schema_name) if "GET" in meths else ""}
+{"        entity = %sself._get_uc.execute(identifier)" % aw if "GET" in meths else ""}
 {"        dto = %sMapper.to_dto(entity) if entity else None" % resource_pascal if "GET" in meths else ""}
 {"        data = %s(**asdict(dto)) if dto else None" % res_schema_name if "GET" in meths else ""}
 {"        return HttpResponse[%s](success=True, data=data)" % res_schema_name if "GET" in meths else ""}
 
-{"    def create(self, req: %s) -> HttpResponse[%s]:" % (req_schema_name, res_schema_name) if "POST" in meths else ""}
+{"    %s create(self, req: %s) -> HttpResponse[%s]:" % (adef, req_schema_name, res_schema_name) if "POST" in meths else ""}
 {"        dto = %sDTO(id=None, **req.model_dump())" % resource_pascal if "POST" in meths else ""}
 {"        entity = %sMapper.to_domain(dto)" % resource_pascal if "POST" in meths else ""}
-{"        created = self._create_uc.execute(entity)" if "POST" in meths else ""}
+{"        created = %sself._create_uc.execute(entity)" % aw if "POST" in meths else ""}
 {"        out = %sMapper.to_dto(created)" % resource_pascal if "POST" in meths else ""}
 {"        return HttpResponse[%s](success=True, data=%s(**asdict(out)))" % (res_schema_name, res_schema_name) if "POST" in meths else ""}
 
-{"    def update(self, identifier: str, req: %s) -> HttpResponse[%s]:" % (req_schema_name, res_schema_name) if "PUT" in meths else ""}
+{"    %s update(self, identifier: str, req: %s) -> HttpResponse[%s]:" % (adef, req_schema_name, res_schema_name) if "PUT" in meths else ""}
 {"        dto = %sDTO(**req.model_dump())" % resource_pascal if "PUT" in meths else ""}
 {"        entity = %sMapper.to_domain(dto)" % resource_pascal if "PUT" in meths else ""}
-{"        updated = self._update_uc.execute(identifier, entity)" if "PUT" in meths else ""}
+{"        updated = %sself._update_uc.execute(identifier, entity)" % aw if "PUT" in meths else ""}
 {"        out = %sMapper.to_dto(updated)" % resource_pascal if "PUT" in meths else ""}
 {"        return HttpResponse[%s](success=True, data=%s(**asdict(out)))" % (res_schema_name, res_schema_name) if "PUT" in meths else ""}
 
-{"    def delete(self, identifier: str) -> HttpResponse[None]:" if "DELETE" in meths else ""}
-{"        self._delete_uc.execute(identifier)" if "DELETE" in meths else ""}
+{"    %s delete(self, identifier: str) -> HttpResponse[None]:" % adef if "DELETE" in meths else ""}
+{"        %sself._delete_uc.execute(identifier)" % aw if "DELETE" in meths else ""}
 {"        return HttpResponse[None](success=True, data=None)" if "DELETE" in meths else ""}
+
+{"    async def bulk_create(self, request: Request) -> HttpResponse[BulkResult]:" if bulk else ""}
+{"        # Corpo consumido em lotes de settings.bulk_chunk_size: memória constante" if bulk else ""}
+{"        result = BulkResult()" if bulk else ""}
+{"        async for chunk in iter_bulk_chunks(request, %s, result):" % req_schema_name if bulk else ""}
+{"            entities = [ %sMapper.to_domain(%sDTO(id=None, **req.model_dump())) for req in chunk ]" % (resource_pascal, resource_pascal) if bulk else ""}
+{"            created = %s" % ("await self._bulk_create_uc.execute(entities)" if is_async else "await run_in_threadpool(self._bulk_create_uc.execute, entities)") if bulk else ""}
+{"            result.created += len(created)" if bulk else ""}
+{"        return HttpResponse[BulkResult](success=True, data=result)" if bulk else ""}
+
+{"    %s export(self, request: Request) -> NegotiatedResponse:" % adef if export else ""}
+{"        # Modo assíncrono: 202 + Location; o CSV sai em GET /jobs/{id} quando pronto" if export else ""}
+{"        record = %sself._export_uc.execute()" % aw if export else ""}
+{"        return JobsController.accepted(request, record)" if export else ""}
 """
-        controller_path.write_text(controller_code.strip() + "\n", encoding="utf-8")
+        files[controller_path] = controller_code.strip() + "\n"
 
         # Endpoints
         import textwrap as _tw
@@ -421,7 +783,15 @@ class {resource_pascal}Controller:
             f"from app.presentation.v1.schemas.{resource_snake}_request import {req_schema_name}",
             f"from app.presentation.v1.endpoints.{resource_snake}.controller import {resource_pascal}Controller",
             "from app.core.di.container import Container",
+            "from app.core.profiling.timings import phase",
+            "from app.presentation.shared.routing import AppRoute",
         ]
+        if idempotent and ("POST" in meths or "PUT" in meths):
+            endpoints_imports.append("from app.presentation.shared.idempotency import idempotent")
+        if bulk:
+            endpoints_imports.append("from app.presentation.shared.bulk import BulkResult, bulk_openapi_extra")
+        if export:
+            endpoints_imports.append("from app.presentation.v1.schemas.job_response import JobResponse")
         if "GET" in meths:
             endpoints_imports.append(f"from app.application.{resource_snake}.use_cases.list_{resource_snake} import List{resource_pascal}UseCase")
             endpoints_imports.append(f"from app.application.{resource_snake}.use_cases.get_{resource_snake} import Get{resource_pascal}UseCase")
@@ -432,103 +802,153 @@ class {resource_pascal}Controller:
         if "DELETE" in meths:
             endpoints_imports.append(f"from app.application.{resource_snake}.use_cases.delete_{resource_snake} import Delete{resource_pascal}UseCase")
 
-        endpoints_header = "\n".join(endpoints_imports) + "\n\nrouter = APIRouter(tags=[\"" + resource_snake + "\"])\n"
+        # Rotas de escrita opcionalmente idempotentes (header Idempotency-Key)
+        idem = "\n            @idempotent" if idempotent else ""
+        extra_uc_args = f",\n                    bulk_create_uc={aw}container.{resource_snake}_bulk_create_uc()" if bulk else ""
+        if export:
+            extra_uc_args += f",\n                    export_uc={aw}container.{resource_snake}_export_uc()"
+        endpoints_header = "\n".join(endpoints_imports) + "\n\nrouter = APIRouter(tags=[\"" + resource_snake + "\"], route_class=AppRoute)\n"
         body = []
 
         if "GET" in meths:
             body.append(_tw.dedent(f"""
             @router.get("{endpoint_path}", response_model=HttpResponse[list[{res_schema_name}]], status_code=200, summary="List {resource_snake}")
-            def list_{resource_snake}(request: Request):
+            {adef} list_{resource_snake}(request: Request):
                 container: Container = request.app.state.container
                 controller = {resource_pascal}Controller(
-                    list_uc=container.{resource_snake}_list_uc(),
-                    get_uc=container.{resource_snake}_get_uc(),
-                    create_uc=container.{resource_snake}_create_uc(),
-                    update_uc=container.{resource_snake}_update_uc(),
-                    delete_uc=container.{resource_snake}_delete_uc()
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
                 )
-                return controller.list()
+                with phase("controller"):
+                    return {aw}controller.list()
             """).strip())
 
             body.append(_tw.dedent(f"""
             @router.get("{endpoint_path}" + "/{{identifier}}", response_model=HttpResponse[{res_schema_name}], status_code=200, summary="Get {resource_snake}")
-            def get_{resource_snake}(
+            {adef} get_{resource_snake}(
                 request: Request,
                 identifier: str = Path(..., description="ID do recurso"),
             ):
                 container: Container = request.app.state.container
                 controller = {resource_pascal}Controller(
-                    list_uc=container.{resource_snake}_list_uc(),
-                    get_uc=container.{resource_snake}_get_uc(),
-                    create_uc=container.{resource_snake}_create_uc(),
-                    update_uc=container.{resource_snake}_update_uc(),
-                    delete_uc=container.{resource_snake}_delete_uc()
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
                 )
-                return controller.get(identifier)
+                with phase("controller"):
+                    return {aw}controller.get(identifier)
             """).strip())
 
         if "POST" in meths:
             body.append(_tw.dedent(f"""
-            @router.post("{endpoint_path}", response_model=HttpResponse[{res_schema_name}], status_code=201, summary="Create {resource_snake}")
-            def create_{resource_snake}(
+            @router.post("{endpoint_path}", response_model=HttpResponse[{res_schema_name}], status_code=201, summary="Create {resource_snake}"){idem}
+            {adef} create_{resource_snake}(
                 request: Request,
                 req: {req_schema_name},
             ):
                 container: Container = request.app.state.container
                 controller = {resource_pascal}Controller(
-                    list_uc=container.{resource_snake}_list_uc(),
-                    get_uc=container.{resource_snake}_get_uc(),
-                    create_uc=container.{resource_snake}_create_uc(),
-                    update_uc=container.{resource_snake}_update_uc(),
-                    delete_uc=container.{resource_snake}_delete_uc()
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
+                )
+                with phase("controller"):
+                    return {aw}controller.create(req)
+            """).strip())
+
+        if bulk:
+            # Corpo lido em streaming pelo controller (array JSON ou NDJSON), sem modelo no parâmetro
+            body.append(_tw.dedent(f"""
+            @router.post("{endpoint_path}/bulk", response_model=HttpResponse[BulkResult], status_code=200, summary="Bulk create {resource_snake}", openapi_extra=bulk_openapi_extra({req_schema_name}))
+            async def bulk_create_{resource_snake}(request: Request):
+                container: Container = request.app.state.container
+                controller = {resource_pascal}Controller(
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
+                )
+                with phase("controller"):
+                    return await controller.bulk_create(request)
+            """).strip())
+
+        if export:
+            # Exportação CSV no pool de processos; status e resultado em GET /jobs/{id}
+            body.append(_tw.dedent(f"""
+            @router.post("{endpoint_path}/export", response_model=HttpResponse[JobResponse], status_code=202, summary="Export {resource_snake} (job assíncrono)")
+            {adef} export_{resource_snake}(request: Request):
+                container: Container = request.app.state.container
+                controller = {resource_pascal}Controller(
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
                 )
-                return controller.create(req)
+                with phase("controller"):
+                    return {aw}controller.export(request)
             """).strip())
 
         if "PUT" in meths:
             body.append(_tw.dedent(f"""
-            @router.put("{endpoint_path}" + "/{{identifier}}", response_model=HttpResponse[{res_schema_name}], status_code=200, summary="Update {resource_snake}")
-            def update_{resource_snake}(
+            @router.put("{endpoint_path}" + "/{{identifier}}", response_model=HttpResponse[{res_schema_name}], status_code=200, summary="Update {resource_snake}"){idem}
+            {adef} update_{resource_snake}(
                 request: Request,
                 req: {req_schema_name},
                 identifier: str = Path(..., description="ID do recurso"),
             ):
                 container: Container = request.app.state.container
                 controller = {resource_pascal}Controller(
-                    list_uc=container.{resource_snake}_list_uc(),
-                    get_uc=container.{resource_snake}_get_uc(),
-                    create_uc=container.{resource_snake}_create_uc(),
-                    update_uc=container.{resource_snake}_update_uc(),
-                    delete_uc=container.{resource_snake}_delete_uc()
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
                 )
-                return controller.update(identifier, req)
+                with phase("controller"):
+                    return {aw}controller.update(identifier, req)
             """).strip())
 
         if "DELETE" in meths:
             body.append(_tw.dedent(f"""
             @router.delete("{endpoint_path}" + "/{{identifier}}", status_code=204, summary="Delete {resource_snake}")
-            def delete_{resource_snake}(
+            {adef} delete_{resource_snake}(
                 request: Request,
                 identifier: str = Path(..., description="ID do recurso"),
             ):
                 container: Container = request.app.state.container
                 controller = {resource_pascal}Controller(
-                    list_uc=container.{resource_snake}_list_uc(),
-                    get_uc=container.{resource_snake}_get_uc(),
-                    create_uc=container.{resource_snake}_create_uc(),
-                    update_uc=container.{resource_snake}_update_uc(),
-                    delete_uc=container.{resource_snake}_delete_uc()
+                    list_uc={aw}container.{resource_snake}_list_uc(),
+                    get_uc={aw}container.{resource_snake}_get_uc(),
+                    create_uc={aw}container.{resource_snake}_create_uc(),
+                    update_uc={aw}container.{resource_snake}_update_uc(),
+                    delete_uc={aw}container.{resource_snake}_delete_uc(){extra_uc_args}
                 )
-                return controller.delete(identifier)
+                with phase("controller"):
+                    return {aw}controller.delete(identifier)
             """).strip())
 
-        endpoints_path.write_text((endpoints_header + "\n\n".join(body) + "\n"), encoding="utf-8")
-
-        # --- DI Container wiring ---
-        container_path = APP_ROOT / "app" / "core" / "di" / "container.py"
-
-        import_lines = []
-        import_lines.append(f"from app.infrastructure.{resource_snake}.adapters.in_memory_{resource_snake}_adapter import InMemory{resource_pascal}Adapter")
+        files[endpoints_path] = endpoints_header + "\n\n".join(body) + "\n"
+
+        # --- DI Container wiring (aplicado via AST em apply_plans) ---
+        import_lines = plan.container_imports
+        if backend == "sqlite":
+            import_lines.append("from app.core.config.settings import settings")
+            import_lines.append("from app.infrastructure.shared.sqlite_pool import init_sqlite_pool")
+        if backend == "aiosqlite":
+            import_lines.append("from app.core.config.settings import settings")
+            import_lines.append("from app.infrastructure.shared.async_sqlite_pool import init_async_sqlite_pool")
+        import_lines.append(f"from app.infrastructure.{resource_snake}.adapters.{adapter_module} import {adapter_class}")
+        if cache:
+            import_lines.append(f"from app.infrastructure.shared.caching_port import {caching_factory}")
         if "GET" in meths:
             import_lines.append(f"from app.application.{resource_snake}.use_cases.list_{resource_snake} import List{resource_pascal}UseCase")
             import_lines.append(f"from app.application.{resource_snake}.use_cases.get_{resource_snake} import Get{resource_pascal}UseCase")
@@ -538,11 +958,34 @@ class {resource_pascal}Controller:
             import_lines.append(f"from app.application.{resource_snake}.use_cases.update_{resource_snake} import Update{resource_pascal}UseCase")
         if "DELETE" in meths:
             import_lines.append(f"from app.application.{resource_snake}.use_cases.delete_{resource_snake} import Delete{resource_pascal}UseCase")
-        import_block = "\n".join(import_lines)
-
-        provider_lines = []
+        if bulk:
+            import_lines.append(f"from app.application.{resource_snake}.use_cases.bulk_create_{resource_snake} import BulkCreate{resource_pascal}UseCase")
+        if export:
+            import_lines.append(f"from app.application.{resource_snake}.use_cases.export_{resource_snake} import Export{resource_pascal}UseCase")
+
+        provider_lines = plan.container_providers
+        if backend == "sqlite":
+            provider_lines.append("    # Pool SQLite compartilhado (uma conexão por thread/worker)")
+            provider_lines.append("    sqlite_pool = providers.Resource(init_sqlite_pool, path=settings.sqlite_path, cached_statements=settings.sqlite_cached_statements)")
+        if backend == "aiosqlite":
+            provider_lines.append("    # Pool aiosqlite limitado (aguardado no lifespan; 503 quando saturado)")
+            provider_lines.append(
+                "    async_sqlite_pool = providers.Resource(init_async_sqlite_pool, path=settings.sqlite_path, "
+                "max_size=settings.sqlite_async_pool_size, acquire_timeout=settings.sqlite_async_acquire_timeout, "
+                "max_waiting=settings.sqlite_async_max_waiting, retry_after=settings.pool_retry_after_seconds, "
+                "cached_statements=settings.sqlite_cached_statements)"
+            )
         provider_lines.append(f"    # {resource_pascal} providers")
-        provider_lines.append(f"    {resource_snake}_adapter = providers.Singleton(InMemory{resource_pascal}Adapter)")
+        if backend == "sqlite":
+            adapter_provider = f"providers.Singleton({adapter_class}, pool=sqlite_pool)"
+        elif backend == "aiosqlite":
+            adapter_provider = f"providers.Singleton({adapter_class}, pool=async_sqlite_pool)"
+        else:
+            adapter_provider = f"providers.Singleton({adapter_class})"
+        if cache:
+            # Decorator read-through entre use cases e adapter; Resource para o shutdown fechar o mmap
+            adapter_provider = f'providers.Resource({caching_factory}, inner={adapter_provider}, namespace="{resource_snake}")'
+        provider_lines.append(f"    {resource_snake}_adapter = {adapter_provider}")
         if "GET" in meths:
             provider_lines.append(f"    {resource_snake}_list_uc = providers.Singleton(List{resource_pascal}UseCase, port={resource_snake}_adapter)")
             provider_lines.append(f"    {resource_snake}_get_uc = providers.Singleton(Get{resource_pascal}UseCase, port={resource_snake}_adapter)")
@@ -552,35 +995,334 @@ class {resource_pascal}Controller:
             provider_lines.append(f"    {resource_snake}_update_uc = providers.Singleton(Update{resource_pascal}UseCase, port={resource_snake}_adapter)")
         if "DELETE" in meths:
             provider_lines.append(f"    {resource_snake}_delete_uc = providers.Singleton(Delete{resource_pascal}UseCase, port={resource_snake}_adapter)")
-        providers_block = "\n".join(provider_lines)
+        if bulk:
+            provider_lines.append(f"    {resource_snake}_bulk_create_uc = providers.Singleton(BulkCreate{resource_pascal}UseCase, port={resource_snake}_adapter)")
+        if export:
+            provider_lines.append(f"    {resource_snake}_export_uc = providers.Singleton(Export{resource_pascal}UseCase, port={resource_snake}_adapter, jobs=job_runner)")
 
-        insert_in_container(container_path, f"InMemory{resource_pascal}Adapter", import_block, providers_block)
+        # --- API Router registration (aplicado via AST em apply_plans) ---
+        plan.router_import = f"from app.presentation.v1.endpoints.{resource_snake}.endpoints import router as {resource_snake}_router"
+        plan.router_include = f"api_router.include_router({resource_snake}_router)"
 
-        # --- API Router registration ---
-        api_router_path = APP_ROOT / "app" / "presentation" / "v1" / "api.py"
-        api_text = api_router_path.read_text(encoding="utf-8")
+    return plan
 
-        import_router_line = f"from app.presentation.v1.endpoints.{resource_snake}.endpoints import router as {resource_snake}_router"
-        if import_router_line not in api_text:
-            api_text = import_router_line + "\n" + api_text
-
-        include_line = f"api_router.include_router({resource_snake}_router)"
-        if include_line not in api_text:
-            if "api_router = APIRouter(" not in api_text:
-                api_text = "from fastapi import APIRouter\n\napi_router = APIRouter(prefix=\"/api/v1\")\n" + api_text
-            api_text += f"\n{include_line}\n"
-
-        api_router_path.write_text(api_text, encoding="utf-8")
+def update_container_source(text: str, import_lines: List[str], provider_lines: List[str]) -> str:
+    """
+    Insere imports e providers no módulo do Container guiado pela AST: imports
+    já presentes são ignorados, providers já existentes só são reescritos se a
+    definição mudou. Rodar duas vezes com a mesma entrada não altera o arquivo.
+    """
+    tree = ast.parse(text)
+    lines = text.split("\n")
+    container = next(
+        (n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == "Container"), None
+    )
+    if container is None:
+        raise typer.BadParameter("Classe Container não encontrada em container.py")
+
+    imported = {_import_key(n) for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))}
+    new_imports: List[str] = []
+    for line in import_lines:
+        key = _import_key(ast.parse(line).body[0])
+        if key not in imported:
+            imported.add(key)
+            new_imports.append(line)
+
+    existing = {
+        target.id: node
+        for node in container.body if isinstance(node, ast.Assign)
+        for target in node.targets if isinstance(target, ast.Name)
+    }
+    replacements: Dict[int, Tuple[int, str]] = {}
+    new_providers: List[str] = []
+    pending_comments: List[str] = []
+    for line in provider_lines:
+        if line.strip().startswith("#"):
+            pending_comments.append(line)
+            continue
+        node = ast.parse(line.strip()).body[0]
+        name = node.targets[0].id
+        current = existing.get(name)
+        if current is None:
+            new_providers.extend(pending_comments)
+            new_providers.append(line)
+            existing[name] = node
+        elif isinstance(current, ast.Assign) and current.lineno and ast.dump(current.value) != ast.dump(node.value):
+            replacements[current.lineno - 1] = (current.end_lineno, line)
+        pending_comments = []
+
+    # Edições de baixo para cima para não deslocar as linhas ainda não editadas
+    if new_providers:
+        lines[container.end_lineno:container.end_lineno] = new_providers
+    for start in sorted(replacements, reverse=True):
+        end, line = replacements[start]
+        lines[start:end] = [line]
+    if new_imports:
+        imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+        at = imports[-1].end_lineno if imports else 0
+        lines[at:at] = new_imports
+    return "\n".join(lines)
+
+def update_router_source(text: str, entries: List[Tuple[str, str]]) -> str:
+    """
+    Registra routers no `api_router` guiado pela AST (import + include_router),
+    sem duplicar entradas já presentes.
+    """
+    if "api_router = APIRouter(" not in text:
+        text = "from fastapi import APIRouter\n\napi_router = APIRouter(prefix=\"/api/v1\")\n" + text
+    tree = ast.parse(text)
+    lines = text.split("\n")
+
+    imported = {_import_key(n) for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))}
+    included = set()
+    last_include = None
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "include_router"
+        ):
+            included.add(ast.dump(node.value))
+            last_include = node
+        elif last_include is None and isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "api_router" for t in node.targets
+        ):
+            last_include = node
+
+    new_imports: List[str] = []
+    new_includes: List[str] = []
+    for import_line, include_line in entries:
+        key = _import_key(ast.parse(import_line).body[0])
+        if key not in imported:
+            imported.add(key)
+            new_imports.append(import_line)
+        call = ast.dump(ast.parse(include_line).body[0].value)
+        if call not in included:
+            included.add(call)
+            new_includes.append(include_line)
+
+    at = last_include.end_lineno if last_include is not None else len(lines)
+    lines[at:at] = new_includes
+    imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    at = imports[-1].end_lineno if imports else 0
+    lines[at:at] = new_imports
+    return "\n".join(lines)
+
+def _import_key(node: ast.stmt) -> Tuple:
+    if isinstance(node, ast.ImportFrom):
+        return (node.module, tuple((a.name, a.asname) for a in node.names))
+    return (None, tuple((a.name, a.asname) for a in node.names))
+
+MANIFEST_NAME = ".cocli-manifest.json"
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+def apply_plans(plans: List[ResourcePlan], root: Path = APP_ROOT, workers: int = 8) -> Tuple[List[str], List[str]]:
+    """
+    Aplica os planos no disco: edita container/router uma única vez para todos
+    os recursos e grava os arquivos em paralelo, pulando os que não mudaram.
+    O manifesto guarda sha256/tamanho/mtime de cada arquivo gerado; se o stat
+    bate, o arquivo nem é lido. Retorna (gravados, inalterados).
+    """
+    files: Dict[Path, str] = {}
+    for plan in plans:
+        files.update(plan.files)
+
+    import_lines = [l for plan in plans for l in plan.container_imports]
+    provider_lines = [l for plan in plans for l in plan.container_providers]
+    if provider_lines:
+        container_path = root / "app" / "core" / "di" / "container.py"
+        text = files.get(container_path) or container_path.read_text(encoding="utf-8")
+        files[container_path] = update_container_source(text, import_lines, provider_lines)
+
+    routers = [(plan.router_import, plan.router_include) for plan in plans if plan.router_import]
+    if routers:
+        api_router_path = root / "app" / "presentation" / "v1" / "api.py"
+        text = files.get(api_router_path) or api_router_path.read_text(encoding="utf-8")
+        files[api_router_path] = update_router_source(text, routers)
+
+    manifest_path = root / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    def write(item: Tuple[Path, str]) -> Tuple[str, dict, bool]:
+        path, content = item
+        rel = path.relative_to(root).as_posix()
+        data = content.encode("utf-8")
+        digest = _digest(data)
+        entry = manifest.get(rel)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+        if st is not None and entry == {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}:
+            return rel, entry, False
+        changed = st is None or st.st_size != len(data) or _digest(path.read_bytes()) != digest
+        if changed:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            st = path.stat()
+        return rel, {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}, changed
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(write, files.items()))
+
+    written = [rel for rel, _, changed in results if changed]
+    unchanged = [rel for rel, _, changed in results if not changed]
+    updated = {rel: entry for rel, entry, _ in results}
+    if any(manifest.get(rel) != entry for rel, entry in updated.items()):
+        manifest.update(updated)
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return written, unchanged
+
+def load_spec(path: Path) -> List[ResourceSpec]:
+    """
+    Lê o spec (YAML ou JSON) e valida cada recurso com as mesmas regras da
+    linha de comando. Valores de `defaults` valem para todos os recursos.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        data = json.loads(text)
+    else:
+        import yaml
+
+        data = yaml.safe_load(text)
+    if not isinstance(data, dict) or not isinstance(data.get("resources"), list):
+        raise typer.BadParameter("Spec inválido: esperado um mapa com a lista 'resources'.")
+
+    defaults = data.get("defaults") or {}
+    specs: List[ResourceSpec] = []
+    for entry in data["resources"]:
+        item = {**defaults, **entry}
+        if "resource" not in item or "path" not in item:
+            raise typer.BadParameter(f"Recurso sem 'resource'/'path' no spec: {entry}")
+        fields = item.get("fields", "")
+        if isinstance(fields, dict):
+            fields = ",".join(f"{name}:{typ}" for name, typ in fields.items())
+        specs.append(build_spec(
+            resource=str(item["resource"]),
+            endpoint_path=str(item["path"]),
+            methods=_csv(item.get("methods", "GET,POST,PUT,DELETE")),
+            fields=_csv(fields),
+            component=item.get("component", "full"),
+            backend=item.get("backend", "memory"),
+            index=_csv(item.get("index", "")),
+            cache=bool(item.get("cache", False)),
+            idempotent=bool(item.get("idempotent", False)),
+            bulk=bool(item.get("bulk", False)),
+            export=bool(item.get("export", False)),
+        ))
+    names = [s.resource for s in specs]
+    duplicated = sorted({n for n in names if names.count(n) > 1})
+    if duplicated:
+        raise typer.BadParameter(f"Recursos duplicados no spec: {', '.join(duplicated)}")
+    return specs
+
+def _csv(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(v) for v in value)
+    return str(value or "")
 
+@app.callback(invoke_without_command=True)
+def scaffold(
+    ctx: typer.Context,
+    resource: Optional[str] = typer.Option(None, "--resource", "-r", help="Nome lógico do recurso (ex.: book)"),
+    endpoint_path: Optional[str] = typer.Option(None, "--path", "-p", help="Caminho do endpoint (ex.: /books)"),
+    methods: str = typer.Option("GET,POST,PUT,DELETE", "--methods", "-m", help="Lista separada por vírgulas"),
+    fields: str = typer.Option("", "--fields", "-f", help="Campos nome:tipo"),
+    component: str = typer.Option("full", "--component", "-c", help="Componente a gerar: model, usecase, endpoints, adapter, full"),
+    backend: str = typer.Option("memory", "--backend", "-b", help="Backend do adapter: memory, sqlite, aiosqlite"),
+    index: str = typer.Option("", "--index", "-i", help="Campos indexados (backends sqlite/aiosqlite), separados por vírgula"),
+    cache: bool = typer.Option(False, "--cache", help="Envolve o adapter no CachingPort (LRU + TTL, invalidação na escrita)"),
+    idempotent: bool = typer.Option(False, "--idempotent", help="POST/PUT aceitam Idempotency-Key (respostas repetidas vêm do store)"),
+    bulk: bool = typer.Option(False, "--bulk", help="Gera POST <path>/bulk (array JSON ou NDJSON em streaming, gravado em lotes)"),
+    export: bool = typer.Option(False, "--export", help="Gera POST <path>/export (CSV num job assíncrono: 202 + status em /jobs/{id})"),
+):
+    """
+    Gera estrutura mínima para novo recurso seguindo a arquitetura do projeto:
+    - Domain: entidade e (opcional) port
+    - Application: DTO, Mapper, UseCases básicos
+    - Infrastructure: Adapter stub
+    - Presentation: Schemas, Controller e Endpoints
+    - DI: registra providers no container
+    - API Router: inclui o router novo
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+    if not resource or not endpoint_path:
+        raise typer.BadParameter("Informe --resource e --path (ou use `cocli apply spec.yaml`).")
+
+    spec = build_spec(resource, endpoint_path, methods, fields, component, backend, index, cache, idempotent, bulk, export)
+    plan = render_resource(spec)
+    written, unchanged = apply_plans([plan])
+
+    resource_snake = spec.resource
+    adapter_class = {
+        "memory": f"InMemory{pascal(resource_snake)}Adapter",
+        "sqlite": f"Sqlite{pascal(resource_snake)}Adapter",
+        "aiosqlite": f"AsyncSqlite{pascal(resource_snake)}Adapter",
+    }[backend]
     typer.secho(f"Recurso '{resource_snake}' gerado com sucesso!", fg=typer.colors.GREEN)
     typer.echo(f"- Endpoint base: {endpoint_path}")
-    typer.echo(f"- Métodos: {', '.join(meths)}")
+    typer.echo(f"- Métodos: {', '.join(spec.methods)}")
     typer.echo(f"- Entidade: app/domain/{resource_snake}/entities/{resource_snake}.py")
+    typer.echo(f"- Adapter: {adapter_class} (backend {backend}{', com cache' if cache else ''})")
     typer.echo(f"- Controller & Endpoints: app/presentation/v1/endpoints/{resource_snake}/")
     typer.echo(f"- DI: app/core/di/container.py atualizado")
     typer.echo(f"- Router: app/presentation/v1/api.py atualizado")
+    typer.echo(f"- Arquivos: {len(written)} gravados, {len(unchanged)} inalterados")
     typer.echo("Dica: rode a API e teste o novo endpoint.")
 
+@app.command("apply")
+def apply(
+    spec_file: Path = typer.Argument(..., exists=True, dir_okay=False, help="Spec YAML/JSON com a lista de recursos"),
+    workers: int = typer.Option(8, "--workers", "-w", help="Threads de escrita"),
+):
+    """
+    Gera vários recursos de uma vez a partir de um spec. Incremental: só grava
+    arquivos cujo conteúdo mudou; container e router são editados via AST.
+    """
+    started = time.perf_counter()
+    specs = load_spec(spec_file)
+    plans = [render_resource(spec) for spec in specs]
+    written, unchanged = apply_plans(plans, workers=workers)
+    elapsed = time.perf_counter() - started
+
+    typer.secho(f"{len(specs)} recursos aplicados em {elapsed:.2f}s", fg=typer.colors.GREEN)
+    typer.echo(f"- Arquivos gravados: {len(written)}")
+    typer.echo(f"- Arquivos inalterados: {len(unchanged)}")
+    for rel in written:
+        typer.echo(f"  + {rel}")
+
+@app.command("openapi")
+def openapi(
+    output: Path = typer.Argument(Path("openapi.json"), dir_okay=False, help="Arquivo de saída"),
+    no_gzip: bool = typer.Option(False, "--no-gzip", help="Não grava a cópia <saída>.gz"),
+):
+    """
+    Grava o schema OpenAPI do app (msgpack incluído) no build. Apontando
+    OPENAPI_FILE para o arquivo, o app serve esses bytes sem montar o schema.
+    """
+    import gzip
+    import sys
+
+    sys.path.insert(0, str(APP_ROOT))
+    from app.main import app as api
+    from app.presentation.shared.openapi import serialize_openapi
+
+    body = serialize_openapi(api)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(body)
+    typer.secho(f"Schema OpenAPI gravado em {output} ({len(body)} bytes)", fg=typer.colors.GREEN)
+    if not no_gzip:
+        gz_path = output.with_name(output.name + ".gz")
+        gz_path.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+        typer.echo(f"- {gz_path} ({gz_path.stat().st_size} bytes)")
+
 
 if __name__ == "__main__":
     app()